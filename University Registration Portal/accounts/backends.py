@@ -0,0 +1,77 @@
+"""
+One authentication backend for every login form.
+
+The identifier a person types (username, email, student ID or faculty ID)
+is resolved to a user with one query: the candidate user ids come from a
+UNION ALL of indexed equality lookups (username, user email, faculty email
+for anything with an "@"; username, student_id, faculty_id otherwise), and
+the outer query loads the user with both role profiles joined. The login
+views then check the profile without another query, and the first page
+after login finds the principal already cached.
+
+Identifiers that match nobody are remembered for LOGIN_MISS_CACHE_TTL
+seconds, so repeated typos and guessing during registration rush are
+answered from the cache. accounts.signals forgets an identifier as soon as
+a user or profile that owns it is saved.
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+from catalog.models import Faculty
+from students.models import Student
+
+
+def miss_key(identifier):
+    digest = hashlib.sha256(identifier.encode()).hexdigest()[:32]
+    return f"login-miss:{digest}"
+
+
+def forget_misses(*identifiers):
+    keys = [miss_key(i.strip()) for i in identifiers if i and i.strip()]
+    if keys:
+        cache.delete_many(keys)
+
+
+def candidates(identifier):
+    """identifier এর সাথে মেলে এমন users (profile সহ), একটাই query।"""
+    User = get_user_model()
+    ids = [User.objects.filter(**{User.USERNAME_FIELD: identifier}).values("pk")]
+    if "@" in identifier:
+        ids.append(User.objects.filter(email=identifier).values("pk"))
+        ids.append(Faculty.objects.filter(email=identifier, user__isnull=False).values("user_id"))
+    else:
+        ids.append(Student.objects.filter(student_id=identifier).values("user_id"))
+        ids.append(Faculty.objects.filter(faculty_id=identifier, user__isnull=False).values("user_id"))
+    union = ids[0].union(*ids[1:], all=True)
+    return list(User.objects.select_related("student_profile", "faculty").filter(pk__in=union).order_by("pk"))
+
+
+class IdentifierBackend(ModelBackend):
+    """ModelBackend (permissions সহ), শুধু username এর জায়গায় যেকোনো login identifier।"""
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        User = get_user_model()
+        identifier = (username if username is not None else kwargs.get(User.USERNAME_FIELD)) or ""
+        identifier = identifier.strip()
+        if not identifier or password is None:
+            return None
+
+        key = miss_key(identifier)
+        users = None if cache.get(key) else candidates(identifier)
+        if users == []:
+            cache.set(key, True, getattr(settings, "LOGIN_MISS_CACHE_TTL", 60))
+        if not users:
+            # ModelBackend এর মতো: অচেনা identifier এও একবার hash চালাই, যাতে সময় দেখে বোঝা না যায়
+            User().set_password(password)
+            return None
+
+        # username আর কারো student ID একই হলে দুজনই আসে; password যার সাথে মেলে সে
+        for user in users:
+            if user.check_password(password) and self.user_can_authenticate(user):
+                user.profiles_loaded = True
+                return user
+        return None
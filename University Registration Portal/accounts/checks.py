@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# এগুলো প্রতিটা worker process এর নিজের; একটায় invalidate করলে অন্যগুলো জানে না
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register(Tags.caches, deploy=False)
+def principal_cache_is_shared(app_configs, **kwargs):
+    """
+    accounts.principal caches the whole user (password hash, is_active) and
+    relies on invalidate() reaching every worker, so outside DEBUG the
+    default cache must be shared between processes.
+    """
+    if settings.DEBUG or not getattr(settings, "PRINCIPAL_CACHE_TIMEOUT", 300):
+        return []
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [Error(
+        f"The default cache ({backend}) is per process, so a deactivated user or a changed "
+        "password stays valid in other workers for PRINCIPAL_CACHE_TIMEOUT seconds.",
+        hint="Point CACHES['default'] at a shared backend (Redis, Memcached) or set PRINCIPAL_CACHE_TIMEOUT = 0.",
+        id="accounts.E001",
+    )]
@@ -6,5 +6,11 @@ class CustomUser(AbstractUser):
     # Additional field (phone_number)
     phone_number = models.CharField(max_length=15, blank=True, null=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # email দিয়ে login (accounts.backends)
+            models.Index(fields=["email"], name="user_email_idx"),
+        ]
+
     def __str__(self):
         return self.username
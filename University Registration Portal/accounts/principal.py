@@ -0,0 +1,183 @@
+"""
+Request "principal": the logged-in user together with their Student and
+Faculty profiles, loaded with one joined query and cached per user.
+
+PrincipalMiddleware replaces the lazy request.user that
+AuthenticationMiddleware sets up, so a page that touches request.user and
+the profile costs one cache read (or one query on a miss) instead of a user
+query plus a profile query per view. The session hash check from
+django.contrib.auth.get_user is kept, and accounts.signals drops the entry
+whenever the user or one of the profiles is saved or deleted. The entry
+holds the password hash and is_active, so the cache must be shared by all
+workers (accounts.checks refuses a per-process one outside DEBUG).
+"""
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.auth.views import redirect_to_login
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.shortcuts import redirect
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+
+class Principal:
+    __slots__ = ("user", "student", "faculty")
+
+    def __init__(self, user, student=None, faculty=None):
+        self.user = user
+        self.student = student
+        self.faculty = faculty
+
+    @property
+    def is_authenticated(self):
+        return self.user.is_authenticated
+
+    def has_role(self, role):
+        if role == "student":
+            return self.student is not None
+        if role == "faculty":
+            return self.faculty is not None
+        if role == "staff":
+            return self.user.is_authenticated and self.user.is_staff
+        raise ValueError(f"Unknown role {role!r}")
+
+
+ANONYMOUS = Principal(AnonymousUser())
+
+
+# ---- Cache ----
+def cache_key(user_id):
+    return f"principal:{user_id}"
+
+
+def invalidate(user_id):
+    if user_id is not None:
+        cache.delete(cache_key(user_id))
+
+
+def _fetch(user_id):
+    """User + দুই profile, একটাই JOIN query; না থাকলে None।"""
+    user = get_user_model().objects.select_related("student_profile", "faculty").filter(pk=user_id).first()
+    if user is None:
+        return None
+    return principal_of(user)
+
+
+def principal_of(user):
+    # reverse one-to-one গুলো select_related এ cache হয়ে যায়, তাই এখানে আর query নেই
+    student = getattr(user, "student_profile", None)
+    faculty = getattr(user, "faculty", None)
+    return Principal(user, student, faculty)
+
+
+def remember(user):
+    """select_related করে আনা user কে সরাসরি cache এ রাখে (login এর পরে)।"""
+    cache.set(cache_key(user.pk), principal_of(user), getattr(settings, "PRINCIPAL_CACHE_TIMEOUT", 300))
+
+
+def _session_hash_ok(request, user):
+    # django.contrib.auth.get_user এর একই check: password বদলালে পুরনো session বাতিল
+    session_hash = request.session.get(HASH_SESSION_KEY)
+    if not hasattr(user, "get_session_auth_hash"):
+        return True
+    if session_hash and constant_time_compare(session_hash, user.get_session_auth_hash()):
+        return True
+    if session_hash and any(constant_time_compare(session_hash, h) for h in user.get_session_auth_fallback_hash()):
+        request.session.cycle_key()
+        request.session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        return True
+    request.session.flush()
+    return False
+
+
+def load_principal(request):
+    try:
+        user_id = get_user_model()._meta.pk.to_python(request.session[SESSION_KEY])
+        backend = request.session[BACKEND_SESSION_KEY]
+    except KeyError:
+        return ANONYMOUS
+    if backend not in settings.AUTHENTICATION_BACKENDS:
+        return ANONYMOUS
+
+    key = cache_key(user_id)
+    principal = cache.get(key)
+    if principal is None:
+        principal = _fetch(user_id)
+        if principal is None:
+            return ANONYMOUS
+        remember(principal.user)
+
+    user = principal.user
+    if not getattr(user, "is_active", True) or not _session_hash_ok(request, user):
+        return ANONYMOUS
+    user.backend = backend
+    return principal
+
+
+# ---- Middleware ----
+class PrincipalMiddleware:
+    """AuthenticationMiddleware এর ঠিক পরে রাখতে হবে।"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        # async stack এ get_response coroutine ফেরত দেয়, handler নিজেই await করে
+        self.attach(request)
+        return self.get_response(request)
+
+    @staticmethod
+    def attach(request):
+        request.principal = SimpleLazyObject(lambda: load_principal(request))
+        request.user = SimpleLazyObject(lambda: request.principal.user)
+
+        async def auser():
+            return await sync_to_async(lambda: request.principal.user)()
+
+        request.auser = auser
+
+
+# ---- Role decorator ----
+def role_required(role, redirect_to=None, message=None):
+    """
+    Login plus one of "student" / "faculty" / "staff". Anonymous users go to
+    the login page; logged-in users without the role are sent to
+    `redirect_to` with `message` (or get a 403 when no redirect is given).
+    """
+    def refuse(request, principal):
+        if not principal.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        if not principal.has_role(role):
+            if redirect_to is None:
+                raise PermissionDenied
+            if message:
+                messages.error(request, message)
+            return redirect(redirect_to)
+        return None
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                await request.auser()  # principal টা thread এ load হয়ে যায়
+                response = await sync_to_async(refuse)(request, request.principal)
+                if response is not None:
+                    return response
+                return await view(request, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            return refuse(request, request.principal) or view(request, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .backends import forget_misses
+from .principal import invalidate, remember
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def user_changed(sender, instance, **kwargs):
+    invalidate(instance.pk)
+    forget_misses(instance.get_username(), instance.email)
+
+
+@receiver(post_save, sender="students.Student")
+@receiver(post_delete, sender="students.Student")
+@receiver(post_save, sender="catalog.Faculty")
+@receiver(post_delete, sender="catalog.Faculty")
+def profile_changed(sender, instance, **kwargs):
+    invalidate(instance.user_id)
+    forget_misses(getattr(instance, "student_id", None), getattr(instance, "faculty_id", None),
+                  getattr(instance, "email", None))
+
+
+@receiver(user_logged_in)
+def prime_principal(sender, request, user, **kwargs):
+    # IdentifierBackend user টা দুই profile সহ এনেছে; last_login save এর invalidate এর পরে আবার cache এ রাখি
+    if getattr(user, "profiles_loaded", False):
+        remember(user)
@@ -1,3 +1,82 @@
-from django.test import TestCase
+from django.contrib.auth import authenticate, get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
 
-# Create your tests here.
+from catalog.models import Faculty
+from students.models import Student
+
+from .backends import miss_key
+from .checks import principal_cache_is_shared
+
+
+# ---- Login identifiers ----
+class IdentifierBackendTests(TestCase):
+    """email / student ID / faculty ID একটাই query তে; অচেনা identifier cache থেকে।"""
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.student_user = User.objects.create_user("s1", email="s1@diu.edu.bd", password="pw")
+        Student.objects.create(user=cls.student_user, student_id="221-15-001", full_name="Student One")
+        cls.faculty_user = User.objects.create_user("f1@diu.edu.bd", email="f1@diu.edu.bd", password="pw")
+        Faculty.objects.create(user=cls.faculty_user, faculty_id="F-7", name="Faculty One", email="f1@diu.edu.bd")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_each_identifier_in_one_query(self):
+        for identifier, expected in (("221-15-001", self.student_user), ("s1@diu.edu.bd", self.student_user),
+                                     ("s1", self.student_user), ("F-7", self.faculty_user),
+                                     ("f1@diu.edu.bd", self.faculty_user)):
+            with self.assertNumQueries(1):
+                user = authenticate(username=identifier, password="pw")
+                self.assertEqual(user.pk, expected.pk)
+                # profile গুলো select_related এ এসেছে, আলাদা query লাগে না
+                self.assertEqual(getattr(user, "faculty", None) is not None, expected == self.faculty_user)
+                self.assertEqual(getattr(user, "student_profile", None) is not None, expected == self.student_user)
+
+    def test_wrong_password(self):
+        self.assertIsNone(authenticate(username="221-15-001", password="nope"))
+
+    def test_unknown_identifier_is_cached_until_created(self):
+        self.assertIsNone(authenticate(username="221-15-999", password="pw"))
+        with self.assertNumQueries(0):
+            self.assertIsNone(authenticate(username="221-15-999", password="pw"))
+
+        user = get_user_model().objects.create_user("s2", password="pw")
+        Student.objects.create(user=user, student_id="221-15-999", full_name="Student Two")
+        self.assertIsNone(cache.get(miss_key("221-15-999")))
+        self.assertEqual(authenticate(username="221-15-999", password="pw").pk, user.pk)
+
+    def test_login_views(self):
+        response = self.client.post(reverse("login"), {"login_id": "221-15-001", "password": "pw"})
+        self.assertRedirects(response, reverse("student-dashboard"), fetch_redirect_response=False)
+        self.client.logout()
+        response = self.client.post(reverse("faculty-login"), {"username": "F-7", "password": "pw"})
+        self.assertRedirects(response, reverse("faculty-dashboard"), fetch_redirect_response=False)
+        # student account দিয়ে faculty login হয় না
+        self.client.logout()
+        response = self.client.post(reverse("faculty-login"), {"username": "221-15-001", "password": "pw"})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("_auth_user_id", self.client.session)
+
+
+# ---- Principal cache ----
+@override_settings(DEBUG=False, PRINCIPAL_CACHE_TIMEOUT=300)
+class PrincipalCacheCheckTests(SimpleTestCase):
+    """Cached users must be invalidated in every worker, so a per-process cache is refused."""
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_process_local_cache_is_an_error(self):
+        self.assertEqual([e.id for e in principal_cache_is_shared(None)], ["accounts.E001"])
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache",
+                                           "LOCATION": "redis://127.0.0.1:6379/1"}})
+    def test_shared_cache_passes(self):
+        self.assertEqual(principal_cache_is_shared(None), [])
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+                       PRINCIPAL_CACHE_TIMEOUT=0)
+    def test_no_principal_caching_passes(self):
+        self.assertEqual(principal_cache_is_shared(None), [])
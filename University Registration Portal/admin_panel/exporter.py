@@ -0,0 +1,114 @@
+"""
+Streaming CSV exports of enrollments, semester results and result items.
+
+Rows come from .iterator(chunk_size=...) over values_list() of the joined
+columns (the same JOINs select_related would add, without building model
+instances), and each CSV line is yielded as soon as it is written. The
+header goes out before the query runs, and memory stays flat however many
+million rows the export has. Enrollments of archived semesters are read
+from the archive table after the live one (students.history).
+"""
+import csv
+
+from django.db.models import Q
+
+from catalog.models import Department
+from students.history import enrollment_sources
+from students.models import Enrollment, ResultItem, SemesterResult
+from students.semesters import semester_by_label
+
+CHUNK_SIZE = 2000
+
+# kind -> (model, student path, semester path, status field or None, [(header, column), ...])
+EXPORTS = {
+    "enrollments": (
+        Enrollment, "student", "semester", "status",
+        [
+            ("student_id", "student__student_id"),
+            ("student_name", "student__full_name"),
+            ("department", "student__department"),
+            ("course_code", "course__code"),
+            ("course_title", "course__title"),
+            ("credit", "course__credit"),
+            ("semester", "semester__label"),
+            ("status", "status"),
+        ],
+    ),
+    "results": (
+        SemesterResult, "student", "semester", None,
+        [
+            ("student_id", "student__student_id"),
+            ("student_name", "student__full_name"),
+            ("department", "student__department"),
+            ("semester", "semester__label"),
+            ("gpa", "gpa"),
+        ],
+    ),
+    "result-items": (
+        ResultItem, "result__student", "result__semester", None,
+        [
+            ("student_id", "result__student__student_id"),
+            ("student_name", "result__student__full_name"),
+            ("semester", "result__semester__label"),
+            ("course_code", "course__code"),
+            ("course_title", "course__title"),
+            ("credit", "credit"),
+            ("grade", "grade"),
+            ("grade_point", "grade_point"),
+        ],
+    ),
+}
+
+
+class _Echo:
+    """csv.writer এর জন্য file-like; লেখা লাইনটাই ফেরত দেয়।"""
+    def write(self, value):
+        return value
+
+
+def export_filters(params):
+    """GET params / command options থেকে semester, department, status।"""
+    return {
+        # admin panel datalist এ "Spring 2025, 251" থাকে, label শুধু কমার আগের অংশ
+        "semester": (params.get("semester") or "").split(",")[0].strip(),
+        "department": (params.get("department") or "").strip(),
+        "status": (params.get("status") or "").strip().lower(),
+    }
+
+
+def export_querysets(kind, filters):
+    """The export's querysets, one per table holding its rows."""
+    model = EXPORTS[kind][0]
+    sources = [model]
+    if model is Enrollment:
+        sources = enrollment_sources(semester_by_label(filters["semester"]) if filters.get("semester") else None)
+    return [export_queryset(kind, filters, source) for source in sources]
+
+
+def export_queryset(kind, filters, model=None):
+    default, student, semester, status, columns = EXPORTS[kind]
+    qs = (model or default).objects.all()
+    if filters.get("semester"):
+        qs = qs.filter(**{f"{semester}__label": filters["semester"]})
+    if filters.get("department"):
+        # Student.department free text: code বা পুরো নাম দুটোই মিলাই
+        dept = filters["department"]
+        names = [dept] + list(Department.objects.filter(code__iexact=dept).values_list("name", flat=True))
+        cond = Q()
+        for name in names:
+            cond |= Q(**{f"{student}__department__iexact": name})
+        qs = qs.filter(cond)
+    if status and filters.get("status"):
+        qs = qs.filter(**{status: filters["status"]})
+    return qs.order_by("id").values_list(*[col for _, col in columns])
+
+
+def export_rows(kind, filters, chunk_size=CHUNK_SIZE):
+    """Yield CSV lines (header first) for one export, streaming from the DB."""
+    columns = EXPORTS[kind][-1]
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for header, _ in columns])
+    # UNION + ORDER BY হলে পুরো export sort হতো; তাই table গুলো একটার পর একটা
+    for qs in export_querysets(kind, filters):
+        for row in qs.iterator(chunk_size=chunk_size):
+            yield writer.writerow(row)
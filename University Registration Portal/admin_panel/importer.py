@@ -0,0 +1,192 @@
+"""
+Streaming CSV import of departments, courses and faculty.
+
+Rows are read one at a time from any text stream, validated, and upserted
+in batches with bulk_create(update_conflicts=True), so a catalog of any size
+costs one INSERT ... ON CONFLICT per batch and constant memory.
+"""
+import csv
+import io
+import time
+from decimal import Decimal, InvalidOperation
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import DatabaseError, transaction
+
+from catalog.models import Course, Department, Faculty
+from students import catalog
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 200
+
+
+class ImportReport:
+    def __init__(self, kind):
+        self.kind = kind
+        self.rows = 0
+        self.saved = 0
+        self.error_count = 0
+        self.errors = []  # (line, message), first MAX_REPORTED_ERRORS only
+        self.seconds = 0.0
+
+    def error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+# ---- Row parsers: CSV dict -> model field dict, or ValueError ----
+def _required(row, *names):
+    values = []
+    for name in names:
+        value = (row.get(name) or "").strip()
+        if not value:
+            raise ValueError(f"'{name}' is required")
+        values.append(value)
+    return values
+
+
+def _fit(model, fields, *names):
+    """Column গুলো model এর max_length এ ধরে কিনা; নাহলে DB (Postgres) DataError দিয়ে পুরো batch ফেলে দিত।"""
+    for name in names:
+        limit = model._meta.get_field(name).max_length
+        if len(fields[name]) > limit:
+            raise ValueError(f"'{name}' is longer than {limit} characters")
+    return fields
+
+
+def _department_id(row, departments):
+    code = (row.get("department") or "").strip().upper()
+    if not code:
+        return None
+    if code not in departments:
+        raise ValueError(f"unknown department '{code}'")
+    return departments[code]
+
+
+def parse_department(row, departments):
+    code, name = _required(row, "code", "name")
+    return _fit(Department, {"code": code.upper(), "name": name}, "code", "name")
+
+
+def parse_course(row, departments):
+    code, title = _required(row, "code", "title")
+    try:
+        credit = Decimal((row.get("credit") or "3").strip())
+    except InvalidOperation:
+        raise ValueError(f"credit '{row.get('credit')}' is not a number")
+    if not credit.is_finite():
+        raise ValueError(f"credit '{row.get('credit')}' is not a number")
+    # আগে round, তারপর range: 99.95 -> 100.0 DecimalField(3, 1) এ ধরে না
+    credit = credit.quantize(Decimal("0.1"))
+    if not Decimal("0") < credit <= Decimal("99.9"):
+        raise ValueError(f"credit {credit} is out of range")
+    return _fit(Course, {
+        "code": code.upper(),
+        "title": title[:200],
+        "credit": credit,
+        "department_id": _department_id(row, departments),
+        "semester_label": (row.get("semester") or "").strip()[:50],
+    }, "code")
+
+
+def parse_faculty(row, departments):
+    faculty_id, name, email = _required(row, "faculty_id", "name", "email")
+    email = email.lower()
+    try:
+        validate_email(email)
+    except ValidationError:
+        raise ValueError(f"'{email}' is not a valid email")
+    return _fit(Faculty, {"faculty_id": faculty_id, "name": name, "email": email,
+                          "department_id": _department_id(row, departments)}, "faculty_id", "name", "email")
+
+
+# kind -> (model, parser, conflict key, columns written on conflict)
+IMPORTERS = {
+    "departments": (Department, parse_department, "code", ["name"]),
+    "courses": (Course, parse_course, "code", ["title", "credit", "department", "semester_label"]),
+    "faculty": (Faculty, parse_faculty, "faculty_id", ["name", "email", "department"]),
+}
+
+
+# ---- Import ----
+def _flush(model, key, update_fields, batch, report):
+    """
+    Upsert one batch. If the batch trips another unique constraint (e.g. an
+    email already used by a different faculty_id) or any other database error,
+    fall back to row-by-row so only the offending rows are reported.
+    """
+    if not batch:
+        return
+    objs = [model(**fields) for _, fields in batch.values()]
+    try:
+        with transaction.atomic():
+            model.objects.bulk_create(objs, update_conflicts=True, unique_fields=[key], update_fields=update_fields)
+        report.saved += len(objs)
+        return
+    except DatabaseError:
+        pass
+    for line, fields in batch.values():
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create([model(**fields)], update_conflicts=True,
+                                          unique_fields=[key], update_fields=update_fields)
+            report.saved += 1
+        except DatabaseError as e:
+            report.error(line, str(e).splitlines()[0])
+
+
+def import_csv(kind, stream, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    `stream` is a text file object (header row first); returns an ImportReport.
+    Department codes are resolved through a single code -> id map.
+    """
+    model, parse, key, update_fields = IMPORTERS[kind]
+    report = ImportReport(kind)
+    started = time.perf_counter()
+    departments = dict(Department.objects.values_list("code", "id")) if kind != "departments" else {}
+
+    reader = csv.DictReader(stream)
+    if reader.fieldnames is None:
+        report.error(1, "file is empty")
+        return report
+    reader.fieldnames = [(name or "").strip().lower() for name in reader.fieldnames]
+
+    batch = {}  # key -> (line, fields); a key repeated in the file keeps its last row
+    try:
+        for row in reader:
+            report.rows += 1
+            try:
+                fields = parse(row, departments)
+            except ValueError as e:
+                report.error(reader.line_num, str(e))
+                continue
+            batch[fields[key]] = (reader.line_num, fields)
+            if len(batch) >= batch_size:
+                _flush(model, key, update_fields, batch, report)
+                batch = {}
+    except (UnicodeDecodeError, csv.Error) as e:
+        # ভাঙা file: এ পর্যন্ত যা পড়া গেছে সেটুকু রেখে বাকিটা বাদ
+        report.error(reader.line_num + 1, f"stopped reading: {e}")
+    _flush(model, key, update_fields, batch, report)
+
+    if kind == "courses" and report.saved:
+        # bulk_create signal পাঠায় না, তাই catalog snapshot নিজে invalidate করি
+        catalog.bump_version()
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def import_upload(kind, uploaded_file, batch_size=DEFAULT_BATCH_SIZE):
+    """Django UploadedFile থেকে; বড় upload disk এ থাকে, এখানে chunk ধরে পড়া হয়।"""
+    stream = io.TextIOWrapper(uploaded_file.file, encoding="utf-8-sig", newline="")
+    try:
+        return import_csv(kind, stream, batch_size)
+    finally:
+        stream.detach()
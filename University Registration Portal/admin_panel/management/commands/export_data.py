@@ -0,0 +1,37 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from admin_panel.exporter import CHUNK_SIZE, EXPORTS, export_filters, export_rows
+
+
+class Command(BaseCommand):
+    help = "Stream enrollments, results or result items to CSV for scheduled dumps"
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=list(EXPORTS))
+        parser.add_argument("--output", "-o", default="-", help="file to write; '-' is stdout")
+        parser.add_argument("--semester", help='semester label, e.g. "Spring 2025"')
+        parser.add_argument("--department", help="department code or name")
+        parser.add_argument("--status", help="enrollment status (enrollments only)")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **opts):
+        filters = export_filters(opts)
+        started = time.perf_counter()
+        rows = 0
+        try:
+            out = sys.stdout if opts["output"] == "-" else open(opts["output"], "w", encoding="utf-8", newline="")
+        except OSError as e:
+            raise CommandError(e)
+        try:
+            for line in export_rows(opts["kind"], filters, opts["chunk_size"]):
+                out.write(line)
+                rows += 1
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        elapsed = time.perf_counter() - started
+        # stdout এ CSV যেতে পারে, তাই summary stderr এ
+        self.stderr.write(f"✅ {opts['kind']}: {rows - 1} rows in {elapsed:.1f}s ({(rows - 1) / elapsed if elapsed else 0:,.0f} rows/s)")
@@ -0,0 +1,34 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from admin_panel.importer import DEFAULT_BATCH_SIZE, IMPORTERS, import_csv
+
+
+class Command(BaseCommand):
+    help = "Stream a CSV of departments, courses or faculty into the catalog app, upserting on code / faculty_id"
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=list(IMPORTERS))
+        parser.add_argument("path", help="CSV file with a header row; '-' reads stdin")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **opts):
+        if opts["path"] == "-":
+            report = import_csv(opts["kind"], sys.stdin, opts["batch_size"])
+        else:
+            try:
+                with open(opts["path"], encoding="utf-8-sig", newline="") as f:
+                    report = import_csv(opts["kind"], f, opts["batch_size"])
+            except OSError as e:
+                raise CommandError(e)
+
+        for line, message in report.errors:
+            self.stderr.write(f"  line {line}: {message}")
+        if report.error_count > len(report.errors):
+            self.stderr.write(f"  ... and {report.error_count - len(report.errors)} more")
+        style = self.style.WARNING if report.error_count else self.style.SUCCESS
+        self.stdout.write(style(
+            f"✅ {report.kind}: {report.rows} rows, {report.saved} saved, {report.error_count} errors "
+            f"in {report.seconds:.2f}s ({report.rows_per_sec:,.0f} rows/sec)"
+        ))
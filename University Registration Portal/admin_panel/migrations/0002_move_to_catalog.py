@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0001_initial'),
+        ('catalog', '0002_merge_legacy_catalog'),
+    ]
+
+    # rows were copied into catalog by catalog.0002_merge_legacy_catalog
+    operations = [
+        migrations.DeleteModel(
+            name='Course',
+        ),
+        migrations.DeleteModel(
+            name='Faculty',
+        ),
+        migrations.DeleteModel(
+            name='Department',
+        ),
+    ]
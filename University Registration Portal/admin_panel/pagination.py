@@ -0,0 +1,132 @@
+import base64
+import json
+
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+# ---- Helpers ----
+def _encode(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def _decode(token, n_keys):
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(values, list) or len(values) != n_keys:
+        return None
+    return values
+
+
+def _seek(keys, values, op):
+    """(k1, k2) > (v1, v2) লেখা Q দিয়ে, যেকোনো DB তে index ব্যবহার করতে পারে।"""
+    cond = Q()
+    for i, key in enumerate(keys):
+        step = Q(**{f"{key}__{op}": values[i]})
+        for prev_key, prev_value in zip(keys[:i], values[:i]):
+            step &= Q(**{prev_key: prev_value})
+        cond |= step
+    return cond
+
+
+def page_size(request, param="limit"):
+    try:
+        size = int(request.GET.get(param, DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        size = DEFAULT_PAGE_SIZE
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+# ---- Keyset page ----
+class KeysetPage:
+    def __init__(self, items, has_prev, has_next, prev_query="", next_query=""):
+        self.items = items
+        self.has_prev = has_prev
+        self.has_next = has_next
+        self.prev_query = prev_query
+        self.next_query = next_query
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def keyset_paginate(request, queryset, keys, prefix=""):
+    """
+    Cursor pagination ordered by `keys`; the last key must be unique (usually "id").
+
+    Each page is a single `WHERE (keys) > cursor ORDER BY keys LIMIT n+1`, so
+    the cost stays the same on page 1 and page 10,000. Cursors travel in the
+    `<prefix>after` / `<prefix>before` GET params, which lets several lists
+    on one page paginate independently.
+    """
+    keys = list(keys)
+    size = page_size(request, f"{prefix}limit" if f"{prefix}limit" in request.GET else "limit")
+    after = _decode(request.GET.get(f"{prefix}after"), len(keys))
+    before = _decode(request.GET.get(f"{prefix}before"), len(keys))
+
+    if before is not None:
+        rows = list(queryset.filter(_seek(keys, before, "lt")).order_by(*[f"-{k}" for k in keys])[:size + 1])
+        has_prev, has_next = len(rows) > size, True
+        rows = rows[:size][::-1]
+    else:
+        if after is not None:
+            queryset = queryset.filter(_seek(keys, after, "gt"))
+        rows = list(queryset.order_by(*keys)[:size + 1])
+        has_prev, has_next = after is not None, len(rows) > size
+        rows = rows[:size]
+
+    def query_with(param, row):
+        params = request.GET.copy()
+        params.pop(f"{prefix}after", None)
+        params.pop(f"{prefix}before", None)
+        params[f"{prefix}{param}"] = _encode([_cursor_value(row, k) for k in keys])
+        return params.urlencode()
+
+    return KeysetPage(
+        rows,
+        has_prev=has_prev and bool(rows),
+        has_next=has_next and bool(rows),
+        prev_query=query_with("before", rows[0]) if rows else "",
+        next_query=query_with("after", rows[-1]) if rows else "",
+    )
+
+
+def _cursor_value(obj, key):
+    value = obj
+    for part in key.split("__"):
+        value = getattr(value, part)
+    return value
+
+
+# ---- API cursors ----
+def decode_cursor(cursor, n_keys):
+    """Cursor -> key values; None for no cursor, ValueError when it does not decode."""
+    if not cursor:
+        return None
+    values = _decode(cursor, n_keys)
+    if values is None:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def make_cursor(values):
+    return _encode(list(values))
+
+
+def seek_after(queryset, keys, cursor):
+    """`queryset` ordered by `keys`, starting after `cursor` (None for the first page)."""
+    keys = list(keys)
+    values = decode_cursor(cursor, len(keys))
+    if values is not None:
+        queryset = queryset.filter(_seek(keys, values, "gt"))
+    return queryset.order_by(*keys)
@@ -1,3 +1,73 @@
+import io
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from django.urls import reverse
+
+from catalog.models import Course
+from students.models import ResultItem, Semester, SemesterResult, Student
+
+from .importer import import_csv
+
+
+# ---- CSV import ----
+class ImportCoursesTests(TestCase):
+    """Bad rows are reported one by one; they never abort the import."""
+
+    def run_import(self, *rows):
+        return import_csv("courses", io.StringIO("code,title,credit\n" + "".join(r + "\n" for r in rows)))
+
+    def test_bad_credit_is_a_row_error(self):
+        report = self.run_import("CSE101,Good,3", "CSE102,Nan,NaN", "CSE103,Inf,inf", "CSE104,Rounds up,99.95",
+                                 "CSE105,Top,99.94")
+        self.assertEqual([line for line, _ in report.errors], [3, 4, 5])
+        self.assertEqual(sorted(Course.objects.values_list("code", flat=True)), ["CSE101", "CSE105"])
+
+    def test_too_long_code_is_a_row_error(self):
+        report = self.run_import("C" * 21 + ",Long,3", "CSE106,Fine,3")
+        self.assertEqual(report.saved, 1)
+        self.assertEqual(report.errors, [(2, "'code' is longer than 20 characters")])
+
+    def test_students_cannot_import(self):
+        user = get_user_model().objects.create_user("imp-s", password="pw")
+        Student.objects.create(user=user, student_id="IMP-S", full_name="Student")
+        self.client.force_login(user)
+        upload = SimpleUploadedFile("courses.csv", b"code,title,credit\nHACK1,Hack,3\n", content_type="text/csv")
+        response = self.client.post(reverse("catalog-import"), {"kind": "courses", "file": upload})
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Course.objects.filter(code="HACK1").exists())
+
+
+# ---- Courses ----
+class CourseDeleteTests(TestCase):
+    def test_graded_course_is_kept_and_reported(self):
+        User = get_user_model()
+        course = Course.objects.create(code="CSE777", title="Graded", credit=Decimal("3.0"))
+        student = Student.objects.create(user=User.objects.create_user("graded", password="pw"),
+                                         student_id="G-1", full_name="Graded")
+        result = SemesterResult.objects.create(student=student, semester=Semester.objects.create(label="Fall 2093"),
+                                               gpa=Decimal("3.00"))
+        ResultItem.objects.create(result=result, course=course, credit=Decimal("3.0"), grade="B",
+                                  grade_point=Decimal("3.00"))
+        self.client.force_login(User.objects.create_user("admin", password="pw", is_staff=True))
+        page = self.client.get(reverse("course-delete", args=[course.pk]), follow=True)
+        self.assertContains(page, "CSE777 has graded results and cannot be deleted.")
+        self.assertTrue(Course.objects.filter(pk=course.pk).exists())
+
+
+# ---- CSV export ----
+class ExportPermissionTests(TestCase):
+    def test_students_cannot_export(self):
+        user = get_user_model().objects.create_user("exp-s", password="pw")
+        Student.objects.create(user=user, student_id="EXP-S", full_name="Student")
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(reverse("export")).status_code, 403)
+        self.assertEqual(self.client.get(reverse("export-csv", args=["results"])).status_code, 403)
 
-# Create your tests here.
+    def test_staff_can_export(self):
+        self.client.force_login(get_user_model().objects.create_user("exp-staff", password="pw", is_staff=True))
+        response = self.client.get(reverse("export-csv", args=["results"]))
+        self.assertEqual(response.status_code, 200)
+        b"".join(response.streaming_content)
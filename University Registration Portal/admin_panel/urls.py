@@ -23,4 +23,14 @@ urlpatterns = [
     path("faculty/", views.faculty_view, name="faculty"),
     path("faculty/edit/<int:pk>/", views.faculty_edit, name="faculty-edit"),
     path("faculty/remove/<int:pk>/", views.faculty_remove, name="remove-faculty"),
+
+    # Advisor auto-assignment
+    path("advisors/", views.advisors_view, name="advisors"),
+
+    # Bulk CSV import
+    path("import/", views.import_view, name="catalog-import"),
+
+    # Streaming CSV export
+    path("export/", views.export_view, name="export"),
+    path("export/<slug:kind>.csv", views.export_csv, name="export-csv"),
 ]
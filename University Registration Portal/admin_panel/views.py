@@ -1,9 +1,27 @@
+from django.http import Http404, StreamingHttpResponse
+from django.db.models import ProtectedError
 from django.shortcuts import render, redirect, get_object_or_404
-from .models import Department, Course, Faculty
+from catalog.models import Department, Course, Faculty
+from .pagination import keyset_paginate, page_size
+from .importer import IMPORTERS, import_upload
+from .exporter import EXPORTS, export_filters, export_rows
+from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from accounts.principal import role_required
+from django.utils.text import slugify
+from students.advising import auto_assign
+from students.models import Student
+from students.semesters import semester_options
+from asgiref.sync import sync_to_async
+from registration_portal.aio import gather
+from registration_portal.stats import admin_stats
 
 # ---- Helper: semester list ----
 def make_semesters(year_from=None, year_to=None):
+    # Semester table (process cache) থেকে; table খালি থাকলে আগের মতো বছর ধরে বানাই
+    rows = semester_options()
+    if rows:
+        return rows
     from datetime import date
     SEASONS = [("Spring", 1), ("Summer", 2), ("Fall", 3), ("Short", 4)]
     y = date.today().year
@@ -18,19 +36,66 @@ def make_semesters(year_from=None, year_to=None):
     rows.sort(key=lambda r: r["label"], reverse=True)
     return rows
 
+# ---- Helper: list filters ----
+def list_filters(request):
+    dept_id = (request.GET.get("department") or "").strip()
+    return {
+        "department": dept_id if dept_id.isdigit() else "",
+        "semester": (request.GET.get("semester") or "").strip(),
+        "limit": page_size(request),
+    }
+
+def filter_courses(qs, filters):
+    if filters["department"]:
+        qs = qs.filter(department_id=filters["department"])
+    if filters["semester"]:
+        qs = qs.filter(semester_label=filters["semester"])
+    return qs
+
+def filter_faculty(qs, filters):
+    if filters["department"]:
+        qs = qs.filter(department_id=filters["department"])
+    return qs
+
 # ---- Dashboard ----
 @login_required
 def dashboard(request):
+    filters = list_filters(request)
+    courses = filter_courses(Course.objects.select_related("department"), filters)
+    faculty_members = filter_faculty(Faculty.objects.select_related("department"), filters)
     ctx = dict(
-        total_departments=Department.objects.count(),
-        total_courses=Course.objects.count(),
-        total_faculty=Faculty.objects.count(),
-        departments=Department.objects.order_by("name"),
-        courses=Course.objects.select_related("department").order_by("code"),
-        faculty_members=Faculty.objects.select_related("department").order_by("name"),
+        **admin_stats(),
+        departments=keyset_paginate(request, Department.objects.all(), ("name", "id"), prefix="dept_"),
+        courses=keyset_paginate(request, courses, ("code", "id"), prefix="course_"),
+        faculty_members=keyset_paginate(request, faculty_members, ("name", "id"), prefix="fac_"),
+        all_departments=Department.objects.order_by("name"),
+        filters=filters,
     )
     return render(request, "adminPanel/dashboard.html", ctx)
 
+# ASGI profile এর dashboard: stats আর তিনটা page আলাদা thread এ একসাথে
+@login_required
+async def dashboard_async(request):
+    filters = list_filters(request)
+    courses = filter_courses(Course.objects.select_related("department"), filters)
+    faculty_members = filter_faculty(Faculty.objects.select_related("department"), filters)
+    stats, departments, course_page, faculty_page, all_departments = await gather(
+        admin_stats,
+        lambda: keyset_paginate(request, Department.objects.all(), ("name", "id"), prefix="dept_"),
+        lambda: keyset_paginate(request, courses, ("code", "id"), prefix="course_"),
+        lambda: keyset_paginate(request, faculty_members, ("name", "id"), prefix="fac_"),
+        lambda: list(Department.objects.order_by("name")),
+    )
+    ctx = dict(
+        **stats,
+        departments=departments,
+        courses=course_page,
+        faculty_members=faculty_page,
+        all_departments=all_departments,
+        filters=filters,
+    )
+    return await sync_to_async(render)(request, "adminPanel/dashboard.html", ctx)
+
 # ---- Departments ----
 @login_required
 def departments_view(request):
@@ -41,7 +106,7 @@ def departments_view(request):
             Department.objects.get_or_create(name=name, code=code)
         return redirect("departments")
     return render(request, "adminPanel/departments.html", {
-        "departments": Department.objects.order_by("id")
+        "departments": keyset_paginate(request, Department.objects.all(), ("id",))
     })
 
 @login_required
@@ -90,15 +155,23 @@ def courses_view(request):
             )
         return redirect("courses")
 
+    filters = list_filters(request)
+    courses = filter_courses(Course.objects.select_related("department"), filters)
     return render(request, "adminPanel/courses.html", {
-        "courses": Course.objects.select_related("department").order_by("code"),
+        "courses": keyset_paginate(request, courses, ("code", "id")),
         "departments": Department.objects.order_by("name"),
         "semesters": make_semesters(),
+        "filters": filters,
     })
 
 @login_required
 def course_delete(request, pk):
-    get_object_or_404(Course, pk=pk).delete()
+    course = get_object_or_404(Course, pk=pk)
+    try:
+        course.delete()
+    except ProtectedError:
+        # graded course; result item গুলো ওটাকে ধরে রাখে
+        messages.error(request, f"{course.code} has graded results and cannot be deleted.")
     return redirect("courses")
 
 @login_required
@@ -150,9 +223,12 @@ def faculty_view(request):
             )
         return redirect("faculty")
 
+    filters = list_filters(request)
+    faculties = filter_faculty(Faculty.objects.select_related("department"), filters)
     return render(request, "adminPanel/faculty.html", {
-        "faculties": Faculty.objects.select_related("department").order_by("name"),
+        "faculties": keyset_paginate(request, faculties, ("name", "id")),
         "departments": Department.objects.order_by("name"),
+        "filters": filters,
     })
 
 @login_required
@@ -182,3 +258,54 @@ def faculty_edit(request, pk):
 def faculty_remove(request, pk):
     get_object_or_404(Faculty, pk=pk).delete()
     return redirect("faculty")
+
+# ---- Advisor auto-assignment ----
+@role_required("staff")
+def advisors_view(request):
+    report = None
+    if request.method == "POST":
+        report = auto_assign(rebalance=request.POST.get("rebalance") == "1",
+                             dry_run=request.POST.get("dry_run") == "1")
+    return render(request, "adminPanel/advisors.html", {
+        "report": report,
+        "dry_run": request.POST.get("dry_run") == "1",
+        "unassigned": Student.objects.filter(advisor__isnull=True).count(),
+    })
+
+# ---- Bulk CSV import ----
+@role_required("staff")
+def import_view(request):
+    report, error = None, None
+    if request.method == "POST":
+        kind = request.POST.get("kind")
+        upload = request.FILES.get("file")
+        if kind not in IMPORTERS:
+            error = "Choose what the file contains."
+        elif upload is None:
+            error = "Choose a CSV file to upload."
+        else:
+            report = import_upload(kind, upload)
+    return render(request, "adminPanel/import.html", {
+        "kinds": list(IMPORTERS),
+        "report": report,
+        "error": error,
+    })
+
+# ---- Streaming CSV export ----
+@role_required("staff")
+def export_view(request):
+    return render(request, "adminPanel/export.html", {
+        "kinds": list(EXPORTS),
+        "departments": Department.objects.order_by("name"),
+        "semesters": make_semesters(),
+    })
+
+@role_required("staff")
+def export_csv(request, kind):
+    if kind not in EXPORTS:
+        raise Http404("Unknown export")
+    filters = export_filters(request.GET)
+    response = StreamingHttpResponse(export_rows(kind, filters), content_type="text/csv; charset=utf-8")
+    suffix = "-".join(slugify(v) for v in filters.values() if v)
+    response["Content-Disposition"] = f'attachment; filename="{kind}{"-" + suffix if suffix else ""}.csv"'
+    return response
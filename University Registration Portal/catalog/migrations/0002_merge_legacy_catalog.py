@@ -0,0 +1,152 @@
+from django.core.management.color import no_style
+from django.db import migrations
+
+
+def key(code):
+    return (code or '').strip().upper()
+
+
+def merge_catalogs(apps, schema_editor):
+    """
+    admin_panel, faculty আর students এর তিনটা catalog এক জায়গায়, code ধরে dedupe করে।
+
+    Ids are kept where other tables point at them: students.Course ids (Enrollment,
+    ResultItem) and admin_panel Department / Faculty ids (admin URLs, cached
+    principals). Rows that only exist in another copy get fresh ids.
+    """
+    Department = apps.get_model('catalog', 'Department')
+    Course = apps.get_model('catalog', 'Course')
+    Faculty = apps.get_model('catalog', 'Faculty')
+    AdminDepartment = apps.get_model('admin_panel', 'Department')
+    AdminCourse = apps.get_model('admin_panel', 'Course')
+    AdminFaculty = apps.get_model('admin_panel', 'Faculty')
+    FacultyDepartment = apps.get_model('faculty', 'Department')
+    FacultyCourse = apps.get_model('faculty', 'Course')
+    FacultyMember = apps.get_model('faculty', 'Faculty')
+    StudentCourse = apps.get_model('students', 'Course')
+
+    # ---- Departments ----
+    departments, by_code, by_name = [], {}, {}
+
+    def add_department(row, pk):
+        dept = Department(id=pk, name=row.name, code=row.code)
+        departments.append(dept)
+        by_code[key(row.code)] = by_name[row.name.strip().lower()] = dept
+        return dept
+
+    for row in AdminDepartment.objects.order_by('id'):
+        add_department(row, row.id)
+    next_id = max([d.id for d in departments], default=0) + 1
+    faculty_dept = {}  # faculty.Department id -> catalog id
+    for row in FacultyDepartment.objects.order_by('id'):
+        dept = by_code.get(key(row.code)) or by_name.get(row.name.strip().lower())
+        if dept is None:
+            dept = add_department(row, next_id)
+            next_id += 1
+        faculty_dept[row.id] = dept.id
+    Department.objects.bulk_create(departments, batch_size=1000)
+
+    # ---- Courses ----
+    # students.Course আগে: students যা দেখে register করেছে সেই title/credit ই থাকে
+    courses = {}
+    for row in StudentCourse.objects.order_by('id'):
+        courses[key(row.code)] = Course(id=row.id, code=row.code, title=row.title, credit=row.credit,
+                                        capacity=row.capacity, seats_taken=row.seats_taken)
+    next_id = max([c.id for c in courses.values()], default=0) + 1
+    for rows, dept_of in ((AdminCourse.objects.order_by('id'), lambda row: row.department_id),
+                          (FacultyCourse.objects.order_by('id'), lambda row: faculty_dept.get(row.department_id))):
+        for row in rows:
+            course = courses.get(key(row.code))
+            if course is None:
+                course = courses[key(row.code)] = Course(id=next_id, code=row.code.strip(), title=row.title,
+                                                         credit=row.credit)
+                next_id += 1
+            if course.department_id is None:
+                course.department_id = dept_of(row)
+            if not course.semester_label:
+                course.semester_label = getattr(row, 'semester_label', '')
+    Course.objects.bulk_create(courses.values(), batch_size=1000)
+
+    # ---- Faculty ----
+    members, by_fid, by_email, users = [], {}, {}, set()
+    for row in AdminFaculty.objects.order_by('id'):
+        member = Faculty(id=row.id, faculty_id=row.faculty_id, name=row.name, email=row.email,
+                         department_id=row.department_id, user_id=row.user_id)
+        members.append(member)
+        by_fid[row.faculty_id] = by_email[row.email.lower()] = member
+        users.add(row.user_id)
+    next_id = max([m.id for m in members], default=0) + 1
+    for row in FacultyMember.objects.order_by('id'):
+        member = by_fid.get(row.faculty_id) or by_email.get(row.email.lower())
+        if member is None:
+            member = Faculty(id=next_id, faculty_id=row.faculty_id, name=row.name, email=row.email)
+            members.append(member)
+            by_fid[row.faculty_id] = by_email[row.email.lower()] = member
+            next_id += 1
+        if member.department_id is None:
+            member.department_id = faculty_dept.get(row.department_id)
+        # user one-to-one: একই account দুই faculty row এ বসানো যায় না
+        if member.user_id is None and row.user_id not in users:
+            member.user_id = row.user_id
+            users.add(row.user_id)
+    Faculty.objects.bulk_create(members, batch_size=1000)
+
+    # explicit ids দিয়ে insert করেছি; Postgres sequence গুলো max(id) এ তুলে দিই
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), [Department, Course, Faculty]):
+            cursor.execute(sql)
+
+
+def split_catalog(apps, schema_editor):
+    """
+    Reverse: catalog এর rows একই ids এ admin_panel আর students এর copy তে ফেরত।
+
+    faculty app's copies stay empty; they only ever held duplicates.
+    """
+    Department = apps.get_model('catalog', 'Department')
+    Course = apps.get_model('catalog', 'Course')
+    Faculty = apps.get_model('catalog', 'Faculty')
+    AdminDepartment = apps.get_model('admin_panel', 'Department')
+    AdminCourse = apps.get_model('admin_panel', 'Course')
+    AdminFaculty = apps.get_model('admin_panel', 'Faculty')
+    StudentCourse = apps.get_model('students', 'Course')
+
+    AdminDepartment.objects.bulk_create(
+        [AdminDepartment(id=d.id, name=d.name, code=d.code) for d in Department.objects.order_by('id')],
+        batch_size=1000)
+    courses = list(Course.objects.order_by('id'))
+    AdminCourse.objects.bulk_create(
+        [AdminCourse(id=c.id, code=c.code, title=c.title, credit=c.credit, semester_label=c.semester_label,
+                     department_id=c.department_id) for c in courses], batch_size=1000)
+    StudentCourse.objects.bulk_create(
+        [StudentCourse(id=c.id, code=c.code, title=c.title, credit=c.credit, capacity=c.capacity,
+                       seats_taken=c.seats_taken) for c in courses], batch_size=1000)
+    AdminFaculty.objects.bulk_create(
+        [AdminFaculty(id=m.id, faculty_id=m.faculty_id, name=m.name, email=m.email,
+                      department_id=m.department_id, user_id=m.user_id) for m in Faculty.objects.order_by('id')],
+        batch_size=1000)
+
+    Faculty.objects.all().delete()
+    Course.objects.all().delete()
+    Department.objects.all().delete()
+
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), [AdminDepartment, AdminCourse, AdminFaculty,
+                                                                   StudentCourse]):
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0001_initial'),
+        ('admin_panel', '0001_initial'),
+        ('faculty', '0002_enrollment_course_status_index'),
+        ('students', '0012_enrollment_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_catalogs, split_catalog),
+    ]
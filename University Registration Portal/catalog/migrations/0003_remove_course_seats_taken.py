@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:16
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0002_merge_legacy_catalog'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='course',
+            name='seats_taken',
+        ),
+    ]
@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+from students.models import Enrollment, ResultItem
+
+BEFORE_MERGE = [
+    ("catalog", "0001_initial"),
+    ("admin_panel", "0001_initial"),
+    ("faculty", "0002_enrollment_course_status_index"),
+    ("students", "0012_enrollment_archive"),
+]
+MERGE = [("catalog", "0002_merge_legacy_catalog")]
+
+
+def migrate(targets=None):
+    """targets এ migrate করে ওই state এর historical apps ফেরত দেয় (None = সব শেষ migration)।"""
+    executor = MigrationExecutor(connection)
+    targets = targets or executor.loader.graph.leaf_nodes()
+    executor.migrate(targets)
+    return MigrationExecutor(connection).loader.project_state(targets).apps
+
+
+# ---- Legacy catalog merge ----
+class MergeLegacyCatalogTests(TransactionTestCase):
+    """catalog.0002 folds the admin_panel, faculty and students copies into one catalog."""
+
+    def setUp(self):
+        self.addCleanup(migrate)
+        old = migrate(BEFORE_MERGE)
+        User = old.get_model("accounts", "CustomUser")
+        AdminDepartment = old.get_model("admin_panel", "Department")
+        FacultyDepartment = old.get_model("faculty", "Department")
+        Semester = old.get_model("students", "Semester")
+        Student = old.get_model("students", "Student")
+
+        self.users = [User.objects.create(username=f"u{i}") for i in range(3)]
+        cse = AdminDepartment.objects.create(id=5, name="Computer Science", code="CSE")
+        FacultyDepartment.objects.create(name="CSE Department", code="cse")
+        phy = FacultyDepartment.objects.create(name="Physics", code="PHY")
+
+        # একই course তিন copy তে, code এর case আর spacing আলাদা
+        course = old.get_model("students", "Course").objects.create(
+            id=7, code="cse101", title="Intro (students)", credit=Decimal("3.0"), capacity=60)
+        old.get_model("admin_panel", "Course").objects.create(
+            code="CSE101 ", title="Intro (admin)", department=cse, semester_label="Fall 2025")
+        FacultyCourse = old.get_model("faculty", "Course")
+        FacultyCourse.objects.create(code="Cse101", title="Intro (faculty)", department=phy)
+        FacultyCourse.objects.create(code="PHY201", title="Waves", department=phy)
+
+        old.get_model("admin_panel", "Faculty").objects.create(
+            id=3, faculty_id="F-1", name="A", email="a@diu.edu.bd", user=self.users[0])
+        FacultyMember = old.get_model("faculty", "Faculty")
+        FacultyMember.objects.create(faculty_id="F-1-old", name="A", email="A@diu.edu.bd", user=self.users[1])
+        # users[0] আগেই F-1 এর; নতুন row টা user ছাড়া আসবে
+        FacultyMember.objects.create(faculty_id="F-2", name="B", email="b@diu.edu.bd", user=self.users[0],
+                                     department=phy)
+
+        term = Semester.objects.create(label="Fall 2091")
+        student = Student.objects.create(user=self.users[2], student_id="S-1", full_name="Student")
+        old.get_model("students", "Enrollment").objects.create(student=student, course=course, semester=term)
+        result = old.get_model("students", "SemesterResult").objects.create(student=student, semester=term,
+                                                                            gpa=Decimal("3.00"))
+        old.get_model("students", "ResultItem").objects.create(result=result, course=course, credit=Decimal("3.0"),
+                                                               grade="B", grade_point=Decimal("3.00"))
+
+    def test_merge(self):
+        new = migrate(MERGE)
+        Course = new.get_model("catalog", "Course")
+        Faculty = new.get_model("catalog", "Faculty")
+
+        departments = dict(new.get_model("catalog", "Department").objects.values_list("code", "id"))
+        self.assertEqual(departments, {"CSE": 5, "PHY": 6})
+
+        self.assertEqual(list(Course.objects.order_by("id").values_list("id", "code", "title", "department_id",
+                                                                         "semester_label", "capacity")),
+                         [(7, "cse101", "Intro (students)", 5, "Fall 2025", 60),
+                          (8, "PHY201", "Waves", 6, "", 40)])
+
+        self.assertEqual(list(Faculty.objects.order_by("id").values_list("id", "faculty_id", "department_id",
+                                                                          "user_id")),
+                         [(3, "F-1", None, self.users[0].pk), (4, "F-2", 6, None)])
+
+        migrate()
+        self.assertEqual(Enrollment.objects.get().course.code, "cse101")
+        self.assertEqual(ResultItem.objects.get().course_id, 7)
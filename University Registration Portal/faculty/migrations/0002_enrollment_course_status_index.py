@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('faculty', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['course', 'status'], name='fac_enroll_course_status'),
+        ),
+    ]
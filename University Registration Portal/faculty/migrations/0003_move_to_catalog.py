@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('faculty', '0002_enrollment_course_status_index'),
+        ('catalog', '0002_merge_legacy_catalog'),
+    ]
+
+    # departments/faculty/courses now live in catalog; the student/result copies were never read
+    operations = [
+        migrations.DeleteModel(
+            name='ResultItem',
+        ),
+        migrations.DeleteModel(
+            name='SemesterResult',
+        ),
+        migrations.DeleteModel(
+            name='Enrollment',
+        ),
+        migrations.DeleteModel(
+            name='Student',
+        ),
+        migrations.DeleteModel(
+            name='Course',
+        ),
+        migrations.DeleteModel(
+            name='Faculty',
+        ),
+        migrations.DeleteModel(
+            name='Department',
+        ),
+    ]
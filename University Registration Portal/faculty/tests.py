@@ -1,3 +1,64 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+
+from catalog.models import Course, Faculty
+from students import semesters
+from students.models import Enrollment, Semester, Student
+
+
+# ---- Approvals ----
+class ApproveRegistrationTests(TestCase):
+    """Every approval scope only touches the signed-in advisor's own pending rows."""
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        Semester.objects.update(is_current=False)
+        cls.term = Semester.objects.create(label='Fall 2095', code=953, season='fall', year=2095, is_current=True)
+        cls.courses = Course.objects.bulk_create([
+            Course(code=f'CSE95{i}', title=f'Course {i}', credit=Decimal('3.0')) for i in range(3)
+        ])
+        cls.advisors = []
+        for tag in ('a', 'b'):
+            user = User.objects.create_user(f'adv-{tag}', password='pw')
+            advisor = Faculty.objects.create(faculty_id=f'F-{tag}', name=tag, email=f'{tag}@example.com', user=user)
+            student = Student.objects.create(user=User.objects.create_user(f'st-{tag}', password='pw'),
+                                             student_id=f'S-{tag}', full_name=tag, advisor=advisor,
+                                             current_semester=cls.term)
+            Enrollment.objects.bulk_create([
+                Enrollment(student=student, course=c, semester=cls.term) for c in cls.courses
+            ])
+            cls.advisors.append((user, student))
+
+    def setUp(self):
+        semesters.clear()
+        self.client.force_login(self.advisors[0][0])
+
+    def pending(self, student):
+        return Enrollment.objects.filter(student=student, status='pending')
+
+    def test_selected_ignores_other_advisors_rows(self):
+        own, other = self.advisors[0][1], self.advisors[1][1]
+        ids = list(self.pending(own).values_list('id', flat=True)[:1])
+        ids += list(self.pending(other).values_list('id', flat=True))
+        self.client.post(reverse('approve-registrations'),
+                         {'action': 'approve', 'scope': 'selected', 'enrollment_ids': ids})
+        self.assertEqual(self.pending(own).count(), 2)
+        self.assertEqual(self.pending(other).count(), 3)
+
+    def test_one_and_student_ignore_other_advisors_rows(self):
+        other = self.advisors[1][1]
+        url = reverse('approve-registrations')
+        self.client.post(url, {'action': 'reject', 'scope': 'one', 'enrollment_id': self.pending(other).first().id})
+        self.client.post(url, {'action': 'reject', 'scope': 'student', 'student_id': other.id})
+        self.assertEqual(self.pending(other).count(), 3)
 
-# Create your tests here.
+    def test_cohort_only_touches_own_advisees(self):
+        own, other = self.advisors[0][1], self.advisors[1][1]
+        self.client.post(reverse('approve-registrations'), {'action': 'approve', 'scope': 'cohort'})
+        self.assertEqual(self.pending(own).count(), 0)
+        self.assertEqual(Enrollment.objects.filter(student=own, status='approved').count(), 3)
+        self.assertEqual(self.pending(other).count(), 3)
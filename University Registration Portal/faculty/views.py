@@ -1,35 +1,28 @@
 # faculty/views.py
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 from django.contrib.auth import authenticate, login, logout
 from django.contrib import messages
-from django.contrib.auth.decorators import login_required
-from django.contrib.auth.models import User
-from admin_panel.models import Faculty, Department, Course
 from students.models import Student, Enrollment
-import re
+from students.enrollment import decide_pending
+from students.semesters import current_term
+from accounts.principal import role_required
+from asgiref.sync import sync_to_async
+from registration_portal.stats import faculty_stats, invalidate_faculty
 
 # Faculty login view
 def faculty_login(request):
     if request.method == 'POST':
-        email = request.POST.get('email')
+        login_id = request.POST.get('username') or request.POST.get('email')  # email বা faculty ID
         password = request.POST.get('password')
-        
-        # Check if it's a faculty email
-        if not re.match(r'^[a-zA-Z0-9._%+-]+@diu\.edu\.bd$', email):
-            messages.error(request, "Please use your faculty email (@diu.edu.bd)")
-            return redirect('faculty-login')
-        
-        # Authenticate user
-        user = authenticate(request, username=email, password=password)
-        
+
+        # Authenticate user; faculty profile একই query তে আসে (accounts.backends)
+        user = authenticate(request, username=login_id, password=password)
+
         if user is not None:
-            # Check if user is associated with a faculty member
-            try:
-                faculty = Faculty.objects.get(user=user)
+            if getattr(user, 'faculty', None) is not None:
                 login(request, user)
                 return redirect('faculty-dashboard')
-            except Faculty.DoesNotExist:
-                messages.error(request, "No faculty profile found for this account")
+            messages.error(request, "No faculty profile found for this account")
         else:
             messages.error(request, "Invalid credentials")
     
@@ -41,110 +34,103 @@ def faculty_logout(request):
     return redirect('faculty-login')
 
 # Faculty dashboard view
-@login_required
+@role_required('faculty', 'faculty-login', "No faculty profile found")
 def dashboard(request):
-    try:
-        faculty = Faculty.objects.get(user=request.user)
-        
-        # Get advisees count
-        advisees_count = Student.objects.filter(advisor=faculty).count()
-        
-        # Get pending approvals count
-        current_semester = "Spring 2025"  # You might want to make this dynamic
-        pending_count = Enrollment.objects.filter(
-            student__advisor=faculty,
-            semester=current_semester,
-            status='pending'
-        ).count()
-        
-        # Get approved count for this semester
-        approved_count = Enrollment.objects.filter(
-            student__advisor=faculty,
-            semester=current_semester,
-            status='approved'
-        ).count()
-        
-        context = {
-            'faculty': faculty,
-            'advisees_count': advisees_count,
-            'pending_count': pending_count,
-            'approved_count': approved_count,
-            'active': 'dashboard'
-        }
-        return render(request, 'faculty/dashboard.html', context)
-    
-    except Faculty.DoesNotExist:
-        messages.error(request, "No faculty profile found")
-        return redirect('faculty-login')
+    faculty = request.principal.faculty
+    current_semester = current_term()
+
+    # advisees, pending আর approved একটাই query তে (cached)
+    context = {
+        'faculty': faculty,
+        **faculty_stats(faculty, current_semester),
+        'current_semester': current_semester,
+        'active': 'dashboard'
+    }
+    return render(request, 'faculty/dashboard.html', context)
+
+# Async dashboard (ASGI profile)
+@role_required('faculty', 'faculty-login', "No faculty profile found")
+async def dashboard_async(request):
+    faculty = request.principal.faculty
+    current_semester = await sync_to_async(current_term)()
+    stats = await sync_to_async(faculty_stats)(faculty, current_semester)
+
+    context = {
+        'faculty': faculty,
+        **stats,
+        'current_semester': current_semester,
+        'active': 'dashboard'
+    }
+    return await sync_to_async(render)(request, 'faculty/dashboard.html', context)
 
 # Student list view
-@login_required
+@role_required('faculty', 'faculty-login', "No faculty profile found")
 def student_list(request):
-    try:
-        faculty = Faculty.objects.get(user=request.user)
-        students = Student.objects.filter(advisor=faculty).order_by('student_id')
-        
-        context = {
-            'faculty': faculty,
-            'students': students,
-            'active': 'students'
-        }
-        return render(request, 'faculty/student_list.html', context)
+    faculty = request.principal.faculty
+    students = Student.objects.filter(advisor=faculty).select_related('current_semester').order_by('student_id')
     
-    except Faculty.DoesNotExist:
-        messages.error(request, "No faculty profile found")
-        return redirect('faculty-login')
+    context = {
+        'faculty': faculty,
+        'students': students,
+        'active': 'students'
+    }
+    return render(request, 'faculty/student_list.html', context)
 
 # Approve registrations view
-@login_required
+@role_required('faculty', 'faculty-login', "No faculty profile found")
 def approve_registration(request):
-    try:
-        faculty = Faculty.objects.get(user=request.user)
-        current_semester = "Spring 2025"  # Make this dynamic
-        
-        # Get pending enrollments for advisees
-        pending_enrollments = Enrollment.objects.filter(
-            student__advisor=faculty,
-            semester=current_semester,
-            status='pending'
-        ).select_related('student', 'course')
+    faculty = request.principal.faculty
+    current_semester = current_term()
+    
+    # Pending enrollments of this advisor's students; every action is scoped to it
+    advisee_pending = Enrollment.objects.filter(
+        student__advisor=faculty,
+        semester=current_semester,
+        status='pending'
+    )
+    
+    if request.method == 'POST':
+        # Handle approval/rejection, one set-based UPDATE per submit whatever the scope
+        action = request.POST.get('action')
+        scope = request.POST.get('scope', 'one')
         
-        # Group enrollments by student
-        enrollments_by_student = {}
-        for enrollment in pending_enrollments:
-            student_id = enrollment.student.id
-            if student_id not in enrollments_by_student:
-                enrollments_by_student[student_id] = {
-                    'student': enrollment.student,
-                    'enrollments': []
-                }
-            enrollments_by_student[student_id]['enrollments'].append(enrollment)
+        if scope == 'one':
+            ids = [request.POST.get('enrollment_id') or '']
+            targets = advisee_pending.filter(id__in=[i for i in ids if i.isdigit()])
+        elif scope == 'selected':
+            ids = request.POST.getlist('enrollment_ids')
+            targets = advisee_pending.filter(id__in=[i for i in ids if i.isdigit()])
+        elif scope == 'student':
+            student_id = request.POST.get('student_id') or ''
+            targets = advisee_pending.filter(student_id=student_id) if student_id.isdigit() else None
+        elif scope == 'cohort':
+            targets = advisee_pending
+        else:
+            targets = None
         
-        if request.method == 'POST':
-            # Handle approval/rejection
-            enrollment_id = request.POST.get('enrollment_id')
-            action = request.POST.get('action')
-            
-            if enrollment_id and action:
-                enrollment = get_object_or_404(Enrollment, id=enrollment_id)
-                if action == 'approve':
-                    enrollment.status = 'approved'
-                    enrollment.save()
-                    messages.success(request, f"Approved {enrollment.course.code} for {enrollment.student.full_name}")
-                elif action == 'reject':
-                    enrollment.status = 'rejected'
-                    enrollment.save()
-                    messages.success(request, f"Rejected {enrollment.course.code} for {enrollment.student.full_name}")
-            
-            return redirect('approve-registrations')
+        if targets is not None and action in ('approve', 'reject'):
+            changed = decide_pending(targets, action)
+            invalidate_faculty(faculty, current_semester)
+            verb = 'Approved' if action == 'approve' else 'Rejected'
+            messages.success(request, f"{verb} {changed} registration{'' if changed == 1 else 's'}")
         
-        context = {
-            'faculty': faculty,
-            'enrollments_by_student': enrollments_by_student.values(),
-            'active': 'approve'
-        }
-        return render(request, 'faculty/approve_reject.html', context)
+        return redirect('approve-registrations')
+    
+    # Group enrollments by student
+    enrollments_by_student = {}
+    for enrollment in advisee_pending.select_related('student', 'course'):
+        student_id = enrollment.student.id
+        if student_id not in enrollments_by_student:
+            enrollments_by_student[student_id] = {
+                'student': enrollment.student,
+                'enrollments': []
+            }
+        enrollments_by_student[student_id]['enrollments'].append(enrollment)
     
-    except Faculty.DoesNotExist:
-        messages.error(request, "No faculty profile found")
-        return redirect('faculty-login')
\ No newline at end of file
+    context = {
+        'faculty': faculty,
+        'enrollments_by_student': enrollments_by_student.values(),
+        'current_semester': current_semester,
+        'active': 'approve'
+    }
+    return render(request, 'faculty/approve_reject.html', context)
@@ -6,7 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'registration_portal.settings')
+    # test runner এর জন্য Redis লাগে না (registration_portal.settings_test)
+    default = 'registration_portal.settings_test' if sys.argv[1:2] == ['test'] else 'registration_portal.settings'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', default)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
@@ -3,6 +3,11 @@ ASGI config for registration_portal project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+It uses the ASGI profile (registration_portal.settings_asgi): async
+dashboards and a pooled Postgres connection, e.g.
+
+    uvicorn registration_portal.asgi:application --workers 4
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -11,6 +16,6 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'registration_portal.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'registration_portal.settings_asgi')
 
 application = get_asgi_application()
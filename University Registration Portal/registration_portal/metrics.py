@@ -0,0 +1,194 @@
+"""
+Per-view request, latency and SQL metrics in Prometheus text format.
+
+Every DB connection gets one execute wrapper when it is created; it adds
+each query's time to the timer of the request running in the current
+context (a ContextVar, so queries that async views push to worker threads
+with sync_to_async are counted too). MetricsMiddleware folds a request's
+totals into the process-wide registry under one short lock once the
+response is ready, so threaded WSGI workers never race and the per-query
+overhead is two perf_counter() calls. Every worker process keeps its own
+registry; Prometheus sums them when it scrapes each worker.
+"""
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpResponse, HttpResponseForbidden
+
+# seconds; the +Inf bucket is implicit
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNRESOLVED = "<unresolved>"
+
+_lock = threading.Lock()
+_views = {}  # view name -> _ViewStats
+_requests = {}  # (view name, method, status) -> count
+_current_timer = ContextVar("metrics_query_timer", default=None)
+
+
+class _ViewStats:
+    __slots__ = ("buckets", "latency_sum", "count", "queries", "sql_seconds")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.count = 0
+        self.queries = 0
+        self.sql_seconds = 0.0
+
+
+class _QueryTimer:
+    """একটা request এর query count আর SQL সময়; gather() এর worker thread গুলোও এখানে লেখে।"""
+    __slots__ = ("queries", "seconds", "lock")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+        self.lock = threading.Lock()
+
+    def add(self, seconds):
+        with self.lock:
+            self.queries += 1
+            self.seconds += seconds
+
+
+def _timed_execute(execute, sql, params, many, context):
+    timer = _current_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.add(time.perf_counter() - started)
+
+
+@receiver(connection_created)
+def _install_wrapper(sender, connection, **kwargs):
+    if _timed_execute not in connection.execute_wrappers:
+        # index 0: execute_wrapper() blocks pop() their own wrapper off the end
+        connection.execute_wrappers.insert(0, _timed_execute)
+
+
+def record(view, method, status, seconds, queries, sql_seconds):
+    with _lock:
+        stats = _views.get(view)
+        if stats is None:
+            stats = _views[view] = _ViewStats()
+        stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        stats.latency_sum += seconds
+        stats.count += 1
+        stats.queries += queries
+        stats.sql_seconds += sql_seconds
+        key = (view, method, status)
+        _requests[key] = _requests.get(key, 0) + 1
+
+
+def reset():
+    with _lock:
+        _views.clear()
+        _requests.clear()
+
+
+# ---- Middleware ----
+class MetricsMiddleware:
+    """Settings এর MIDDLEWARE এ সবার উপরে রাখতে হবে যাতে পুরো request এর সময় ধরা পড়ে।"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timer, token, started = self.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_timer.reset(token)
+        self.finish(request, response, timer, started)
+        return response
+
+    async def __acall__(self, request):
+        timer, token, started = self.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_timer.reset(token)
+        self.finish(request, response, timer, started)
+        return response
+
+    def start(self):
+        # connections opened before this module was imported missed connection_created
+        for conn in connections.all(initialized_only=True):
+            _install_wrapper(None, conn)
+        timer = _QueryTimer()
+        return timer, _current_timer.set(timer), time.perf_counter()
+
+    def finish(self, request, response, timer, started):
+        elapsed = time.perf_counter() - started
+        match = getattr(request, "resolver_match", None)
+        view = (match.view_name if match else None) or UNRESOLVED
+        record(view, request.method, response.status_code, elapsed, timer.queries, timer.seconds)
+
+
+# ---- Exposition ----
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_metrics():
+    """Registry কে Prometheus text exposition format (0.0.4) এ লেখে।"""
+    with _lock:
+        views = {name: (list(s.buckets), s.latency_sum, s.count, s.queries, s.sql_seconds)
+                 for name, s in _views.items()}
+        requests = dict(_requests)
+
+    lines = [
+        "# HELP portal_requests_total Requests handled, by URL name, method and status.",
+        "# TYPE portal_requests_total counter",
+    ]
+    for (view, method, status), count in sorted(requests.items()):
+        lines.append(f'portal_requests_total{{view="{_label(view)}",method="{_label(method)}",'
+                     f'status="{status}"}} {count}')
+
+    lines += [
+        "# HELP portal_request_duration_seconds Request latency, by URL name.",
+        "# TYPE portal_request_duration_seconds histogram",
+    ]
+    for view, (buckets, latency_sum, count, _, _) in sorted(views.items()):
+        v = _label(view)
+        cumulative = 0
+        for bound, n in zip(LATENCY_BUCKETS, buckets):
+            cumulative += n
+            lines.append(f'portal_request_duration_seconds_bucket{{view="{v}",le="{bound}"}} {cumulative}')
+        lines.append(f'portal_request_duration_seconds_bucket{{view="{v}",le="+Inf"}} {count}')
+        lines.append(f'portal_request_duration_seconds_sum{{view="{v}"}} {latency_sum:.6f}')
+        lines.append(f'portal_request_duration_seconds_count{{view="{v}"}} {count}')
+
+    lines += [
+        "# HELP portal_sql_queries_total SQL queries executed, by URL name.",
+        "# TYPE portal_sql_queries_total counter",
+    ]
+    lines += [f'portal_sql_queries_total{{view="{_label(view)}"}} {row[3]}' for view, row in sorted(views.items())]
+    lines += [
+        "# HELP portal_sql_seconds_total Time spent in SQL, by URL name.",
+        "# TYPE portal_sql_seconds_total counter",
+    ]
+    lines += [f'portal_sql_seconds_total{{view="{_label(view)}"}} {row[4]:.6f}' for view, row in sorted(views.items())]
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    # scraper কে login page এ redirect না করে সরাসরি 403
+    if not (request.user.is_authenticated and request.user.is_staff):
+        return HttpResponseForbidden("Staff only.")
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
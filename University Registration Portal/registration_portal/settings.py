@@ -28,6 +28,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'catalog',
     'students',
     'faculty',
     'admin_panel',
@@ -36,11 +37,14 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'registration_portal.static.StaticFilesMiddleware',
+    'registration_portal.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'accounts.principal.PrincipalMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -64,6 +68,10 @@ TEMPLATES = [
 ]
 #change korbo
 AUTH_USER_MODEL = 'accounts.CustomUser'
+
+# username, email, student ID বা faculty ID, সব login form এ একই backend (accounts.backends)
+AUTHENTICATION_BACKENDS = ['accounts.backends.IdentifierBackend']
+
 # settings.py
 
 
@@ -100,6 +108,17 @@ DATABASES = {
 }
 
 
+# Shared cache (needs the redis package). accounts.principal caches users here,
+# so every worker must see the same entries; see accounts.checks
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://127.0.0.1:6379/1',
+        'KEY_PREFIX': 'registration-portal',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -135,6 +154,17 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
 STATIC_URL = 'static/'
+STATICFILES_DIRS = [BASE_DIR / 'assets' / 'static']  # build_assets এর output + vendored fonts
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    # hashed names + .gz/.br siblings (registration_portal.static)
+    'staticfiles': {'BACKEND': 'registration_portal.static.PrecompressedManifestStorage'},
+}
+
+# Standalone Tailwind v3 CLI used by `manage.py build_assets`
+TAILWIND_CLI = 'tailwindcss'
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -142,4 +172,19 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
-EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
\ No newline at end of file
+EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+
+# Course catalog snapshots kept per worker process (students.catalog)
+CATALOG_CACHE_MAX_ENTRIES = 32
+
+# Seconds each worker keeps the Semester table in memory (students.semesters)
+SEMESTER_CACHE_TTL = 60
+
+# Seconds a user + profile "principal" stays cached (accounts.principal)
+PRINCIPAL_CACHE_TIMEOUT = 300
+
+# Seconds an identifier that matched no account is remembered (accounts.backends)
+LOGIN_MISS_CACHE_TTL = 60
+
+# Seconds faculty/admin dashboard counts stay fresh (registration_portal.stats)
+DASHBOARD_STATS_TTL = 30
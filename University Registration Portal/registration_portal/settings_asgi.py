@@ -0,0 +1,23 @@
+"""
+ASGI profile: the normal settings plus the async dashboard routes and a
+Postgres connection pool.
+
+Async views fan their reads out over several worker threads (see
+registration_portal.aio), so one request may hold a few connections at
+once; the pool (psycopg 3 + psycopg_pool) hands them out and takes them
+back instead of opening a new connection per thread.
+"""
+from .settings import *  # noqa: F401,F403
+
+ROOT_URLCONF = 'registration_portal.urls_async'
+
+# registration_portal.aio.gather এর worker thread; pool এর max_size এর সমান রাখা
+ASYNC_DB_THREADS = 20
+
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default']['CONN_MAX_AGE'] = 0  # pool এর সাথে persistent connection চলে না
+    DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+        'min_size': 2,
+        'max_size': 20,
+        'timeout': 10,
+    }
@@ -0,0 +1,116 @@
+"""
+Self-hosted static files: content-hashed names, precompressed variants and
+far-future caching, without a CDN or a separate web server.
+
+`manage.py build_assets` builds the CSS and runs collectstatic. The storage
+below is ManifestStaticFilesStorage (so {% static %} emits hashed names),
+and it also writes .gz and .br siblings of every text asset it hashes, so
+nothing is compressed per request. StaticFilesMiddleware serves STATIC_ROOT
+and picks the smallest variant the browser accepts. Hashed names get a
+one-year immutable Cache-Control; anything else gets a short max-age.
+"""
+import gzip
+import mimetypes
+import os
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.http import FileResponse
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # brotli optional; তখন শুধু gzip
+    brotli = None
+
+COMPRESSIBLE = {".css", ".js", ".svg", ".txt", ".json", ".map", ".html", ".xml"}
+MIN_SIZE = 256  # এর চেয়ে ছোট file compress করে লাভ নেই
+IMMUTABLE = "public, max-age=31536000, immutable"
+SHORT = "public, max-age=60"
+
+# (Accept-Encoding token, file suffix), best first
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def compress_file(path):
+    """Write path.gz (and path.br when brotli is installed); returns the written paths."""
+    data = Path(path).read_bytes()
+    if len(data) < MIN_SIZE:
+        return []
+    written = []
+    variants = [(".gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", lambda d: brotli.compress(d, quality=11)))
+    for suffix, compress in variants:
+        packed = compress(data)
+        if len(packed) < len(data):
+            Path(f"{path}{suffix}").write_bytes(packed)
+            written.append(f"{path}{suffix}")
+    return written
+
+
+class PrecompressedManifestStorage(ManifestStaticFilesStorage):
+    """Hashed names plus .gz/.br siblings, written once at collectstatic time."""
+
+    def post_process(self, *args, **kwargs):
+        yield from super().post_process(*args, **kwargs)
+        if kwargs.get("dry_run"):
+            return
+        for hashed in set(self.hashed_files.values()):
+            if os.path.splitext(hashed)[1] in COMPRESSIBLE and self.exists(hashed):
+                compress_file(self.path(hashed))
+
+
+# ---- Serving ----
+class StaticFilesMiddleware:
+    """MIDDLEWARE এর একদম উপরে; static request session/auth পর্যন্ত যায়ই না।"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.prefix = "/" + settings.STATIC_URL.lstrip("/")
+        self.root = Path(settings.STATIC_ROOT).resolve() if getattr(settings, "STATIC_ROOT", None) else None
+        self._hashed = None
+
+    def __call__(self, request):
+        response = self.serve(request)
+        if response is not None:
+            return response
+        return self.get_response(request)
+
+    def hashed_names(self):
+        if self._hashed is None:
+            # manifest না থাকলে (collectstatic হয়নি) কিছুই immutable নয়
+            self._hashed = set(getattr(staticfiles_storage, "hashed_files", {}).values())
+        return self._hashed
+
+    def serve(self, request):
+        if self.root is None or request.method not in ("GET", "HEAD") or not request.path.startswith(self.prefix):
+            return None
+        name = request.path[len(self.prefix):]
+        path = (self.root / name).resolve()
+        if not path.is_relative_to(self.root) or not path.is_file():
+            return None
+
+        accepted = {token.split(";")[0].strip() for token in request.headers.get("Accept-Encoding", "").split(",")}
+        served, encoding = path, None
+        if path.suffix in COMPRESSIBLE:
+            for token, suffix in ENCODINGS:
+                variant = path.with_name(path.name + suffix)
+                if token in accepted and variant.is_file():
+                    served, encoding = variant, token
+                    break
+
+        content_type, _ = mimetypes.guess_type(path.name)
+        response = FileResponse(open(served, "rb"), content_type=content_type or "application/octet-stream")
+        if encoding:
+            response["Content-Encoding"] = encoding
+        if path.suffix in COMPRESSIBLE:
+            patch_vary_headers(response, ("Accept-Encoding",))
+        response["Cache-Control"] = IMMUTABLE if name in self.hashed_names() else SHORT
+        return response
@@ -0,0 +1,108 @@
+"""
+Dashboard numbers, one query per dashboard, behind a short shared cache.
+
+Each dashboard's counts come from a single SELECT: the faculty counts use
+conditional aggregation (Count(filter=Q(...))) over the advisees joined to
+their enrollments, and the admin totals are one aggregate with two scalar
+subqueries.
+
+Results are cached for DASHBOARD_STATS_TTL seconds and then served stale for
+a while longer. When an entry goes stale, only the caller that wins
+cache.add() on the entry's lock key recomputes it; everyone else keeps
+getting the old numbers until the new ones are stored. On a cold key the
+others wait up to STATS_WAIT seconds for the winner instead of all hitting
+the database at once.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Subquery, Value
+
+from catalog.models import Course, Department, Faculty
+from students.models import Student
+
+STALE_FOR = 10  # stale entry এর বয়স TTL এর কত গুণ পর্যন্ত চলবে
+LOCK_TIMEOUT = 30  # winner মারা গেলে lock নিজেই ছেড়ে যায়
+STATS_WAIT = 2.0
+
+
+def _ttl():
+    return getattr(settings, "DASHBOARD_STATS_TTL", 30)
+
+
+def cached_stats(key, compute):
+    """compute() এর ফল cache থেকে; একসাথে অনেক request এলেও recompute একবারই।"""
+    entry = cache.get(key)  # (value, fresh_until)
+    if entry is not None and entry[1] > time.time():
+        return entry[0]
+
+    if cache.add(f"{key}:lock", 1, LOCK_TIMEOUT):
+        try:
+            value = compute()
+            cache.set(key, (value, time.time() + _ttl()), _ttl() * STALE_FOR)
+        finally:
+            cache.delete(f"{key}:lock")
+        return value
+
+    if entry is not None:
+        return entry[0]  # অন্য কেউ recompute করছে, ততক্ষণ পুরনোটাই
+
+    deadline = time.monotonic() + STATS_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+    return compute()
+
+
+def invalidate(key):
+    cache.delete(key)
+
+
+# ---- Faculty ----
+def faculty_key(faculty_id, semester_id):
+    return f"stats:faculty:{faculty_id}:{semester_id}"
+
+
+def compute_faculty_stats(faculty, semester):
+    this_term = Q(enrollments__semester=semester)
+    return Student.objects.filter(advisor=faculty).aggregate(
+        advisees_count=Count("pk", distinct=True),
+        pending_count=Count("enrollments", filter=this_term & Q(enrollments__status="pending")),
+        approved_count=Count("enrollments", filter=this_term & Q(enrollments__status="approved")),
+    )
+
+
+def faculty_stats(faculty, semester):
+    """{"advisees_count", "pending_count", "approved_count"} for one advisor and term."""
+    return cached_stats(faculty_key(faculty.pk, getattr(semester, "pk", None)),
+                        lambda: compute_faculty_stats(faculty, semester))
+
+
+def invalidate_faculty(faculty, semester):
+    invalidate(faculty_key(faculty.pk, getattr(semester, "pk", None)))
+
+
+# ---- Admin ----
+ADMIN_KEY = "stats:admin"
+
+
+def _total(model):
+    # GROUP BY এ শুধু constant, তাই খালি table এও একটা row আসে
+    return Subquery(model.objects.order_by().annotate(one=Value(1)).values("one")
+                    .annotate(n=Count("pk")).values("n"))
+
+
+def compute_admin_stats():
+    return Department.objects.order_by().annotate(one=Value(1)).values("one").annotate(
+        total_departments=Count("pk"),
+        total_courses=_total(Course),
+        total_faculty=_total(Faculty),
+    ).values("total_departments", "total_courses", "total_faculty").get()
+
+
+def admin_stats():
+    """Department, course and faculty totals for the admin dashboard."""
+    return cached_stats(ADMIN_KEY, compute_admin_stats)
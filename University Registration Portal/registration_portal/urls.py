@@ -1,11 +1,14 @@
 from django.contrib import admin
 from django.urls import path, include
+from .metrics import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls), 
     path('accounts/', include('accounts.urls')),
     path('students/', include('students.urls')),
     path('faculty/', include('faculty.urls')),
-    path('admin_panel/', include('admin_panel.urls'))
+    path('admin_panel/', include('admin_panel.urls')),
+    path('api/v1/', include('students.api')),
+    path('metrics', metrics_view, name='metrics'),
     
 ]
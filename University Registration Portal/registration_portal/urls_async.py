@@ -0,0 +1,18 @@
+"""
+URLconf of the ASGI profile: the dashboards are swapped for their async
+versions, every other route is the same as registration_portal.urls.
+"""
+from django.urls import path
+
+from admin_panel import views as admin_views
+from faculty import views as faculty_views
+from students import views as student_views
+
+from .urls import urlpatterns as sync_urlpatterns
+
+# আগে match হয় বলে একই নামের sync route গুলো shadow হয়ে যায়
+urlpatterns = [
+    path('students/dashboard/', student_views.dashboard_async, name='student-dashboard'),
+    path('faculty/dashboard/', faculty_views.dashboard_async, name='faculty-dashboard'),
+    path('admin_panel/dashboard/', admin_views.dashboard_async, name='admin-dashboard'),
+] + sync_urlpatterns
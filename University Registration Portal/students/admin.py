@@ -1,3 +1,10 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Semester
+
+
+@admin.register(Semester)
+class SemesterAdmin(admin.ModelAdmin):
+    list_display = ("label", "code", "season", "year", "start_date", "end_date", "is_current", "archived_at")
+    list_filter = ("season", "is_current")
+    search_fields = ("label",)
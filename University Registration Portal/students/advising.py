@@ -0,0 +1,144 @@
+"""
+Advisor auto-assignment, balanced across the faculty of each department.
+
+The whole student body is read once as (id, user_id, department, advisor_id)
+tuples and the faculty as (id, department_id). Each department's faculty sit
+in a min-heap keyed by advisee count, so every student who needs an advisor
+goes to the least loaded member in O(log f). Existing assignments are kept
+unless `rebalance` is set, in which case students advised from another
+department are moved to their own, and advisors above the department's fair
+share give their newest advisees back to the pool first. Only changed
+rows are written, with bulk_update.
+
+Student.department is free text holding a department code or name; it is
+matched to catalog.Department case-insensitively.
+"""
+import heapq
+import time
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+
+from accounts.principal import cache_key as principal_key
+from catalog.models import Department, Faculty
+from registration_portal.stats import faculty_key
+
+from .models import Student
+from .semesters import current_term
+
+WRITE_BATCH = 2000
+
+
+class AssignmentReport:
+    def __init__(self):
+        self.students = 0
+        self.faculty = 0
+        self.changed = 0
+        self.unmatched = 0  # department এ কোনো faculty নেই
+        self.departments = []  # (code, faculty, students, min load, max load)
+        self.seconds = {"load": 0.0, "balance": 0.0, "write": 0.0}
+
+    @property
+    def total_seconds(self):
+        return sum(self.seconds.values())
+
+
+def department_lookup():
+    """Student.department এর text -> Department id (code বা name, case-insensitive)।"""
+    lookup = {}
+    for pk, code, name in Department.objects.values_list("id", "code", "name"):
+        lookup[name.strip().lower()] = pk
+        lookup[code.strip().lower()] = pk
+    return lookup
+
+
+def balance(students, faculty, lookup, rebalance=False, report=None):
+    """
+    Pure part: `students` [(id, user_id, department text, advisor_id)],
+    `faculty` [(id, department_id)]. Returns {student_id: new advisor_id}
+    for the students whose advisor changes.
+    """
+    report = report or AssignmentReport()
+    members = defaultdict(list)
+    for fid, dept_id in faculty:
+        if dept_id is not None:
+            members[dept_id].append(fid)
+
+    by_dept = defaultdict(list)
+    for row in students:
+        dept_id = lookup.get((row[2] or "").strip().lower())
+        if dept_id in members:
+            by_dept[dept_id].append(row)
+        else:
+            report.unmatched += 1
+
+    changes = {}
+    for dept_id, rows in by_dept.items():
+        fids = members[dept_id]
+        advisees = {fid: [] for fid in fids}
+        pool = []
+        # id ছোট থেকে বড়: rebalance এ নতুন students আগে ছাড়া হয়
+        for sid, _, _, advisor_id in sorted(rows):
+            if advisor_id in advisees:
+                advisees[advisor_id].append(sid)
+            elif advisor_id is None or rebalance:
+                # অন্য department এর advisor শুধু rebalance এ বদলায়
+                pool.append(sid)
+
+        if rebalance:
+            share, extra = divmod(len(rows), len(fids))
+            # যাদের এখন সবচেয়ে বেশি advisee তারাই share + 1 রাখবে, তাতে সবচেয়ে কম student সরে
+            by_load = sorted(fids, key=lambda fid: -len(advisees[fid]))
+            for i, fid in enumerate(by_load):
+                cap = share + (1 if i < extra else 0)
+                if len(advisees[fid]) > cap:
+                    pool.extend(advisees[fid][cap:])
+                    del advisees[fid][cap:]
+
+        heap = [(len(advisees[fid]), fid) for fid in fids]
+        heapq.heapify(heap)
+        for sid in pool:
+            load, fid = heap[0]
+            heapq.heapreplace(heap, (load + 1, fid))
+            changes[sid] = fid
+
+        loads = [load for load, _ in heap]
+        report.departments.append((dept_id, len(fids), len(rows), min(loads), max(loads)))
+
+    current = {row[0]: row[3] for row in students}
+    return {sid: fid for sid, fid in changes.items() if current[sid] != fid}
+
+
+def auto_assign(rebalance=False, dry_run=False):
+    """Assign (and optionally rebalance) advisors for every student; returns an AssignmentReport."""
+    report = AssignmentReport()
+    started = time.perf_counter()
+    students = list(Student.objects.values_list("id", "user_id", "department", "advisor_id").iterator(chunk_size=5000))
+    faculty = list(Faculty.objects.values_list("id", "department_id"))
+    lookup = department_lookup()
+    report.students, report.faculty = len(students), len(faculty)
+    report.seconds["load"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    changes = balance(students, faculty, lookup, rebalance, report)
+    report.changed = len(changes)
+    report.seconds["balance"] = time.perf_counter() - started
+    codes = dict(Department.objects.values_list("id", "code"))
+    report.departments = sorted((codes.get(row[0], "-"),) + row[1:] for row in report.departments)
+    if dry_run or not changes:
+        return report
+
+    started = time.perf_counter()
+    with transaction.atomic():
+        Student.objects.bulk_update([Student(id=sid, advisor_id=fid) for sid, fid in changes.items()],
+                                    ["advisor"], batch_size=WRITE_BATCH)
+    # bulk_update signal পাঠায় না: cached principal আর faculty stats নিজেই ফেলে দিই
+    old = {row[0]: row[3] for row in students}
+    users = {row[0]: row[1] for row in students}
+    semester = current_term()
+    touched = set(changes.values()) | {old[sid] for sid in changes if old[sid] is not None}
+    cache.delete_many([principal_key(users[sid]) for sid in changes])
+    cache.delete_many([faculty_key(fid, getattr(semester, "pk", None)) for fid in touched])
+    report.seconds["write"] = time.perf_counter() - started
+    return report
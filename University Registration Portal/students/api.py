@@ -0,0 +1,218 @@
+"""
+Read-only JSON API (v1) for the mobile app: profile, enrollments, results
+and the course catalog of the logged-in student.
+
+Rows are read with values_list() over exactly the columns the requested
+`fields=` need, so no model instances are built and the template engine is
+skipped. A join is added only when a joined field is asked for, nested
+result items come from one batched query per page, older semesters'
+enrollments are read through students.history (live + archive tables), and
+the catalog is served from the in-process snapshot (students.catalog) with
+only the page's seat counts read live. Lists use forward cursor pagination:
+`?limit=` plus the `next` cursor from the previous page.
+"""
+from bisect import bisect_right
+from functools import wraps
+from operator import attrgetter
+
+from django.http import JsonResponse
+from django.urls import path
+
+from admin_panel.pagination import decode_cursor, make_cursor, page_size, seek_after
+
+from .catalog import course_catalog
+from .enrollment import seats_left
+from .history import enrollment_querysets, union_values
+from .models import ResultItem, SemesterResult
+from .semesters import semester_by_id, semester_by_label
+from .summary import get_summary
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def api_view(view):
+    """GET only, logged-in student only; errors come back as {"error": ...}."""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            if request.method != "GET":
+                raise ApiError(405, "Method not allowed")
+            principal = request.principal
+            if not principal.is_authenticated:
+                raise ApiError(401, "Authentication required")
+            if principal.student is None:
+                raise ApiError(403, "No student profile")
+            return JsonResponse(view(request, principal.student, *args, **kwargs))
+        except ApiError as e:
+            return JsonResponse({"error": e.message}, status=e.status)
+    return wrapper
+
+
+def requested_fields(request, available):
+    """`?fields=a,b` -> those names in `available` order; all of them when absent."""
+    raw = request.GET.get("fields")
+    if not raw:
+        return list(available)
+    wanted = {f.strip() for f in raw.split(",") if f.strip()}
+    unknown = wanted.difference(available)
+    if unknown:
+        raise ApiError(400, f"Unknown field(s): {', '.join(sorted(unknown))}")
+    return [f for f in available if f in wanted]
+
+
+def page_of(request, querysets, columns, names):
+    """
+    One page of `querysets` (a queryset, or a list read as one UNION ALL)
+    ordered by id as dicts of `names`; `columns` maps each name to its ORM
+    path. Returns {"data": [...], "next": cursor or None}.
+    """
+    if not isinstance(querysets, list):
+        querysets = [querysets]
+    size = page_size(request)
+    try:
+        querysets = [seek_after(qs, ["id"], request.GET.get("cursor")) for qs in querysets]
+    except ValueError as e:
+        raise ApiError(400, str(e))
+    paths = ["id"] + [columns[n] for n in names]
+    rows = list(union_values(querysets, paths)[:size + 1])
+    more = len(rows) > size
+    rows = rows[:size]
+    return {
+        "data": [dict(zip(names, row[1:])) for row in rows],
+        "next": make_cursor([rows[-1][0]]) if more else None,
+    }
+
+
+# ---- Profile ----
+PROFILE_FIELDS = ["student_id", "full_name", "department", "batch", "current_semester", "is_cleared_for_registration"]
+SUMMARY_FIELDS = ["completed_credits", "cgpa", "pending_count", "approved_count", "current_credit_load"]
+
+
+@api_view
+def profile(request, student):
+    names = requested_fields(request, PROFILE_FIELDS + SUMMARY_FIELDS)
+    semester = semester_by_id(student.current_semester_id)
+    data = {
+        "student_id": student.student_id,
+        "full_name": student.full_name,
+        "department": student.department,
+        "batch": student.batch,
+        "current_semester": semester.label if semester else None,
+        "is_cleared_for_registration": student.is_cleared_for_registration,
+    }
+    # summary এর primary-key read শুধু দরকার হলে
+    if any(n in SUMMARY_FIELDS for n in names):
+        summary = get_summary(student)
+        data.update({n: getattr(summary, n) for n in SUMMARY_FIELDS})
+    return {"data": {n: data[n] for n in names}}
+
+
+# ---- Enrollments ----
+ENROLLMENT_COLUMNS = {
+    "id": "id",
+    "course_code": "course__code",
+    "course_title": "course__title",
+    "credit": "course__credit",
+    "semester": "semester__label",
+    "status": "status",
+}
+
+
+@api_view
+def enrollments(request, student):
+    """`?semester=<label>` or `all`; the student's current semester by default."""
+    names = requested_fields(request, list(ENROLLMENT_COLUMNS))
+    semester = None
+    label = request.GET.get("semester")
+    if label != "all":
+        semester = semester_by_label(label) if label else semester_by_id(student.current_semester_id)
+        if semester is None:
+            return {"data": [], "next": None}
+    filters = {"student_id": student.pk}
+    if request.GET.get("status"):
+        filters["status"] = request.GET["status"]
+    return page_of(request, enrollment_querysets(semester, **filters), ENROLLMENT_COLUMNS, names)
+
+
+# ---- Results ----
+RESULT_COLUMNS = {"id": "id", "semester": "semester__label", "gpa": "gpa"}
+ITEM_COLUMNS = {
+    "course_code": "course__code",
+    "course_title": "course__title",
+    "credit": "credit",
+    "grade": "grade",
+    "grade_point": "grade_point",
+}
+
+
+@api_view
+def results(request, student):
+    names = requested_fields(request, list(RESULT_COLUMNS) + ["items"])
+    page = page_of(request, SemesterResult.objects.filter(student=student), RESULT_COLUMNS,
+                   [n for n in names if n != "items"] + (["id"] if "id" not in names else []))
+    if "items" in names:
+        # prefetch_related এর মতো: পুরো page এর item একটাই query তে
+        ids = [r["id"] for r in page["data"]]
+        grouped = {rid: [] for rid in ids}
+        rows = ResultItem.objects.filter(result_id__in=ids).order_by("result_id", "course__code")\
+            .values_list("result_id", *ITEM_COLUMNS.values())
+        for rid, *values in rows:
+            grouped[rid].append(dict(zip(ITEM_COLUMNS, values)))
+        for r in page["data"]:
+            r["items"] = grouped[r["id"]]
+    if "id" not in names:
+        for r in page["data"]:
+            del r["id"]
+    return page
+
+
+# ---- Catalog ----
+COURSE_FIELDS = ["id", "code", "title", "credit", "capacity", "seats_left"]
+
+
+@api_view
+def courses(request, student):
+    """
+    The whole catalog ordered by code, paged over the in-process snapshot.
+    seats_left (in the student's current semester) is read live for the
+    page's ids, since seat claims never bump the catalog version.
+    """
+    names = requested_fields(request, COURSE_FIELDS)
+    size = page_size(request)
+    try:
+        after = decode_cursor(request.GET.get("cursor"), 1)
+    except ValueError as e:
+        raise ApiError(400, str(e))
+    snapshot = course_catalog()
+    catalog = snapshot.courses
+    if after is None:
+        start = 0
+    elif after[0] in snapshot.positions:
+        start = snapshot.positions[after[0]] + 1
+    else:
+        # cursor এর course টা এর মধ্যে মুছে গেছে; DB order আর Python order এখানে মিলবে ধরে নিই
+        start = bisect_right(catalog, after[0], key=attrgetter("code"))
+    chunk = catalog[start:start + size]
+    more = start + size < len(catalog)
+    data = [{n: getattr(c, n) for n in names if n != "seats_left"} for c in chunk]
+    if "seats_left" in names:
+        live = seats_left([c.id for c in chunk], student.current_semester_id)
+        for row, c in zip(data, chunk):
+            row["seats_left"] = live.get(c.id, 0)
+    return {
+        "data": data,
+        "next": make_cursor([chunk[-1].code]) if more else None,
+    }
+
+
+urlpatterns = [
+    path("me", profile, name="api-profile"),
+    path("enrollments", enrollments, name="api-enrollments"),
+    path("results", results, name="api-results"),
+    path("courses", courses, name="api-courses"),
+]
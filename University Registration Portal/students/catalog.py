@@ -0,0 +1,86 @@
+"""
+Versioned, per-process cache for the course catalog.
+
+Every catalog write bumps CatalogVersion inside the writer's transaction.
+Readers do one primary-key read of that row per lookup and only reuse a
+snapshot built for exactly the same version, so a reader can never be served
+a catalog older than the last committed edit.
+"""
+import threading
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from catalog.models import Course
+
+from .models import CatalogVersion
+
+_lock = threading.Lock()
+_snapshots = OrderedDict()  # key -> (version, value), least recently used first
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _max_entries():
+    return getattr(settings, "CATALOG_CACHE_MAX_ENTRIES", 32)
+
+
+def current_version():
+    version = CatalogVersion.objects.filter(pk=1).values_list("version", flat=True).first()
+    return version or 0
+
+
+def bump_version():
+    """Catalog এ write হলে call করতে হবে, writer এর transaction এর ভেতরেই।"""
+    if not CatalogVersion.objects.filter(pk=1).update(version=F("version") + 1, changed_at=timezone.now()):
+        CatalogVersion.objects.get_or_create(pk=1, defaults={"version": 1})
+
+
+def cached(key, loader):
+    """Return loader() for the current catalog version, building it at most once per version."""
+    version = current_version()
+    with _lock:
+        entry = _snapshots.get(key)
+        if entry is not None and entry[0] == version:
+            _snapshots.move_to_end(key)
+            _stats["hits"] += 1
+            return entry[1]
+        _stats["misses"] += 1
+
+    value = loader()
+    with _lock:
+        _snapshots[key] = (version, value)
+        _snapshots.move_to_end(key)
+        while len(_snapshots) > _max_entries():
+            _snapshots.popitem(last=False)
+            _stats["evictions"] += 1
+    return value
+
+
+def stats():
+    with _lock:
+        return dict(_stats, entries=len(_snapshots))
+
+
+def clear():
+    with _lock:
+        _snapshots.clear()
+
+
+# ---- Catalog reads ----
+CatalogSnapshot = namedtuple("CatalogSnapshot", ["courses", "total_credits", "positions"])
+
+
+def _load_snapshot():
+    courses = tuple(Course.objects.order_by("code"))
+    return CatalogSnapshot(
+        courses=courses,
+        total_credits=sum((c.credit for c in courses), 0),
+        positions={c.code: i for i, c in enumerate(courses)},  # API cursor -> index
+    )
+
+
+def course_catalog():
+    """Every course ordered by code plus their credit total; one version check per call."""
+    return cached("courses", _load_snapshot)
@@ -0,0 +1,114 @@
+"""
+Conditional GET for the result and registration (course catalog) pages.
+
+Each page gets an ETag built from the versions its content depends on (the
+student's ResultVersion, the CatalogVersion, the student's summary and, on
+the registration page, waitlist places and full courses) plus the session
+key and CSRF secret, and a Last-Modified from the same rows. A repeat
+request whose If-None-Match still matches is answered with 304 Not Modified
+after a few small indexed reads, without running the page's queries or
+rendering its template.
+
+The pages are per student, so responses carry Vary: Cookie and
+Cache-Control: private, no-cache. "private" keeps shared caches out, and
+"no-cache" makes the browser revalidate every time instead of guessing a
+freshness lifetime from Last-Modified.
+"""
+import hashlib
+from functools import wraps
+
+from django.contrib import messages
+from django.db.models import F
+from django.middleware.csrf import get_token
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from .models import CatalogVersion, CourseSeats, ResultVersion, StudentSummary, WaitlistEntry
+
+
+# ---- Versions ----
+def bump_results(student_ids):
+    """Result বা item এ write হলে ওই student দের result version বাড়ায়।"""
+    student_ids = {sid for sid in student_ids if sid is not None}
+    if not student_ids:
+        return
+    now = timezone.now()
+    updated = ResultVersion.objects.filter(student_id__in=student_ids)\
+        .update(version=F("version") + 1, changed_at=now)
+    if updated < len(student_ids):
+        ResultVersion.objects.bulk_create(
+            [ResultVersion(student_id=sid, version=1, changed_at=now) for sid in student_ids],
+            ignore_conflicts=True,
+        )
+
+
+def result_state(request):
+    student = request.principal.student
+    if student is None:
+        return None
+    version, changed_at = ResultVersion.objects.filter(pk=student.pk)\
+        .values_list("version", "changed_at").first() or (0, None)
+    return ("result", student.pk, request.GET.get("sem", ""), version), changed_at
+
+
+def registration_state(request):
+    student = request.principal.student
+    if student is None:
+        return None
+    version, catalog_at = CatalogVersion.objects.filter(pk=1)\
+        .values_list("version", "changed_at").first() or (0, None)
+    # enrollments আর clearance বদলালে summary refresh হয়, তাই updated_at ই যথেষ্ট
+    summary_at = StudentSummary.objects.filter(pk=student.pk).values_list("updated_at", flat=True).first()
+    # waitlist এর জায়গা আর কোন course full, এগুলো অন্যদের write এ বদলায়
+    places = tuple(WaitlistEntry.objects.filter(student_id=student.pk).order_by("waitlist_id")
+                   .values_list("waitlist_id", F("position") - F("waitlist__promoted")))
+    full = tuple(CourseSeats.objects.filter(semester_id=student.current_semester_id, taken__gte=F("course__capacity"))
+                 .order_by("course_id").values_list("course_id", flat=True))
+    changed = [t for t in (catalog_at, summary_at) if t is not None]
+    # places/full এর কোনো timestamp নেই, তাই ওরা বদলালে শুধু ETag বদলায়
+    return ("registration", student.pk, version, summary_at, places, full), max(changed) if changed else None
+
+
+# ---- Decorator ----
+def _state(request, state_func):
+    if not hasattr(request, "_conditional_state"):
+        state = None
+        # flash message থাকলে পুরো page দেখাতেই হবে
+        if not len(messages.get_messages(request)):
+            state = state_func(request)
+        request._conditional_state = state
+    return request._conditional_state
+
+
+def conditional_page(state_func):
+    """
+    ETag / Last-Modified for a per-student page. `state_func(request)` returns
+    (parts, last_modified) or None to always render the page in full.
+    """
+    def etag(request, *args, **kwargs):
+        state = _state(request, state_func)
+        if state is None:
+            return None
+        get_token(request)  # প্রথম visit এ এখনই secret বানাই, যাতে পরের request এ ETag একই থাকে
+        parts = state[0] + (
+            request.session.session_key,
+            request.META.get("CSRF_COOKIE"),  # cached form এর csrf token টাও valid থাকতে হবে
+        )
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    def last_modified(request, *args, **kwargs):
+        state = _state(request, state_func)
+        return state[1] if state else None
+
+    def decorator(view):
+        conditional_view = condition(etag_func=etag, last_modified_func=last_modified)(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            patch_vary_headers(response, ("Cookie",))
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,340 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, F, OuterRef, Q, Subquery, When
+from django.db.models.functions import Coalesce
+
+from catalog.models import Course
+
+from .models import CourseSeats, Enrollment, Waitlist, WaitlistEntry
+from .summary import mark_dirty
+
+
+class EnrollmentError(Exception):
+    """Base class for a registration submission that was refused."""
+    message = "Registration failed."
+
+    def __init__(self, message=None):
+        super().__init__(message or self.message)
+
+
+class NotCleared(EnrollmentError):
+    message = "You are not cleared to register for this semester."
+
+
+class CourseFull(EnrollmentError):
+    message = "No seats left in this course."
+
+
+class AlreadyEnrolled(EnrollmentError):
+    message = "You have already registered for this course."
+
+
+class NoSemester(EnrollmentError):
+    message = "No semester is open for registration."
+
+
+class EmptyCart(EnrollmentError):
+    message = "Select at least one course."
+
+
+class SeatsAvailable(EnrollmentError):
+    message = "This course still has seats; register for it instead."
+
+
+class AlreadyWaitlisted(EnrollmentError):
+    message = "You are already on the waitlist for this course."
+
+
+def enroll(student, course_id, semester=None):
+    """
+    Student কে একটা course এ pending enrollment দেয়, seat capacity মেনে।
+
+    The enrollment row is inserted first so a duplicate submission fails on
+    the (student, course, semester) unique constraint without touching the
+    seat counter at all. The seat is then claimed with a conditional UPDATE
+    of that semester's CourseSeats row, which is locked only for the few
+    microseconds left before commit; concurrent submitters for other
+    courses never wait.
+    """
+    if not student.is_cleared_for_registration:
+        raise NotCleared()
+    semester_id = semester.pk if semester is not None else student.current_semester_id
+    if semester_id is None:
+        raise NoSemester()
+    capacity = Course.objects.filter(pk=course_id).values_list("capacity", flat=True).first()
+    if capacity is None:
+        raise Course.DoesNotExist(f"Course {course_id} does not exist.")
+
+    try:
+        with transaction.atomic():
+            enrollment = Enrollment.objects.create(
+                student=student, course_id=course_id, semester_id=semester_id, status="pending",
+            )
+            _ensure_seat_rows([course_id], semester_id)
+            # capacity literal রাখি: একটাই table এর conditional UPDATE, lock এর পরে আবার check হয়
+            claimed = CourseSeats.objects.filter(course_id=course_id, semester_id=semester_id, taken__lt=capacity)\
+                .update(taken=F("taken") + 1)
+            if not claimed:
+                # raising rolls back the enrollment row inserted above
+                raise CourseFull()
+    except IntegrityError:
+        raise AlreadyEnrolled()
+    return enrollment
+
+
+def enroll_many(student, course_ids, semester=None):
+    """
+    Registration cart: সব course একসাথে pending, নয়তো একটাও না।
+
+    Returns the new enrollments. The semester's seat rows are locked in
+    course order with one SELECT ... FOR UPDATE; ordered locking means two
+    carts sharing courses queue instead of deadlocking. The enrollments
+    then go in with one bulk_create and the seats with one UPDATE, all in
+    one transaction.
+    """
+    if not student.is_cleared_for_registration:
+        raise NotCleared()
+    semester_id = semester.pk if semester is not None else student.current_semester_id
+    if semester_id is None:
+        raise NoSemester()
+    course_ids = sorted(set(course_ids))
+    if not course_ids:
+        raise EmptyCart()
+    courses = list(Course.objects.filter(pk__in=course_ids).order_by("pk").only("id", "code", "capacity"))
+    if len(courses) != len(course_ids):
+        missing = set(course_ids) - {c.pk for c in courses}
+        raise Course.DoesNotExist(f"Course(s) {sorted(missing)} do not exist.")
+
+    try:
+        with transaction.atomic():
+            taken = lock_seats(course_ids, semester_id)
+            full = [c.code for c in courses if taken[c.pk] >= c.capacity]
+            if full:
+                raise CourseFull(f"No seats left in {', '.join(full)}.")
+
+            enrollments = Enrollment.objects.bulk_create([
+                Enrollment(student=student, course=c, semester_id=semester_id, status="pending") for c in courses
+            ])
+            claim_seats({cid: 1 for cid in course_ids}, semester_id)
+            # bulk_create post_save পাঠায় না
+            mark_dirty([student.pk])
+    except IntegrityError:
+        taken = sorted(Enrollment.objects.filter(student=student, semester_id=semester_id, course_id__in=course_ids)
+                       .values_list("course__code", flat=True))
+        raise AlreadyEnrolled(f"You have already registered for {', '.join(taken)}." if taken else None)
+    return enrollments
+
+
+# ---- Seats ----
+def _ensure_seat_rows(course_ids, semester_id):
+    # semester এ course টা প্রথমবার ছুঁলে counter row, INSERT ... ON CONFLICT DO NOTHING
+    CourseSeats.objects.bulk_create([CourseSeats(course_id=cid, semester_id=semester_id) for cid in course_ids],
+                                    ignore_conflicts=True)
+
+
+def lock_seats(course_ids, semester_id):
+    """{course_id: taken} for `semester_id`, seat rows locked in course order (call inside a transaction)."""
+    course_ids = sorted(set(course_ids))
+    _ensure_seat_rows(course_ids, semester_id)
+    return dict(CourseSeats.objects.filter(course_id__in=course_ids, semester_id=semester_id)
+                .order_by("course_id").select_for_update().values_list("course_id", "taken"))
+
+
+def release_seats(seats_by_course, semester_id):
+    """{course_id: n} অনুযায়ী semester এর taken কমায়, সব course এক UPDATE এ।"""
+    _shift_seats({cid: -n for cid, n in seats_by_course.items()}, semester_id)
+
+
+def claim_seats(seats_by_course, semester_id):
+    """{course_id: n} অনুযায়ী semester এর taken বাড়ায়, সব course এক UPDATE এ (capacity caller দেখে নেয়)।"""
+    _shift_seats(seats_by_course, semester_id)
+
+
+def _shift_seats(delta_by_course, semester_id):
+    delta_by_course = {cid: n for cid, n in delta_by_course.items() if n}
+    if not delta_by_course:
+        return
+    CourseSeats.objects.filter(course_id__in=delta_by_course, semester_id=semester_id).update(taken=Case(
+        *[When(course_id=cid, then=F("taken") + n) for cid, n in delta_by_course.items()],
+        default=F("taken"),
+        output_field=models.PositiveIntegerField(),
+    ))
+
+
+def seats_left(course_ids, semester_id):
+    """{course_id: খালি seat} ঐ semester এ, DB থেকে সরাসরি; seat claim/release catalog version বাড়ায় না।"""
+    taken = CourseSeats.objects.filter(course=OuterRef("pk"), semester_id=semester_id).values("taken")
+    rows = Course.objects.filter(pk__in=course_ids)\
+        .values_list("pk", "capacity", Coalesce(Subquery(taken), 0))
+    return {pk: max(capacity - n, 0) for pk, capacity, n in rows}
+
+
+def full_course_ids(semester_id):
+    """ঐ semester এ যে course গুলোতে seat নেই (catalog snapshot এর seat count পুরনো হতে পারে)।"""
+    return frozenset(CourseSeats.objects.filter(semester_id=semester_id, taken__gte=F("course__capacity"))
+                     .values_list("course_id", flat=True))
+
+
+def decide_pending(enrollments, action):
+    """
+    Approve or reject every pending enrollment in the given queryset with one
+    set-based UPDATE and return how many rows changed. Rejecting also gives
+    the seats back to their courses, and on to their waitlists.
+    """
+    if action not in ("approve", "reject"):
+        raise ValueError(f"Unknown action {action!r}")
+    pending = enrollments.filter(status="pending")
+
+    with transaction.atomic():
+        # lock the rows so seats and summaries follow exactly the rows we flip
+        rows = list(pending.select_for_update(of=("self",)).values_list("id", "course_id", "student_id", "semester_id"))
+        if not rows:
+            return 0
+        changed = Enrollment.objects.filter(id__in=[r[0] for r in rows])\
+            .update(status="approved" if action == "approve" else "rejected")
+        if action == "reject":
+            free_seats((course_id, semester_id) for _, course_id, _, semester_id in rows)
+        mark_dirty(r[2] for r in rows)
+    return changed
+
+
+def drop(student, enrollment_ids):
+    """Student নিজের current semester এর enrollment ছেড়ে দেয়; seat waitlist এ যায়। Returns rows dropped."""
+    with transaction.atomic():
+        mine = Enrollment.objects.filter(student=student, id__in=enrollment_ids,
+                                         semester_id=student.current_semester_id).exclude(status="rejected")
+        rows = list(mine.select_for_update().values_list("course_id", "semester_id"))
+        if not rows:
+            return 0
+        mine.delete()  # post_delete summary টা refresh করায়
+        free_seats(rows)
+    return len(rows)
+
+
+def free_seats(rows):
+    """প্রতিটা (course_id, semester_id) row এ একটা seat ফেরত, তারপর সেই semester এর waitlist থেকে promotion।"""
+    by_semester = {}
+    for course_id, semester_id in rows:
+        seats = by_semester.setdefault(semester_id, {})
+        seats[course_id] = seats.get(course_id, 0) + 1
+    for semester_id, seats_by_course in by_semester.items():
+        release_seats(seats_by_course, semester_id)
+        promote_waitlists(seats_by_course, semester_id)
+
+
+# ---- Waitlist ----
+def join_waitlist(student, course_id, semester=None):
+    """
+    Full course এর line এর শেষে দাঁড়ায়; returns the WaitlistEntry.
+
+    The semester's seat row is locked before the queue row, the same order
+    promote_waitlists uses, so a seat freed while we join is either already
+    visible here (SeatsAvailable) or promoted to us right after.
+    """
+    if not student.is_cleared_for_registration:
+        raise NotCleared()
+    semester_id = semester.pk if semester is not None else student.current_semester_id
+    if semester_id is None:
+        raise NoSemester()
+    capacity = Course.objects.filter(pk=course_id).values_list("capacity", flat=True).first()
+    if capacity is None:
+        raise Course.DoesNotExist(f"Course {course_id} does not exist.")
+
+    with transaction.atomic():
+        if lock_seats([course_id], semester_id)[course_id] < capacity:
+            raise SeatsAvailable()
+        if Enrollment.objects.filter(student=student, course_id=course_id, semester_id=semester_id).exists():
+            raise AlreadyEnrolled()
+        Waitlist.objects.get_or_create(course_id=course_id, semester_id=semester_id)
+        waitlist = Waitlist.objects.select_for_update().get(course_id=course_id, semester_id=semester_id)
+        # queue row lock এ আছি, তাই এই check আর insert এর মাঝে কেউ ঢুকতে পারে না
+        if WaitlistEntry.objects.filter(waitlist=waitlist, student=student).exists():
+            raise AlreadyWaitlisted()
+        waitlist.issued += 1
+        waitlist.save(update_fields=["issued"])
+        entry = WaitlistEntry.objects.create(waitlist=waitlist, student=student, position=waitlist.issued)
+    return entry
+
+
+def leave_waitlist(student, course_id, semester=None):
+    """Line থেকে বের হয়; পেছনের সবাই এক ঘর আগায়, তাই positions এ gap থাকে না। Returns False if not waiting."""
+    semester_id = semester.pk if semester is not None else student.current_semester_id
+    with transaction.atomic():
+        waitlist = Waitlist.objects.select_for_update().filter(course_id=course_id, semester_id=semester_id).first()
+        entry = waitlist and WaitlistEntry.objects.filter(waitlist=waitlist, student=student).first()
+        if not entry:
+            return False
+        entry.delete()
+        WaitlistEntry.objects.filter(waitlist=waitlist, position__gt=entry.position)\
+            .update(position=F("position") - 1)
+        waitlist.issued -= 1
+        waitlist.save(update_fields=["issued"])
+    return True
+
+
+def promote_waitlists(course_ids, semester_id):
+    """
+    Fill the free seats of `course_ids` from the heads of their waitlists in
+    one transaction; returns the promoted (student_id, course_id) pairs.
+
+    Each round reads the next heads of every queue with one query (positions
+    are gap-free, so the first k entries are simply positions promoted+1 ..
+    promoted+k). A head who is already enrolled in that course gives up the
+    place without taking a seat. The writes then go in as one bulk_create
+    of pending enrollments, one seat UPDATE, one DELETE of the served
+    entries and one bulk_update of the queue counters.
+    """
+    capacity = dict(Course.objects.filter(pk__in=set(course_ids)).values_list("pk", "capacity"))
+    with transaction.atomic():
+        taken = lock_seats(capacity, semester_id)
+        free = {cid: capacity[cid] - n for cid, n in taken.items() if n < capacity[cid]}
+        if not free:
+            return []
+        queues = list(Waitlist.objects.filter(course_id__in=free, semester_id=semester_id, issued__gt=F("promoted"))
+                      .order_by("pk").select_for_update())
+
+        promoted, served, moved = [], [], []
+        while True:
+            heads = [q for q in queues if free[q.course_id] > 0 and q.length > 0]
+            if not heads:
+                break
+            next_heads = Q()
+            for q in heads:
+                # আগের round এ served entries এখনো delete হয়নি, তাই নিচের সীমাও লাগে
+                next_heads |= Q(waitlist=q, position__gt=q.promoted, position__lte=q.promoted + free[q.course_id])
+            rows = list(WaitlistEntry.objects.filter(next_heads).order_by("waitlist_id", "position")
+                        .values_list("id", "waitlist_id", "student_id"))
+            if not rows:
+                break
+            by_id = {q.pk: q for q in heads}
+            enrolled = set(Enrollment.objects.filter(semester_id=semester_id, course_id__in=[q.course_id for q in heads],
+                                                     student_id__in=[r[2] for r in rows])
+                           .values_list("student_id", "course_id"))
+            for entry_id, waitlist_id, student_id in rows:
+                queue = by_id[waitlist_id]
+                queue.promoted += 1
+                served.append(entry_id)
+                if (student_id, queue.course_id) not in enrolled:
+                    free[queue.course_id] -= 1
+                    promoted.append((student_id, queue.course_id))
+            moved.extend(heads)
+
+        if not served:
+            return []
+        Enrollment.objects.bulk_create([
+            Enrollment(student_id=sid, course_id=cid, semester_id=semester_id, status="pending") for sid, cid in promoted
+        ])
+        seats_by_course = {}
+        for _, course_id in promoted:
+            seats_by_course[course_id] = seats_by_course.get(course_id, 0) + 1
+        claim_seats(seats_by_course, semester_id)
+        WaitlistEntry.objects.filter(id__in=served).delete()
+        Waitlist.objects.bulk_update(set(moved), ["promoted"])
+        # bulk_create post_save পাঠায় না
+        mark_dirty(sid for sid, _ in promoted)
+    return promoted
+
+
+def waitlist_places(student, semester_id):
+    """Student এর waitlist entries, course আর queue সহ একটাই query; `entry.place` এ line এর অবস্থান।"""
+    return list(WaitlistEntry.objects.select_related("waitlist__course")
+                .filter(student=student, waitlist__semester_id=semester_id).order_by("waitlist__course__code"))
@@ -0,0 +1,57 @@
+"""
+GPA engine: SemesterResult.gpa and the CGPA are derived from ResultItem.
+
+GPA = sum(credit * grade_point) / sum(credit), rounded half-up to two places
+before it is saved, so the DecimalField(3, 2) column never has to round it
+again and every backend stores the same value.
+"""
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import transaction
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum
+
+from .conditional import bump_results
+from .models import ResultItem, SemesterResult
+
+TWO_PLACES = Decimal("0.01")
+ZERO = Decimal("0.00")
+
+POINTS = ExpressionWrapper(F("credit") * F("grade_point"), output_field=DecimalField(max_digits=7, decimal_places=3))
+
+
+def quantize_gpa(points, credits):
+    if not credits:
+        return ZERO
+    return (Decimal(points) / Decimal(credits)).quantize(TWO_PLACES, rounding=ROUND_HALF_UP)
+
+
+def grouped_gpas(items, key):
+    """items কে `key` ধরে group করে {key: gpa}, একটাই aggregate query তে।"""
+    rows = items.values(key).order_by().annotate(points=Sum(POINTS), credits=Sum("credit"))\
+        .values_list(key, "points", "credits")
+    return {k: quantize_gpa(points, credits) for k, points, credits in rows}
+
+
+def recompute_results(results):
+    """
+    Recompute the GPA of the given SemesterResult queryset and write back only
+    the ones that changed; returns how many were updated. Results with no
+    items keep their stored GPA (older rows were entered by hand).
+    """
+    rows = list(results.values_list("id", "gpa"))
+    if not rows:
+        return 0
+    gpas = grouped_gpas(ResultItem.objects.filter(result__in=results), "result_id")
+    changed = [SemesterResult(id=rid, gpa=gpas[rid]) for rid, old in rows if rid in gpas and gpas[rid] != old]
+    if changed:
+        SemesterResult.objects.bulk_update(changed, ["gpa"], batch_size=1000)
+        # bulk_update এ signal নেই, result page এর ETag নিজেরাই বদলাই
+        bump_results(SemesterResult.objects.filter(id__in=[r.id for r in changed])
+                     .values_list("student_id", flat=True).distinct())
+    return len(changed)
+
+
+def mark_result_dirty(result_id):
+    """Item বদলালে শুধু ওই result টার GPA, transaction commit হওয়ার পর।"""
+    if result_id is not None:
+        transaction.on_commit(lambda: recompute_results(SemesterResult.objects.filter(pk=result_id)))
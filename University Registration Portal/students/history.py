@@ -0,0 +1,36 @@
+"""
+One read path over live and archived enrollments.
+
+`manage.py archive_semester` moves the enrollments of closed semesters from
+Enrollment into ArchivedEnrollment (same ids and columns), so the hot table
+only holds the semesters people still register in. Code that reads the
+current semester keeps using Enrollment directly. Code that may read an
+older semester, or every semester, goes through here: a query for the
+current term touches Enrollment only, anything else is a UNION ALL over both
+tables, which stays correct while an archive run is halfway through.
+"""
+from .models import ArchivedEnrollment, Enrollment
+from .semesters import current_term
+
+
+def enrollment_sources(semester=None):
+    """The model(s) holding `semester`'s enrollments; every semester when None."""
+    current = current_term()
+    if semester is not None and current is not None and semester.pk == current.pk:
+        return [Enrollment]
+    return [Enrollment, ArchivedEnrollment]
+
+
+def enrollment_querysets(semester=None, **filters):
+    """One filtered queryset per source table, ready for union_values()."""
+    if semester is not None:
+        filters["semester_id"] = semester.pk
+    return [model.objects.filter(**filters) for model in enrollment_sources(semester)]
+
+
+def union_values(querysets, fields, order_by=("id",)):
+    """values_list(*fields) over all querysets as one UNION ALL, ordered by `order_by`."""
+    parts = [qs.order_by().values_list(*fields) for qs in querysets]
+    if len(parts) == 1:
+        return parts[0].order_by(*order_by)
+    return parts[0].union(*parts[1:], all=True).order_by(*order_by)
@@ -0,0 +1,146 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from students import semesters as semester_cache
+from students.models import ArchivedEnrollment, Enrollment, Semester, Student
+from students.summary import refresh_summaries
+
+FIELDS = [f.attname for f in Enrollment._meta.concrete_fields]
+
+
+def table_sizes(model):
+    """(table bytes, index bytes) of the model's table; (None, None) when the backend can't tell."""
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SELECT pg_relation_size(%s::regclass), pg_indexes_size(%s::regclass)", [table, table])
+            return cursor.fetchone()
+        if connection.vendor == "sqlite":
+            try:
+                cursor.execute(
+                    "SELECT COALESCE(SUM(CASE WHEN name = %s THEN pgsize END), 0),"
+                    " COALESCE(SUM(CASE WHEN name != %s THEN pgsize END), 0)"
+                    " FROM dbstat WHERE name IN (SELECT name FROM sqlite_master WHERE tbl_name = %s)",
+                    [table, table, table],
+                )
+                return cursor.fetchone()
+            except DatabaseError:  # SQLite build without the dbstat table
+                return None, None
+    return None, None
+
+
+def move_chunk(source, target, semester, chunk_size):
+    """এক transaction এ semester এর সর্বোচ্চ chunk_size টা row source থেকে target এ সরায়।"""
+    with transaction.atomic():
+        rows = list(source.objects.filter(semester=semester).order_by("id")
+                    .select_for_update().values_list(*FIELDS)[:chunk_size])
+        if not rows:
+            return 0
+        target.objects.bulk_create([target(**dict(zip(FIELDS, row))) for row in rows])
+        # Enrollment এ কেউ FK রাখে না, তাই cascade/signal ছাড়া সরাসরি DELETE
+        source.objects.filter(id__in=[row[0] for row in rows])._raw_delete(connection.alias)
+    return len(rows)
+
+
+class Command(BaseCommand):
+    help = "Move the enrollments of closed semesters into the archive table (or back with --restore)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("semesters", nargs="*", help='semester labels, e.g. "Fall 2024"')
+        parser.add_argument("--closed", action="store_true",
+                            help="every unarchived semester older than the current one")
+        parser.add_argument("--restore", action="store_true", help="move archived enrollments back")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="rows per transaction")
+        parser.add_argument("--vacuum", choices=["plain", "full"],
+                            help="VACUUM the live table afterwards; 'full' rewrites it and returns the space to the OS "
+                                 "but locks it (Postgres) / the whole database (SQLite) while it runs")
+
+    def handle(self, *args, **opts):
+        targets = self.pick_semesters(opts)
+        source, target = (ArchivedEnrollment, Enrollment) if opts["restore"] else (Enrollment, ArchivedEnrollment)
+
+        before = self.measure()
+        started = time.perf_counter()
+        for semester in targets:
+            moved = 0
+            while True:
+                n = move_chunk(source, target, semester, opts["chunk_size"])
+                if not n:
+                    break
+                moved += n
+                self.stdout.write(f"  {semester.label}: {moved} rows...")
+            Semester.objects.filter(pk=semester.pk).update(archived_at=None if opts["restore"] else timezone.now())
+            # যাদের current_semester এটাই, তাদের summary এর current load বদলায়
+            affected = list(Student.objects.filter(current_semester=semester).values_list("id", flat=True))
+            for i in range(0, len(affected), 2000):
+                refresh_summaries(affected[i:i + 2000])
+            verb = "Restored" if opts["restore"] else "Archived"
+            self.stdout.write(self.style.SUCCESS(f"✅ {verb} {semester.label}: {moved} enrollments"))
+        semester_cache.clear()
+
+        if opts["vacuum"]:
+            self.vacuum(opts["vacuum"])
+        self.report(before, self.measure(), time.perf_counter() - started, opts["restore"])
+
+    def pick_semesters(self, opts):
+        # portal এর বাকি অংশের মতো: is_current, নাহলে আজকের তারিখের semester
+        semester_cache.clear()
+        current = semester_cache.current_term()
+        if opts["closed"] and opts["restore"]:
+            targets = list(Semester.objects.filter(archived_at__isnull=False).order_by("code"))
+        elif opts["closed"]:
+            if current is None or current.code is None:
+                raise CommandError("--closed needs a current semester (is_current or today's dates) with a code.")
+            targets = list(Semester.objects.filter(code__lt=current.code, archived_at__isnull=True).order_by("code"))
+        else:
+            # admin panel এর "Spring 2025, 251" format ও চলে
+            labels = [label.split(",")[0].strip() for label in opts["semesters"]]
+            if not labels:
+                raise CommandError("Give semester labels or --closed.")
+            found = {s.label: s for s in Semester.objects.filter(label__in=labels)}
+            missing = [label for label in labels if label not in found]
+            if missing:
+                raise CommandError(f"Unknown semester(s): {', '.join(missing)}")
+            targets = [found[label] for label in labels]
+
+        if not opts["restore"]:
+            for semester in targets:
+                if current is not None and semester.pk == current.pk:
+                    raise CommandError(f"{semester.label} is the current semester; it can't be archived.")
+                if Enrollment.objects.filter(semester=semester, status="pending").exists():
+                    raise CommandError(f"{semester.label} still has pending enrollments; approve or reject them first.")
+        if not targets:
+            self.stdout.write("Nothing to do.")
+        return targets
+
+    def measure(self):
+        return {model: (model.objects.count(), *table_sizes(model)) for model in (Enrollment, ArchivedEnrollment)}
+
+    def vacuum(self, mode):
+        table = Enrollment._meta.db_table
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(f"VACUUM {'(FULL, ANALYZE)' if mode == 'full' else '(ANALYZE)'} {connection.ops.quote_name(table)}")
+            elif connection.vendor == "sqlite":
+                cursor.execute("VACUUM" if mode == "full" else "ANALYZE")
+        self.stdout.write(f"  VACUUM {mode} done")
+
+    def report(self, before, after, elapsed, restore):
+        def mb(n):
+            return "n/a" if n is None else f"{n / 1024 / 1024:,.2f} MB"
+
+        self.stdout.write(f"{'':<26}{'rows':>12}{'table':>14}{'indexes':>14}")
+        for model in (Enrollment, ArchivedEnrollment):
+            for when, sizes in (("before", before[model]), ("after", after[model])):
+                rows, table, indexes = sizes
+                self.stdout.write(f"{model.__name__ + ' ' + when:<26}{rows:>12,}{mb(table):>14}{mb(indexes):>14}")
+        (_, t0, i0), (_, t1, i1) = before[Enrollment], after[Enrollment]
+        if not restore and None not in (t0, t1, i0, i1):
+            self.stdout.write(f"Live table reclaimed: {mb(t0 - t1)} table, {mb(i0 - i1)} indexes in {elapsed:.1f}s")
+            if t0 == t1:
+                # Postgres/SQLite delete এর পর file ছোট করে না, শুধু জায়গাটা পরের insert এর জন্য free রাখে
+                self.stdout.write("The freed pages are reused by new rows; run with --vacuum full in a maintenance "
+                                  "window to return them to the OS and rebuild the indexes.")
@@ -0,0 +1,131 @@
+import random
+import time
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from catalog.models import Department, Faculty
+from students.advising import auto_assign, balance, department_lookup
+from students.models import Student
+
+from .explain_hot_queries import bulk_insert
+
+User = get_user_model()
+
+TAG = "xa"
+DEPARTMENTS = 8
+
+
+def linear_balance(students, faculty, lookup):
+    """Baseline: প্রতিটা student এর জন্য department এর সব faculty scan করে min load, O(n * f)।"""
+    members = defaultdict(list)
+    for fid, dept_id in faculty:
+        members[dept_id].append(fid)
+    loads = defaultdict(int)
+    changes = {}
+    for sid, _, dept, advisor_id in students:
+        fids = members.get(lookup.get((dept or "").strip().lower()))
+        if not fids or advisor_id is not None:
+            continue
+        fid = min(fids, key=lambda f: loads[f])
+        loads[fid] += 1
+        changes[sid] = fid
+    return changes
+
+
+class Command(BaseCommand):
+    help = ("Seed students and faculty, then time advisor auto-assignment (load, heap balance, bulk_update); "
+            "auto-assign covers every student, so it refuses to run on a database that already has students")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=100_000)
+        parser.add_argument("--faculty", type=int, default=2_000)
+        parser.add_argument("--skip-baseline", action="store_true", help="don't time the O(n*f) linear scan")
+        parser.add_argument("--keep", action="store_true", help="keep the seeded rows")
+
+    def handle(self, *args, **opts):
+        real = Student.objects.exclude(student_id__startswith=f"{TAG}-").count()
+        if real:
+            # auto_assign সব student এর advisor বদলায়, আসল data তে চালানো যাবে না
+            raise CommandError(f"{real:,} students already in {connection.settings_dict['NAME']}; "
+                               f"run bench_advisors on a scratch database.")
+        self.seed(opts)
+        try:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"== Assign ({connection.vendor})"))
+            self.show(auto_assign())
+
+            # department এর ভেতরে load এলোমেলো করে দিই, তারপর rebalance
+            self.skew()
+            self.stdout.write(self.style.MIGRATE_HEADING("== Rebalance after skewing loads"))
+            self.show(auto_assign(rebalance=True))
+
+            students = list(Student.objects.values_list("id", "user_id", "department", "advisor_id"))
+            faculty = list(Faculty.objects.values_list("id", "department_id"))
+            lookup = department_lookup()
+            unassigned = [(sid, uid, dept, None) for sid, uid, dept, _ in students]
+            started = time.perf_counter()
+            balance(unassigned, faculty, lookup)
+            heap_s = time.perf_counter() - started
+            self.stdout.write(self.style.MIGRATE_HEADING("== In-memory balancer, every student unassigned"))
+            self.stdout.write(f"  heap   O(n log f): {heap_s * 1000:9.1f} ms")
+            if not opts["skip_baseline"]:
+                started = time.perf_counter()
+                linear_balance(unassigned, faculty, lookup)
+                linear_s = time.perf_counter() - started
+                self.stdout.write(f"  linear O(n * f):   {linear_s * 1000:9.1f} ms  ({linear_s / heap_s:.1f}x slower)")
+        finally:
+            if not opts["keep"]:
+                self.cleanup()
+
+    def show(self, report):
+        s = report.seconds
+        self.stdout.write(
+            f"  {report.students:,} students, {report.faculty:,} faculty, {report.changed:,} changed: "
+            f"load {s['load']:.2f}s, balance {s['balance']:.2f}s, write {s['write']:.2f}s "
+            f"({report.students / report.total_seconds if report.total_seconds else 0:,.0f} students/s)"
+        )
+        spread = max((high - low for _, _, _, low, high in report.departments), default=0)
+        self.stdout.write(f"  {len(report.departments)} departments, max advisee spread within a department: {spread}")
+
+    def seed(self, opts):
+        rng = random.Random(11)
+        started = time.perf_counter()
+        password = make_password(None)
+        Department.objects.bulk_create([Department(name=f"Bench {TAG}{i}", code=f"{TAG.upper()}{i}")
+                                        for i in range(DEPARTMENTS)], ignore_conflicts=True)
+        depts = list(Department.objects.filter(code__startswith=TAG.upper()).values_list("id", "code"))
+
+        bulk_insert(User, (User(username=f"{TAG}f-{i}", password=password) for i in range(opts["faculty"])))
+        fac_users = list(User.objects.filter(username__startswith=f"{TAG}f-").values_list("id", flat=True))
+        bulk_insert(Faculty, (Faculty(faculty_id=f"{TAG}-{uid}", name=f"Faculty {uid}", email=f"{TAG}{uid}@bench.test",
+                                      department_id=depts[i % len(depts)][0], user_id=uid)
+                              for i, uid in enumerate(fac_users)))
+
+        bulk_insert(User, (User(username=f"{TAG}s-{i}", password=password) for i in range(opts["students"])))
+        user_ids = User.objects.filter(username__startswith=f"{TAG}s-").values_list("id", flat=True)
+        # department size অসমান, যাতে balancer এর কাজ থাকে
+        weights = [rng.uniform(0.5, 2.0) for _ in depts]
+        bulk_insert(Student, (Student(user_id=uid, student_id=f"{TAG}-{uid}", full_name=f"Student {uid}",
+                                      department=rng.choices(depts, weights)[0][1]) for uid in user_ids.iterator()))
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Seeded {opts['students']:,} students, {len(fac_users):,} faculty in {time.perf_counter() - started:.1f}s"
+        ))
+
+    def skew(self):
+        # প্রতিটা department এর অর্ধেক advisee একজন advisor এর ঘাড়ে
+        rows = Student.objects.filter(student_id__startswith=f"{TAG}-").exclude(advisor=None)\
+            .values_list("id", "advisor__department_id")
+        first = dict(Faculty.objects.filter(faculty_id__startswith=f"{TAG}-").order_by("-id")
+                     .values_list("department_id", "id"))
+        moved = [Student(id=sid, advisor_id=first[dept]) for sid, dept in rows if sid % 2]
+        Student.objects.bulk_update(moved, ["advisor"], batch_size=2000)
+
+    def cleanup(self):
+        # raw deletes skip the per-row signals; these rows never had summaries
+        Student.objects.filter(student_id__startswith=f"{TAG}-")._raw_delete(connection.alias)
+        Faculty.objects.filter(faculty_id__startswith=f"{TAG}-")._raw_delete(connection.alias)
+        User.objects.filter(username__regex=rf"^{TAG}[fs]-")._raw_delete(connection.alias)
+        Department.objects.filter(code__startswith=TAG.upper()).delete()
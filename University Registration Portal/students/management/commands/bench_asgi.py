@@ -0,0 +1,197 @@
+import asyncio
+import json
+import logging
+import time
+
+from asgiref.sync import ThreadSensitiveContext
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+
+from students.management.commands.bench_enrollment import percentile
+from students.management.commands.bench_portal import FLOWS, Command as PortalBench, run_virtual_users
+
+User = get_user_model()
+
+DASHBOARDS = {role: flow[0] for role, flow in FLOWS.items()}
+
+
+class _Latency:
+    """প্রতিটা query তে কৃত্রিম network round-trip (remote Postgres এর মতো)।"""
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def __call__(self, execute, sql, params, many, context):
+        time.sleep(self.seconds)
+        return execute(sql, params, many, context)
+
+
+class HostAsyncClient(AsyncClient):
+    """
+    AsyncClient always sends "host: testserver" and ignores SERVER_NAME or a
+    Host passed in headers, so every request would be a DisallowedHost 400.
+    """
+    def __init__(self, host, **kwargs):
+        super().__init__(**kwargs)
+        self.host = host.encode("latin1")
+
+    def request(self, **request):
+        request["headers"] = [(name, self.host if name == b"host" else value)
+                              for name, value in request.get("headers", [])]
+        return super().request(**request)
+
+
+async def run_async_users(plans, host):
+    """
+    Same plans as run_virtual_users, but as asyncio tasks against the ASGI
+    handler. Returns (samples, seconds from the start signal to the last response).
+    """
+    samples = []
+    ready = 0
+    start = asyncio.Event()
+
+    async def virtual_user(plan):
+        user_id, names, n_requests = plan
+        client = HostAsyncClient(host, raise_request_exception=False)
+        await client.aforce_login(await User.objects.aget(pk=user_id))
+        urls = [(name, reverse(name)) for name in names]
+        nonlocal ready
+        ready += 1
+        await start.wait()
+        for i in range(n_requests):
+            name, url = urls[i % len(urls)]
+            t0 = time.perf_counter()
+            # ASGIHandler প্রতিটা request এ এটা করে, test AsyncClient করে না; না দিলে
+            # সব request এর sync অংশ একটাই thread এ লাইন ধরে চলে
+            async with ThreadSensitiveContext():
+                response = await client.get(url)
+            samples.append((name, time.perf_counter() - t0, 0, response.status_code))
+
+    tasks = [asyncio.create_task(virtual_user(plan)) for plan in plans]
+    # login গুলো (একটাই thread এ) শেষ হওয়ার পর ঘড়ি চালু
+    while ready < len(plans):
+        await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    start.set()
+    await asyncio.gather(*tasks)
+    return samples, time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = "Compare the sync (WSGI) and async (ASGI) dashboards at the same concurrency"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=20, help="concurrent virtual users on each side")
+        parser.add_argument("--requests", type=int, default=20, help="requests per virtual user")
+        parser.add_argument("--roles", default="student,faculty,admin", help="whose dashboards to load")
+        parser.add_argument("--latency-ms", type=float, default=0.0,
+                            help="extra delay added to every query, to mimic a database over the network")
+        parser.add_argument("--host", default="localhost", help="Host header; must be in ALLOWED_HOSTS")
+        parser.add_argument("--output", help="write both runs as JSON to this file")
+
+    def handle(self, *args, **opts):
+        roles = [r.strip() for r in opts["roles"].split(",") if r.strip()]
+        for role in roles:
+            if role not in DASHBOARDS:
+                raise CommandError(f"Unknown role {role!r}; use {', '.join(DASHBOARDS)}")
+        accounts = PortalBench().accounts()
+        if not all(accounts[role] for role in roles):
+            raise CommandError("Missing accounts to log in as; run seed_data first.")
+
+        plans = []
+        for i in range(opts["users"]):
+            role = roles[i % len(roles)]
+            ids = accounts[role]
+            plans.append((ids[i // len(roles) % len(ids)], [DASHBOARDS[role]], opts["requests"]))
+
+        logging.getLogger("django.request").setLevel(logging.CRITICAL)
+        if opts["latency_ms"]:
+            latency = _Latency(opts["latency_ms"] / 1000)
+
+            def add_latency(sender, connection, **kwargs):
+                # execute_wrappers টিকে থাকে, reconnect এ আবার signal আসে
+                if latency not in connection.execute_wrappers:
+                    connection.execute_wrappers.append(latency)
+
+            connection_created.connect(add_latency, weak=False, dispatch_uid="bench_asgi_latency")
+            for conn in connections.all():
+                conn.close()  # পরের connection থেকে wrapper সহ
+
+        self.stdout.write(f"{opts['users']} virtual users x {opts['requests']} requests, "
+                          f"+{opts['latency_ms']:g} ms/query on {connection.vendor}")
+        results = {}
+
+        # ---------- WSGI ----------
+        warm = [(plan[0], plan[1], 1) for plan in plans[:len(roles)]]
+        self.check_statuses("wsgi", run_virtual_users(warm, opts["host"]))
+        t0 = time.perf_counter()
+        samples = run_virtual_users(plans, opts["host"])
+        elapsed = time.perf_counter() - t0
+        self.check_statuses("wsgi", samples)
+        results["wsgi"] = self.summarize(samples, elapsed)
+
+        # ---------- ASGI ----------
+        with override_settings(ROOT_URLCONF="registration_portal.urls_async"):
+            self.check_statuses("asgi", asyncio.run(run_async_users(warm, opts["host"]))[0])
+            samples, elapsed = asyncio.run(run_async_users(plans, opts["host"]))
+            self.check_statuses("asgi", samples)
+            results["asgi"] = self.summarize(samples, elapsed)
+
+        # ---------- Report ----------
+        self.stdout.write(f"{'view':<22}{'mode':>6}{'reqs':>7}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+        for name in sorted(results["wsgi"]["views"]):
+            for mode in ("wsgi", "asgi"):
+                v = results[mode]["views"].get(name)
+                if v is None:
+                    continue
+                line = (f"{name:<22}{mode:>6}{v['requests']:>7}{v['errors']:>6}{v['rps']:>9.1f}"
+                        f"{v['p50_ms']:>9.1f}{v['p95_ms']:>9.1f}{v['p99_ms']:>9.1f}")
+                self.stdout.write(self.style.ERROR(line) if v["errors"] else line)
+        for mode in ("wsgi", "asgi"):
+            t = results[mode]["total"]
+            self.stdout.write(f"{mode}: {t['requests']} requests, {t['errors']} errors, "
+                              f"{t['rps']:.1f} req/s in {t['elapsed_s']:.2f}s")
+        if opts["output"]:
+            with open(opts["output"], "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(f"✅ Wrote {opts['output']}"))
+
+    def check_statuses(self, mode, samples):
+        """Error response এর timing তুলনা করে লাভ নেই; কোনো sample 2xx না হলে থামি।"""
+        bad = {}
+        for name, _, _, status in samples:
+            if not 200 <= status < 300:
+                bad.setdefault((name, status), 0)
+                bad[(name, status)] += 1
+        if bad:
+            details = ", ".join(f"{name} -> {status} x{n}" for (name, status), n in sorted(bad.items()))
+            raise CommandError(f"{mode} requests failed ({details}); check --host against ALLOWED_HOSTS "
+                               f"and that the seeded accounts can open their dashboards.")
+
+    def summarize(self, samples, elapsed):
+        by_view = {}
+        for name, seconds, _, status in samples:
+            by_view.setdefault(name, []).append((seconds, status))
+        views = {}
+        for name, rows in by_view.items():
+            latencies = sorted(r[0] for r in rows)
+            views[name] = {
+                "requests": len(rows),
+                "errors": sum(1 for r in rows if r[1] >= 400),
+                "rps": round(len(rows) / elapsed, 2),
+                "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            }
+        return {
+            "views": views,
+            "total": {
+                "requests": len(samples),
+                "errors": sum(v["errors"] for v in views.values()),
+                "elapsed_s": round(elapsed, 3),
+                "rps": round(len(samples) / elapsed, 2) if elapsed else 0,
+            },
+        }
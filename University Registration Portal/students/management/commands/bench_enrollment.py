@@ -0,0 +1,128 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count
+
+from students.enrollment import enroll, EnrollmentError
+from catalog.models import Course
+from students.models import CourseSeats, Student, Enrollment, Semester
+
+User = get_user_model()
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+class Command(BaseCommand):
+    help = "Hammer students.enrollment.enroll from many threads and report throughput, latency and seat accounting"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--submitters", type=int, default=500, help="concurrent submitter threads")
+        parser.add_argument("--courses", type=int, default=20)
+        parser.add_argument("--capacity", type=int, default=20, help="seats per course")
+        parser.add_argument("--attempts", type=int, default=3, help="submissions per submitter")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--keep", action="store_true", help="keep the benchmark rows afterwards")
+
+    def handle(self, *args, **opts):
+        rng = random.Random(opts["seed"])
+        tag = f"bench{int(time.time())}"
+        semester = Semester.objects.create(label=f"Bench {tag}")
+        n = opts["submitters"]
+
+        # ---------- Fixtures ----------
+        password = make_password(None)
+        users = User.objects.bulk_create([
+            User(username=f"{tag}-{i}", password=password) for i in range(n)
+        ])
+        if users[0].pk is None:  # backends without RETURNING
+            users = list(User.objects.filter(username__startswith=f"{tag}-").order_by("id"))
+        students = Student.objects.bulk_create([
+            Student(user=u, student_id=f"{tag}-{i}", full_name=u.username,
+                    current_semester=semester, is_cleared_for_registration=True)
+            for i, u in enumerate(users)
+        ])
+        if students[0].pk is None:
+            students = list(Student.objects.filter(student_id__startswith=f"{tag}-").order_by("id"))
+        Course.objects.bulk_create([
+            Course(code=f"B{tag[-6:]}{i:03d}", title=f"Bench course {i}", capacity=opts["capacity"])
+            for i in range(opts["courses"])
+        ])
+        course_ids = list(Course.objects.filter(code__startswith=f"B{tag[-6:]}").values_list("id", flat=True))
+
+        plans = [
+            (s, rng.sample(course_ids, min(opts["attempts"], len(course_ids))))
+            for s in students
+        ]
+        barrier = threading.Barrier(n)
+        latencies, outcomes = [], {"ok": 0}
+        lock = threading.Lock()
+
+        def submitter(plan):
+            student, picks = plan
+            local_lat, local_out = [], {}
+            try:
+                barrier.wait()
+                for course_id in picks:
+                    t0 = time.perf_counter()
+                    try:
+                        enroll(student, course_id, semester)
+                        key = "ok"
+                    except EnrollmentError as e:
+                        key = type(e).__name__
+                    local_lat.append(time.perf_counter() - t0)
+                    local_out[key] = local_out.get(key, 0) + 1
+            finally:
+                connection.close()
+            with lock:
+                latencies.extend(local_lat)
+                for k, v in local_out.items():
+                    outcomes[k] = outcomes.get(k, 0) + v
+
+        # ---------- Run ----------
+        self.stdout.write(f"{n} submitters x {opts['attempts']} attempts over "
+                          f"{len(course_ids)} courses x {opts['capacity']} seats")
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            list(pool.map(submitter, plans))
+        elapsed = time.perf_counter() - started
+
+        # ---------- Report ----------
+        latencies.sort()
+        self.stdout.write(f"elapsed        {elapsed:.2f}s")
+        self.stdout.write(f"attempts/sec   {len(latencies) / elapsed:.1f}")
+        self.stdout.write(f"enrolls/sec    {outcomes['ok'] / elapsed:.1f}")
+        for pct in (50, 95, 99):
+            self.stdout.write(f"p{pct:<13}{percentile(latencies, pct) * 1000:.1f} ms")
+        for k, v in sorted(outcomes.items()):
+            self.stdout.write(f"  {k:<12} {v}")
+
+        # Seat counter must match the rows and never exceed capacity
+        counts = dict(Enrollment.objects.filter(course_id__in=course_ids, semester=semester)
+                      .values("course_id").annotate(n=Count("id")).values_list("course_id", "n"))
+        taken = dict(CourseSeats.objects.filter(course_id__in=course_ids, semester=semester)
+                     .values_list("course_id", "taken"))
+        bad = [
+            c.code for c in Course.objects.filter(id__in=course_ids)
+            if taken.get(c.id, 0) != counts.get(c.id, 0) or taken.get(c.id, 0) > c.capacity
+        ]
+        if bad:
+            self.stdout.write(self.style.ERROR(f"❌ Seat accounting mismatch: {', '.join(bad)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS("✅ No oversubscription, counters match enrollments"))
+
+        if not opts["keep"]:
+            Enrollment.objects.filter(course_id__in=course_ids).delete()
+            Course.objects.filter(id__in=course_ids).delete()
+            User.objects.filter(username__startswith=f"{tag}-").delete()
+            semester.delete()
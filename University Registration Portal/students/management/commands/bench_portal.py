@@ -0,0 +1,236 @@
+import json
+import logging
+import multiprocessing
+import os
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.urls import reverse
+
+from catalog.models import Faculty
+from students.management.commands.bench_enrollment import percentile
+from students.models import Student
+
+User = get_user_model()
+
+# role -> URL names that role's virtual users cycle through
+FLOWS = {
+    "student": ["student-dashboard", "my_courses", "registration", "result"],
+    "faculty": ["faculty-dashboard", "student-list", "approve-registrations"],
+    "admin": ["admin-dashboard", "departments", "courses", "faculty"],
+}
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.queries = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+
+def run_virtual_users(plans, host):
+    """
+    Run each (user_id, url names, requests) plan on its own thread.
+    Returns [(url name, seconds, queries, status), ...].
+    """
+    samples = []
+    lock = threading.Lock()
+    start = threading.Barrier(len(plans))
+
+    def virtual_user(plan):
+        user_id, names, n_requests = plan
+        client = Client(SERVER_NAME=host, raise_request_exception=False)
+        client.force_login(User.objects.get(pk=user_id))
+        urls = [(name, reverse(name)) for name in names]
+        local = []
+        try:
+            start.wait()
+            for i in range(n_requests):
+                name, url = urls[i % len(urls)]
+                counter = _QueryCounter()
+                t0 = time.perf_counter()
+                with connection.execute_wrapper(counter):
+                    response = client.get(url)
+                local.append((name, time.perf_counter() - t0, counter.queries, response.status_code))
+        finally:
+            connection.close()
+        with lock:
+            samples.extend(local)
+
+    with ThreadPoolExecutor(max_workers=len(plans)) as pool:
+        list(pool.map(virtual_user, plans))
+    return samples
+
+
+def _process_worker(plans, host):
+    # forked child: the parent's DB connections must not be shared
+    for conn in connections.all():
+        conn.close()
+    return run_virtual_users(plans, host)
+
+
+class Command(BaseCommand):
+    help = "Drive the real student, faculty and admin views with concurrent virtual users and report per-view latency"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=50, help="concurrent virtual users")
+        parser.add_argument("--requests", type=int, default=40, help="requests per virtual user")
+        parser.add_argument("--mix", default="student=7,faculty=2,admin=1",
+                            help="relative share of each role among the virtual users")
+        parser.add_argument("--processes", type=int, default=1,
+                            help="spread the virtual users over this many forked processes (threads inside each)")
+        parser.add_argument("--host", default="localhost", help="Host header; must be in ALLOWED_HOSTS")
+        parser.add_argument("--warmup", type=int, default=1, help="untimed requests per view before the run")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--output", help="write the results as JSON to this file")
+        parser.add_argument("--baseline", help="JSON file of an earlier run to compare against")
+
+    def handle(self, *args, **opts):
+        rng = random.Random(opts["seed"])
+        accounts = self.accounts()
+        mix = self.parse_mix(opts["mix"], accounts)
+
+        # ---------- Plans ----------
+        roles = [role for role, weight in mix for _ in range(weight)]
+        plans = []
+        for i in range(opts["users"]):
+            role = roles[i % len(roles)]
+            plans.append((rng.choice(accounts[role]), FLOWS[role], opts["requests"]))
+        rng.shuffle(plans)
+
+        # 500 গুলো error column এ গোনা হয়; প্রতিটার traceback log করলে output ডুবে যায়
+        logging.getLogger("django.request").setLevel(logging.CRITICAL)
+
+        # warm-up: template loading, URL resolver, catalog/semester caches
+        if opts["warmup"]:
+            warm = [(accounts[role][0], FLOWS[role], opts["warmup"] * len(FLOWS[role])) for role, _ in mix]
+            run_virtual_users(warm, opts["host"])
+
+        # ---------- Run ----------
+        self.stdout.write(f"{opts['users']} virtual users x {opts['requests']} requests "
+                          f"({opts['mix']}) in {opts['processes']} process(es) on {connection.vendor}")
+        started = time.perf_counter()
+        if opts["processes"] > 1:
+            chunks = [plans[i::opts["processes"]] for i in range(opts["processes"])]
+            chunks = [c for c in chunks if c]
+            for conn in connections.all():
+                conn.close()
+            ctx = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=len(chunks), mp_context=ctx) as pool:
+                samples = [s for part in pool.map(_process_worker, chunks, [opts["host"]] * len(chunks)) for s in part]
+        else:
+            samples = run_virtual_users(plans, opts["host"])
+        elapsed = time.perf_counter() - started
+
+        # ---------- Report ----------
+        result = self.summarize(samples, elapsed, opts)
+        self.print_table(result)
+        if opts["baseline"]:
+            self.compare(result, opts["baseline"])
+        if opts["output"]:
+            with open(opts["output"], "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(f"✅ Wrote {opts['output']}"))
+
+    def accounts(self):
+        """প্রতিটা role এর জন্য login করার মতো user id; seed_data চালানো DB ধরে নেয়।"""
+        accounts = {
+            "student": list(Student.objects.order_by("id").values_list("user_id", flat=True)[:1000]),
+            "faculty": list(Faculty.objects.filter(user__isnull=False).order_by("id")
+                            .values_list("user_id", flat=True)[:1000]),
+            "admin": list(User.objects.filter(is_staff=True).order_by("id").values_list("id", flat=True)[:100]),
+        }
+        # admin_panel only needs a login; fall back to faculty accounts when there is no staff user
+        accounts["admin"] = accounts["admin"] or accounts["faculty"]
+        return accounts
+
+    def parse_mix(self, text, accounts):
+        mix = []
+        for part in text.split(","):
+            role, _, weight = part.partition("=")
+            role = role.strip()
+            if role not in FLOWS:
+                raise CommandError(f"Unknown role {role!r} in --mix; use {', '.join(FLOWS)}")
+            try:
+                weight = int(weight or 1)
+            except ValueError:
+                raise CommandError(f"Bad weight in --mix: {part!r}")
+            if weight <= 0:
+                continue
+            if not accounts[role]:
+                raise CommandError(f"No {role} accounts to log in as; run seed_data first.")
+            mix.append((role, weight))
+        if not mix:
+            raise CommandError("--mix selects no roles")
+        return mix
+
+    def summarize(self, samples, elapsed, opts):
+        by_view = {}
+        for name, seconds, queries, status in samples:
+            by_view.setdefault(name, []).append((seconds, queries, status))
+        views = {}
+        for name, rows in sorted(by_view.items()):
+            latencies = sorted(r[0] for r in rows)
+            views[name] = {
+                "requests": len(rows),
+                "errors": sum(1 for r in rows if r[2] >= 400),
+                "rps": round(len(rows) / elapsed, 2),
+                "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+                "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+                "queries_per_request": round(sum(r[1] for r in rows) / len(rows), 2),
+            }
+        return {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "database": connection.vendor,
+                "django": django.get_version(),
+                "users": opts["users"],
+                "requests_per_user": opts["requests"],
+                "mix": opts["mix"],
+                "processes": opts["processes"],
+                "cpus": os.cpu_count(),
+            },
+            "total": {
+                "requests": len(samples),
+                "errors": sum(v["errors"] for v in views.values()),
+                "elapsed_s": round(elapsed, 3),
+                "rps": round(len(samples) / elapsed, 2) if elapsed else 0,
+            },
+            "views": views,
+        }
+
+    def print_table(self, result):
+        self.stdout.write(f"{'view':<24}{'reqs':>7}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'q/req':>8}")
+        for name, v in result["views"].items():
+            line = (f"{name:<24}{v['requests']:>7}{v['errors']:>6}{v['rps']:>9.1f}"
+                    f"{v['p50_ms']:>9.1f}{v['p95_ms']:>9.1f}{v['p99_ms']:>9.1f}{v['queries_per_request']:>8.1f}")
+            self.stdout.write(self.style.ERROR(line) if v["errors"] else line)
+        t = result["total"]
+        self.stdout.write(f"total {t['requests']} requests, {t['errors']} errors, "
+                          f"{t['rps']:.1f} req/s in {t['elapsed_s']:.2f}s")
+
+    def compare(self, result, path):
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        self.stdout.write(self.style.MIGRATE_HEADING(f"== Against {path}"))
+        for name, v in result["views"].items():
+            old = baseline.get("views", {}).get(name)
+            if old is None:
+                self.stdout.write(f"  {name:<24} new")
+                continue
+            p95 = (v["p95_ms"] / old["p95_ms"] - 1) * 100 if old["p95_ms"] else 0.0
+            queries = v["queries_per_request"] - old["queries_per_request"]
+            line = f"  {name:<24} p95 {old['p95_ms']:.1f} -> {v['p95_ms']:.1f} ms ({p95:+.0f}%)  q/req {queries:+.1f}"
+            # 20% slower on p95 or any extra query per request is worth a look
+            self.stdout.write(self.style.WARNING(line) if p95 > 20 or queries > 0 else line)
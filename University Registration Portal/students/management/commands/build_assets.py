@@ -0,0 +1,150 @@
+import gzip
+import json
+import re
+import shlex
+import subprocess
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from registration_portal.static import brotli
+
+ASSETS = Path(settings.BASE_DIR) / "assets"
+SOURCE_CSS = ASSETS / "src" / "portal.css"
+OUTPUT_CSS = ASSETS / "static" / "css" / "portal.css"
+FONTS_DIR = ASSETS / "static" / "fonts" / "inter"
+CONFIG = Path(settings.BASE_DIR) / "tailwind.config.js"
+
+# @fontsource/inter, pinned; latin subset of the three weights the templates use
+FONTSOURCE = "https://cdn.jsdelivr.net/npm/@fontsource/inter@5.0.18"
+FONT_FILES = [f"inter-latin-{w}-normal.woff2" for w in (400, 600, 700)]
+
+# what every page loaded before this pipeline
+CDN_ASSETS = [
+    ("https://cdn.tailwindcss.com", "script"),
+    ("https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap", "stylesheet"),
+]
+BROWSER_UA = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+
+
+def _sizes(data):
+    sizes = {"raw": len(data), "gzip": len(gzip.compress(data, compresslevel=9, mtime=0))}
+    if brotli is not None:
+        sizes["br"] = len(brotli.compress(data, quality=11))
+    return sizes
+
+
+def _fetch(url):
+    request = urllib.request.Request(url, headers={"User-Agent": BROWSER_UA})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+class Command(BaseCommand):
+    help = "Build the purged Tailwind bundle, vendor the fonts, collect hashed + precompressed static files"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tailwind", default=getattr(settings, "TAILWIND_CLI", "tailwindcss"),
+                            help='Tailwind v3 CLI command, e.g. "npx tailwindcss@3"')
+        parser.add_argument("--fetch-fonts", action="store_true",
+                            help=f"download the Inter woff2 files into {FONTS_DIR.relative_to(settings.BASE_DIR)}")
+        parser.add_argument("--no-collect", action="store_true", help="skip collectstatic")
+        parser.add_argument("--compare-cdn", action="store_true",
+                            help="download the old CDN assets and compare page weight (needs network)")
+        parser.add_argument("--output", help="write the page-weight report as JSON to this file")
+
+    def handle(self, *args, **opts):
+        if opts["fetch_fonts"]:
+            self.fetch_fonts()
+        missing = [name for name in FONT_FILES if not (FONTS_DIR / name).exists()]
+        if missing:
+            # portal.css এর @font-face এগুলোকে refer করে; না থাকলে collectstatic এর hashing ফেইল করে
+            raise CommandError(f"Missing fonts {', '.join(missing)}; run with --fetch-fonts once and commit "
+                               f"{FONTS_DIR.relative_to(settings.BASE_DIR)}.")
+
+        # ---------- Tailwind ----------
+        OUTPUT_CSS.parent.mkdir(parents=True, exist_ok=True)
+        cmd = shlex.split(opts["tailwind"]) + ["-c", str(CONFIG), "-i", str(SOURCE_CSS), "-o", str(OUTPUT_CSS), "--minify"]
+        try:
+            subprocess.run(cmd, cwd=settings.BASE_DIR, check=True, capture_output=True, text=True)
+        except FileNotFoundError:
+            raise CommandError(f"{cmd[0]!r} not found; install the Tailwind v3 standalone CLI "
+                               f"or pass --tailwind \"npx tailwindcss@3\".")
+        except subprocess.CalledProcessError as e:
+            raise CommandError(f"Tailwind failed:\n{e.stderr}")
+        self.stdout.write(f"✅ {OUTPUT_CSS.relative_to(settings.BASE_DIR)}: {OUTPUT_CSS.stat().st_size:,} bytes")
+
+        # ---------- collectstatic ----------
+        if not opts["no_collect"]:
+            call_command("collectstatic", interactive=False, verbosity=0)
+            self.stdout.write(f"✅ Collected hashed + precompressed files into {settings.STATIC_ROOT}")
+
+        # ---------- Report ----------
+        report = {"bundle": self.bundle_weight()}
+        if opts["compare_cdn"]:
+            report["cdn"] = self.cdn_weight()
+        self.print_report(report)
+        if opts["output"]:
+            with open(opts["output"], "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(f"✅ Wrote {opts['output']}"))
+
+    def fetch_fonts(self):
+        FONTS_DIR.mkdir(parents=True, exist_ok=True)
+        for name in FONT_FILES + ["LICENSE"]:
+            url = f"{FONTSOURCE}/{'files/' if name.endswith('.woff2') else ''}{name}"
+            try:
+                (FONTS_DIR / name).write_bytes(_fetch(url))
+            except OSError as e:
+                raise CommandError(f"Could not download {url}: {e}")
+            self.stdout.write(f"  fetched {name}")
+
+    def bundle_weight(self):
+        """Self-hosted: one render-blocking same-origin stylesheet; fonts load after first paint (swap)."""
+        css = _sizes(OUTPUT_CSS.read_bytes())
+        fonts = sum((FONTS_DIR / name).stat().st_size for name in FONT_FILES if (FONTS_DIR / name).exists())
+        return {
+            "render_blocking": [{"asset": "css/portal.css", "type": "stylesheet", **css}],
+            "fonts_bytes": fonts,
+            "third_party_origins": 0,
+            "requests": 1 + sum(1 for name in FONT_FILES if (FONTS_DIR / name).exists()),
+        }
+
+    def cdn_weight(self):
+        """Old pages: the Tailwind JIT script (compiles CSS in the browser) plus Google Fonts CSS and files."""
+        blocking, origins, font_bytes, requests = [], set(), 0, 0
+        for url, kind in CDN_ASSETS:
+            data = _fetch(url)
+            requests += 1
+            origins.add(urllib.parse.urlparse(url).netloc)
+            blocking.append({"asset": url, "type": kind, **_sizes(data)})
+            if kind == "stylesheet":
+                for font_url in re.findall(rb"url\((https://[^)]+\.woff2)\)", data):
+                    font_url = font_url.decode()
+                    origins.add(urllib.parse.urlparse(font_url).netloc)
+                    font_bytes += len(_fetch(font_url))
+                    requests += 1
+        return {
+            "render_blocking": blocking,
+            "fonts_bytes": font_bytes,
+            "third_party_origins": len(origins),
+            "requests": requests,
+        }
+
+    def print_report(self, report):
+        encoding = "br" if brotli is not None else "gzip"
+        self.stdout.write(f"{'':<10}{'blocking ' + encoding:>16}{'blocking raw':>14}{'fonts':>10}{'requests':>10}{'3rd-party':>11}")
+        for name, weight in report.items():
+            wire = sum(a[encoding] for a in weight["render_blocking"])
+            raw = sum(a["raw"] for a in weight["render_blocking"])
+            self.stdout.write(f"{name:<10}{wire:>16,}{raw:>14,}{weight['fonts_bytes']:>10,}"
+                              f"{weight['requests']:>10}{weight['third_party_origins']:>11}")
+        if "cdn" in report:
+            # first paint এর আগে CDN পথে script download + parse + JIT compile, আর প্রতিটা নতুন host এ DNS/TLS
+            self.stdout.write("First paint: the CDN pages wait for the script to download and compile the CSS "
+                              "in the browser, plus a DNS/TLS handshake per third-party origin; the bundle "
+                              "needs one same-origin, cache-forever stylesheet.")
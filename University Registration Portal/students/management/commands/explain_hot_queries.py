@@ -0,0 +1,186 @@
+import random
+import time
+from contextlib import contextmanager
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+
+from catalog.models import Course, Faculty
+from students.models import Student, Enrollment, SemesterResult
+from students.semesters import get_or_create_semester
+
+User = get_user_model()
+
+TAG = "xq"
+SEMESTERS = ["Spring 2024", "Fall 2024", "Spring 2025"]
+
+# indexes added in students/migrations/0006_hot_query_indexes.py
+NEW_INDEXES = [
+    "enroll_student_sem_status",
+    "enroll_course_status",
+    "enroll_pending_sem_student",
+    "result_student_semester",
+]
+
+
+def bulk_insert(model, objs, batch_size=5000):
+    """bulk_create in slices so huge generators never sit in memory at once."""
+    objs = iter(objs)
+    while True:
+        chunk = list(islice(objs, batch_size))
+        if not chunk:
+            break
+        model.objects.bulk_create(chunk, batch_size=batch_size)
+
+
+class Command(BaseCommand):
+    help = ("Seed a large dataset, then print EXPLAIN plans and timings of the hot queries with and without the "
+            "indexes; everything runs in one transaction that is rolled back unless --keep")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=20000)
+        parser.add_argument("--courses", type=int, default=500)
+        parser.add_argument("--per-student", type=int, default=6, help="enrollments per student per semester")
+        parser.add_argument("--repeat", type=int, default=50, help="executions per query when timing")
+        parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE (Postgres)")
+        parser.add_argument("--skip-seed", action="store_true", help="reuse rows from an earlier --keep run")
+        parser.add_argument("--keep", action="store_true", help="commit the seeded rows (and semesters)")
+
+    def handle(self, *args, **opts):
+        with transaction.atomic():
+            self.probe(opts)
+            if opts["keep"]:
+                pass
+            elif opts["skip_seed"]:
+                self.cleanup()  # rows of an earlier --keep run
+            else:
+                # seeded rows, semesters and the index drop/re-add all go away
+                transaction.set_rollback(True)
+
+    def probe(self, opts):
+        if not opts["skip_seed"]:
+            self.seed(opts)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        student = Student.objects.filter(student_id__startswith=f"{TAG}-").order_by("?").first()
+        course = Course.objects.filter(code__startswith=TAG.upper()).order_by("?").first()
+        if student is None or course is None:
+            self.stderr.write("No seeded rows found; run without --skip-seed first.")
+            return
+        advisor = Faculty.objects.get(faculty_id=f"{TAG}-advisor")
+        sem = get_or_create_semester(SEMESTERS[-1])
+
+        queries = [
+            ("student pending (dashboard)",
+             Enrollment.objects.filter(student=student, semester=sem, status="pending")),
+            ("student semester (my_courses)",
+             Enrollment.objects.filter(student=student, semester=sem)),
+            # faculty.views.approve_registration এর query। Postgres driver parameter client-side বসায়, তাই
+            # planner status = 'pending' literal দেখে partial index ধরে; SQLite "?" দেখে ধরতে পারে না,
+            # সেজন্য এখানে literal টা সরাসরি লেখা
+            ("advisor approvals",
+             Enrollment.objects.filter(student__advisor=advisor, semester=sem)
+             .filter(RawSQL(f"{Enrollment._meta.db_table}.status = 'pending'", (), output_field=BooleanField()))),
+            ("course pending",
+             Enrollment.objects.filter(course=course, status="pending")),
+            ("semester result",
+             SemesterResult.objects.filter(student=student, semester=sem)),
+        ]
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"== With indexes ({connection.vendor})"))
+        after = self.run_queries(queries, opts)
+
+        # SQLite full (student, semester, status) index থাকলে প্রতি advisee তে সেটাই ধরে; সেটা সরালে
+        # approvals query partial pending index এ নামে কিনা দেখা যায়
+        self.stdout.write(self.style.MIGRATE_HEADING("== Pending index only"))
+        with self.dropped(["enroll_student_sem_status"]):
+            self.run_queries([q for q in queries if q[0] == "advisor approvals"], opts)
+
+        self.stdout.write(self.style.MIGRATE_HEADING("== Without indexes"))
+        with self.dropped(NEW_INDEXES):
+            before = self.run_queries(queries, opts)
+
+        self.stdout.write(self.style.MIGRATE_HEADING("== Summary (ms per query)"))
+        for (label, _), b, a in zip(queries, before, after):
+            speedup = b / a if a else float("inf")
+            self.stdout.write(f"  {label:<32} {b:9.3f} -> {a:9.3f}  ({speedup:.1f}x)")
+
+    @contextmanager
+    def dropped(self, names):
+        """Drop the named indexes for the block and always put them back."""
+        indexes = [(model, index) for model in (Enrollment, SemesterResult)
+                   for index in model._meta.indexes if index.name in names]
+        # SQLite এর schema editor transaction এর ভেতরে খোলা যায় না, তাই DDL সরাসরি; এটা বাইরের
+        # transaction এরই অংশ, rollback হলে index আপনিই ফিরে আসে
+        editor = connection.schema_editor()
+        with connection.cursor() as cursor:
+            for model, index in indexes:
+                cursor.execute(f"DROP INDEX {connection.ops.quote_name(index.name)}")
+            try:
+                cursor.execute("ANALYZE")
+                yield
+            finally:
+                for model, index in indexes:
+                    cursor.execute(str(index.create_sql(model, editor)))
+                cursor.execute("ANALYZE")
+
+    def run_queries(self, queries, opts):
+        timings = []
+        for label, qs in queries:
+            plan = qs.explain(analyze=True) if opts["analyze"] and connection.vendor == "postgresql" else qs.explain()
+            list(qs.all())  # warm-up so both runs start with a hot page cache
+            started = time.perf_counter()
+            for _ in range(opts["repeat"]):
+                list(qs.all())
+            ms = (time.perf_counter() - started) * 1000 / opts["repeat"]
+            timings.append(ms)
+            self.stdout.write(f"-- {label}: {ms:.3f} ms")
+            for line in plan.splitlines():
+                self.stdout.write(f"   {line}")
+        return timings
+
+    def seed(self, opts):
+        rng = random.Random(7)
+        started = time.perf_counter()
+        password = make_password(None)
+        terms = [get_or_create_semester(label) for label in SEMESTERS]
+
+        bulk_insert(User, (User(username=f"{TAG}-{i}", password=password) for i in range(opts["students"])))
+        user_ids = list(User.objects.filter(username__startswith=f"{TAG}-").values_list("id", flat=True))
+        bulk_insert(Student, (Student(user_id=uid, student_id=f"{TAG}-{uid}", full_name=f"Student {uid}",
+                                      current_semester=terms[-1]) for uid in user_ids))
+        bulk_insert(Course, (Course(code=f"{TAG.upper()}{i:05d}", title=f"Course {i}")
+                             for i in range(opts["courses"])))
+        student_ids = list(Student.objects.filter(student_id__startswith=f"{TAG}-").values_list("id", flat=True))
+        advisor = Faculty.objects.create(faculty_id=f"{TAG}-advisor", name="Advisor", email=f"{TAG}-advisor@bench.test")
+        Student.objects.filter(id__in=student_ids[:80]).update(advisor=advisor)
+        course_ids = list(Course.objects.filter(code__startswith=TAG.upper()).values_list("id", flat=True))
+
+        def enrollments():
+            for sid in student_ids:
+                for sem in terms:
+                    for cid in rng.sample(course_ids, min(opts["per_student"], len(course_ids))):
+                        status = "pending" if sem == terms[-1] and rng.random() < 0.3 else "approved"
+                        yield Enrollment(student_id=sid, course_id=cid, semester=sem, status=status)
+
+        bulk_insert(Enrollment, enrollments())
+        bulk_insert(SemesterResult, (SemesterResult(student_id=sid, semester=sem, gpa=round(rng.uniform(2, 4), 2))
+                                     for sid in student_ids for sem in terms))
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Seeded {len(student_ids)} students, {len(course_ids)} courses in {time.perf_counter() - started:.1f}s"
+        ))
+
+    def cleanup(self):
+        # raw deletes skip the per-row summary signals; these rows never had summaries
+        seeded = Student.objects.filter(student_id__startswith=f"{TAG}-")
+        Enrollment.objects.filter(student__in=seeded)._raw_delete(connection.alias)
+        SemesterResult.objects.filter(student__in=seeded)._raw_delete(connection.alias)
+        Course.objects.filter(code__startswith=TAG.upper()).delete()
+        User.objects.filter(username__startswith=f"{TAG}-").delete()
+        Faculty.objects.filter(faculty_id=f"{TAG}-advisor").delete()
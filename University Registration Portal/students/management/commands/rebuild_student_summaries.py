@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from students.models import Student
+from students.summary import refresh_summaries
+
+
+class Command(BaseCommand):
+    help = "Recompute every StudentSummary row from Enrollment and ResultItem"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **opts):
+        batch_size = opts["batch_size"]
+        started = time.perf_counter()
+        done = 0
+        last_id = 0
+        while True:
+            ids = list(Student.objects.filter(id__gt=last_id).order_by("id")
+                       .values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            with transaction.atomic():
+                refresh_summaries(ids)
+            done += len(ids)
+            last_id = ids[-1]
+            self.stdout.write(f"  {done} students...")
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Rebuilt {done} summaries in {time.perf_counter() - started:.1f}s"
+        ))
@@ -0,0 +1,78 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+from django.db import connection, connections, transaction
+from django.db.models import Max, Min
+
+from students.gpa import recompute_results
+from students.models import SemesterResult, Student
+from students.summary import refresh_summaries
+
+
+def _close_connections():
+    # forked worker: parent এর DB connection ভাগাভাগি করা যাবে না
+    for conn in connections.all():
+        conn.close()
+
+
+def recompute_range(lo, hi, summaries=True):
+    """Students with lo <= id < hi: semester GPAs, then their summaries (CGPA)."""
+    with transaction.atomic():
+        updated = recompute_results(SemesterResult.objects.filter(student_id__gte=lo, student_id__lt=hi))
+        students = list(Student.objects.filter(id__gte=lo, id__lt=hi).values_list("id", flat=True))
+        if summaries and students:
+            refresh_summaries(students)
+    return updated, len(students)
+
+
+class Command(BaseCommand):
+    help = "Recompute every SemesterResult.gpa and student CGPA from ResultItem, in parallel id-range chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000, help="students per chunk")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                            help="worker processes; 1 runs in this process")
+        parser.add_argument("--skip-summaries", action="store_true", help="only semester GPAs, not the CGPA")
+
+    def handle(self, *args, **opts):
+        started = time.perf_counter()
+        bounds = Student.objects.aggregate(lo=Min("id"), hi=Max("id"))
+        if bounds["lo"] is None:
+            self.stdout.write("No students.")
+            return
+        size = opts["batch_size"]
+        ranges = [(lo, lo + size) for lo in range(bounds["lo"], bounds["hi"] + 1, size)]
+        summaries = not opts["skip_summaries"]
+        workers = max(1, min(opts["workers"], len(ranges)))
+        if workers > 1 and connection.vendor == "sqlite":
+            # SQLite এ একসাথে একটাই writer; parallel চালালে শুধু "database is locked"
+            self.stderr.write("SQLite allows one writer at a time; running with 1 worker.")
+            workers = 1
+
+        updated = students = 0
+        if workers == 1:
+            for lo, hi in ranges:
+                u, n = recompute_range(lo, hi, summaries)
+                updated, students = updated + u, students + n
+                self.progress(students, updated, started)
+        else:
+            _close_connections()
+            ctx = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_close_connections) as pool:
+                futures = [pool.submit(recompute_range, lo, hi, summaries) for lo, hi in ranges]
+                for future in as_completed(futures):
+                    u, n = future.result()
+                    updated, students = updated + u, students + n
+                    self.progress(students, updated, started)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {students} students in {elapsed:.1f}s with {workers} worker(s): "
+            f"{updated} semester GPAs changed ({students / elapsed if elapsed else 0:,.0f} students/s)"
+        ))
+
+    def progress(self, students, updated, started):
+        self.stdout.write(f"  {students} students, {updated} GPAs changed, {time.perf_counter() - started:.1f}s")
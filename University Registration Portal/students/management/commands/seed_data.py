@@ -1,82 +1,209 @@
-from django.core.management.base import BaseCommand
+import random
+import time
+from decimal import Decimal
+from itertools import islice
+
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
 from faker import Faker
-import random
-from students.models import Student, Course, Enrollment, SemesterResult, ResultItem
+
+from catalog.models import Course, Department, Faculty
+from students import catalog
+from students.models import CourseSeats, Student, Enrollment, SemesterResult, ResultItem
+from students.semesters import current_term, get_or_create_semester
 
 User = get_user_model()
 
+DEPARTMENTS = [
+    ("Computer Science and Engineering", "CSE"),
+    ("Software Engineering", "SWE"),
+    ("Electrical and Electronic Engineering", "EEE"),
+    ("Business Administration", "BBA"),
+    ("Law", "LAW"),
+]
+TERMS = ["Spring 2024", "Fall 2024", "Spring 2025"]
+LEVELS = ["1st Semester", "2nd Semester", "3rd Semester"]
+GRADES = [
+    ("A", Decimal("4.00")), ("A-", Decimal("3.70")), ("B+", Decimal("3.30")), ("B", Decimal("3.00")),
+    ("C+", Decimal("2.30")), ("C", Decimal("2.00")), ("D", Decimal("1.00")), ("F", Decimal("0.00")),
+]
+CREDITS = [Decimal("1.0"), Decimal("2.0"), Decimal("3.0"), Decimal("4.0")]
+ITEMS_PER_RESULT = 4
+
+
 class Command(BaseCommand):
-    help = "Generate fake data for Students, Courses, Enrollments, and Results"
+    help = "Generate fake data for Students, Courses, Enrollments, Results, Departments and Faculty"
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=50)
+        parser.add_argument("--courses", type=int, default=50)
+        parser.add_argument("--enrollments-per-student", type=int, default=5)
+        parser.add_argument("--faculty", type=int, default=None, help="faculty members (default: 1 per 50 students)")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--seed", type=int, default=42, help="same seed, same data")
+        parser.add_argument("--password", default="12345", help="password of every seeded account")
+
+    def handle(self, *args, **opts):
+        if User.objects.filter(username="student1").exists():
+            raise CommandError("Seed data already exists; run `manage.py flush` first.")
+
+        self.batch_size = opts["batch_size"]
+        rng = random.Random(opts["seed"])
         fake = Faker()
+        Faker.seed(opts["seed"])
+        # প্রতিটা account এ একই hash, PBKDF2 একবারই চলে
+        password = make_password(opts["password"])
+        # Faker per row is slow at 100k rows; a fixed pool of names keeps it realistic and fast
+        first_names = [fake.first_name() for _ in range(500)]
+        last_names = [fake.last_name() for _ in range(500)]
 
-        # ---------- Create Users & Students ----------
-        students = []
-        for i in range(50):
-            user = User.objects.create_user(
-                username=f"student{i+1}",
-                email=f"student{i+1}@example.com",
-                password="12345"
-            )
-            student = Student.objects.create(
-                user=user,
-                student_id=f"STU{i+1:03d}",
-                full_name=fake.name(),
-                department=random.choice(["CSE", "EEE", "BBA", "LAW"]),
-                batch=random.choice(["2021", "2022", "2023", "2024"]),
-                current_semester=random.choice(["Spring 2024", "Fall 2024", "Spring 2025"]),
-                is_cleared_for_registration=random.choice([True, False])
-            )
-            students.append(student)
+        def name():
+            return f"{rng.choice(first_names)} {rng.choice(last_names)}"
 
-        self.stdout.write(self.style.SUCCESS("✅ Created 50 Students"))
+        started = time.perf_counter()
+        terms = [get_or_create_semester(label) for label in TERMS]
+        levels = [get_or_create_semester(label) for label in LEVELS]
+        # portal (faculty approvals, benches) যে term কে current ধরে, seed ও সেটাই ধরে
+        current = current_term()
+        if current is None:
+            current = terms[-1]
+            current.is_current = True
+            current.save(update_fields=["is_current"])
+        elif current not in terms:
+            terms.append(current)
 
-        # ---------- Create Courses ----------
-        courses = []
-        for i in range(50):
-            course = Course.objects.create(
-                code=f"CSE{i+100}",
-                title=fake.sentence(nb_words=4),
-                credit=random.choice([1.0, 2.0, 3.0, 4.0])
-            )
-            courses.append(course)
-
-        self.stdout.write(self.style.SUCCESS("✅ Created 50 Courses"))
-
-        # ---------- Create Enrollments ----------
-        for student in students:
-            for course in random.sample(courses, 5):  # প্রতিটি student ৫টা course এ enroll
-                Enrollment.objects.create(
-                    student=student,
-                    course=course,
-                    semester=random.choice(["Spring 2024", "Fall 2024", "Spring 2025"]),
-                    status=random.choice(["approved", "pending"])
-                )
-
-        self.stdout.write(self.style.SUCCESS("✅ Created Enrollments"))
-
-        # ---------- Create Semester Results ----------
-        for student in students:
-            sem_result = SemesterResult.objects.create(
-                student=student,
-                semester=random.choice(["1st Semester", "2nd Semester", "3rd Semester"]),
-                gpa=round(random.uniform(2.00, 4.00), 2)
+        # ---------- Departments ----------
+        Department.objects.bulk_create([Department(name=n, code=c) for n, c in DEPARTMENTS], ignore_conflicts=True)
+        depts = dict(Department.objects.filter(code__in=[c for _, c in DEPARTMENTS]).values_list("code", "id"))
+        dept_codes = [c for _, c in DEPARTMENTS]
+
+        # ---------- Faculty ----------
+        n_faculty = opts["faculty"] if opts["faculty"] is not None else max(1, opts["students"] // 50)
+        faculty_rows = [(f"faculty{i + 1}@diu.edu.bd", name(), dept_codes[i % len(dept_codes)])
+                        for i in range(n_faculty)]
+        self.bulk(User, (User(username=email, email=email, password=password) for email, _, _ in faculty_rows))
+        faculty_users = dict(User.objects.filter(username__in=[r[0] for r in faculty_rows])
+                             .values_list("username", "id"))
+        self.bulk(Faculty, (
+            Faculty(faculty_id=f"FAC{i + 1:05d}", name=full_name, email=email,
+                    department_id=depts[dept], user_id=faculty_users[email])
+            for i, (email, full_name, dept) in enumerate(faculty_rows)
+        ))
+        self.report("faculty", n_faculty, started)
+
+        # ---------- Courses ----------
+        t0 = time.perf_counter()
+        course_rows = []
+        for i in range(opts["courses"]):
+            dept = dept_codes[i % len(dept_codes)]
+            course_rows.append((f"{dept}{i + 100}", fake.sentence(nb_words=4)[:200], rng.choice(CREDITS), dept))
+        self.bulk(Course, (
+            Course(code=code, title=title, credit=credit, department_id=depts[dept],
+                   semester_label=f"{current.label}, {current.code}")
+            for code, title, credit, dept in course_rows
+        ))
+        courses = list(Course.objects.filter(code__in=[r[0] for r in course_rows]).values_list("id", "credit"))
+        course_ids = [cid for cid, _ in courses]
+        credit_of = dict(courses)
+        self.report("courses", len(courses), t0)
+
+        # ---------- Users & Students ----------
+        t0 = time.perf_counter()
+        n = opts["students"]
+        self.bulk(User, (
+            User(username=f"student{i + 1}", email=f"student{i + 1}@example.com", password=password)
+            for i in range(n)
+        ))
+        user_ids = User.objects.filter(username__startswith="student", email__endswith="@example.com")\
+            .order_by("id").values_list("id", flat=True)
+        self.bulk(Student, (
+            Student(
+                user_id=uid,
+                student_id=f"STU{i + 1:06d}",
+                full_name=name(),
+                department=rng.choice(dept_codes),
+                batch=rng.choice(["2021", "2022", "2023", "2024"]),
+                current_semester=current,
+                is_cleared_for_registration=rng.random() < 0.5,
             )
+            for i, uid in enumerate(user_ids.iterator(chunk_size=self.batch_size))
+        ))
+        student_ids = list(Student.objects.filter(student_id__startswith="STU").order_by("id")
+                           .values_list("id", flat=True))
+        self.report("students", len(student_ids), t0)
+
+        # ---------- Enrollments ----------
+        t0 = time.perf_counter()
+        per_student = min(opts["enrollments_per_student"], len(course_ids))
+
+        def enrollments():
+            for sid in student_ids:
+                for cid in rng.sample(course_ids, per_student):
+                    term = rng.choice(terms)
+                    # আগের semester গুলো সব approved, শুধু current term এ pending থাকে
+                    status = rng.choice(["approved", "pending"]) if term is current else "approved"
+                    yield Enrollment(student_id=sid, course_id=cid, semester=term, status=status)
+
+        made = self.bulk(Enrollment, enrollments())
+        self.report("enrollments", made, t0)
+
+        # ---------- Semester Results ----------
+        t0 = time.perf_counter()
+        self.bulk(SemesterResult, (
+            SemesterResult(student_id=sid, semester=rng.choice(levels), gpa=Decimal("0.00")) for sid in student_ids
+        ))
+        result_ids = [
+            rid
+            for start in range(0, len(student_ids), self.batch_size)
+            for rid in SemesterResult.objects.filter(student_id__in=student_ids[start:start + self.batch_size])
+            .order_by("id").values_list("id", flat=True)
+        ]
+
+        def result_items():
+            for rid in result_ids:
+                for cid in rng.sample(course_ids, min(ITEMS_PER_RESULT, len(course_ids))):
+                    grade, gp = rng.choice(GRADES)
+                    yield ResultItem(result_id=rid, course_id=cid, credit=credit_of[cid], grade=grade, grade_point=gp)
+
+        made = self.bulk(ResultItem, result_items())
+        self.report("result items", made, t0)
+
+        # ---------- Derived data (bulk_create skips signals) ----------
+        t0 = time.perf_counter()
+        # প্রতিটা (course, semester) offering এর seat counter
+        counts = list(Enrollment.objects.filter(course_id__in=course_ids, status__in=["pending", "approved"])
+                      .order_by().values("course_id", "semester_id").annotate(n=Count("id"))
+                      .values_list("course_id", "semester_id", "n"))
+        self.bulk(CourseSeats, (CourseSeats(course_id=c, semester_id=s, taken=n) for c, s, n in counts))
+        # random enrollments capacity মানে না; সবচেয়ে ভরা offering টাও যেন capacity র মধ্যে থাকে
+        busiest = CourseSeats.objects.filter(course=OuterRef("pk")).order_by("-taken").values("taken")[:1]
+        Course.objects.filter(id__in=course_ids).update(capacity=Greatest(F("capacity"), Coalesce(Subquery(busiest), 0)))
+        catalog.bump_version()
+        # GPA engine: semester GPAs + summaries (CGPA) এক সাথে
+        call_command("recompute_gpa", batch_size=self.batch_size, workers=1, stdout=self.stdout)
+        self.report("seat counters, GPAs + summaries", len(student_ids), t0)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🎉 Done in {time.perf_counter() - started:.1f}s: {len(student_ids)} students, "
+            f"{len(course_ids)} courses, {n_faculty} faculty."
+        ))
+
+    def bulk(self, model, objs):
+        """bulk_create in batch_size slices so huge generators never sit in memory at once."""
+        objs = iter(objs)
+        total = 0
+        while True:
+            chunk = list(islice(objs, self.batch_size))
+            if not chunk:
+                return total
+            model.objects.bulk_create(chunk, batch_size=self.batch_size)
+            total += len(chunk)
 
-            # ---------- Create Result Items ----------
-            for course in random.sample(courses, 4):
-                grade, gp = random.choice([
-                    ("A", 4.00), ("A-", 3.70), ("B+", 3.30), ("B", 3.00),
-                    ("C+", 2.30), ("C", 2.00), ("D", 1.00), ("F", 0.00)
-                ])
-                ResultItem.objects.create(
-                    result=sem_result,
-                    course=course,
-                    credit=course.credit,
-                    grade=grade,
-                    grade_point=gp
-                )
-
-        self.stdout.write(self.style.SUCCESS("🎉 Done! 50 Students, Courses, Enrollments & Results created."))
+    def report(self, what, count, since):
+        elapsed = time.perf_counter() - since
+        rate = count / elapsed if elapsed else 0
+        self.stdout.write(f"✅ {count} {what} in {elapsed:.1f}s ({rate:,.0f} rows/s)")
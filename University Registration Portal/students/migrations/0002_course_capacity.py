@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:06
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_seats_taken(apps, schema_editor):
+    Course = apps.get_model('students', 'Course')
+    Enrollment = apps.get_model('students', 'Enrollment')
+    taken = Enrollment.objects.filter(course=OuterRef('pk'), status__in=['pending', 'approved'])\
+        .order_by().values('course').annotate(n=Count('pk')).values('n')
+    Course.objects.update(seats_taken=Coalesce(Subquery(taken), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='capacity',
+            field=models.PositiveIntegerField(default=40),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='seats_taken',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_seats_taken, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0002_course_capacity'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='enrollment',
+            name='status',
+            field=models.CharField(choices=[('approved', 'Approved'), ('pending', 'Pending'), ('rejected', 'Rejected')], default='pending', max_length=16),
+        ),
+    ]
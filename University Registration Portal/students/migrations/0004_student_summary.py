@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0003_enrollment_rejected_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentSummary',
+            fields=[
+                ('student', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='summary', serialize=False, to='students.student')),
+                ('completed_credits', models.DecimalField(decimal_places=1, default=0, max_digits=6)),
+                ('pending_count', models.PositiveIntegerField(default=0)),
+                ('approved_count', models.PositiveIntegerField(default=0)),
+                ('current_credit_load', models.DecimalField(decimal_places=1, default=0, max_digits=5)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
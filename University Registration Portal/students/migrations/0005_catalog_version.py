@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:10
+
+from django.db import migrations, models
+
+
+def create_version_row(apps, schema_editor):
+    CatalogVersion = apps.get_model('students', 'CatalogVersion')
+    CatalogVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0004_student_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_version_row, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0005_catalog_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['student', 'semester', 'status'], name='enroll_student_sem_status'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['course', 'status'], name='enroll_course_status'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['semester', 'student'], name='enroll_pending_sem_student'),
+        ),
+        migrations.AddIndex(
+            model_name='semesterresult',
+            index=models.Index(fields=['student', 'semester'], name='result_student_semester'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0006_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Semester',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.PositiveIntegerField(blank=True, null=True, unique=True)),
+                ('label', models.CharField(max_length=64, unique=True)),
+                ('season', models.CharField(blank=True, choices=[('spring', 'Spring'), ('summer', 'Summer'), ('fall', 'Fall'), ('short', 'Short')], max_length=8)),
+                ('year', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('start_date', models.DateField(blank=True, null=True)),
+                ('end_date', models.DateField(blank=True, null=True)),
+                ('is_current', models.BooleanField(default=False)),
+            ],
+            options={
+                'ordering': ['-code'],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('is_current',), name='one_current_semester')],
+            },
+        ),
+        # new integer FK columns next to the old strings
+        migrations.AddField(
+            model_name='enrollment',
+            name='term',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='students.semester'),
+        ),
+        migrations.AddField(
+            model_name='semesterresult',
+            name='term',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='students.semester'),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='current_term',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='students.semester'),
+        ),
+    ]
@@ -0,0 +1,95 @@
+import calendar
+import re
+from collections import Counter
+from datetime import date
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+SEASON_INDEX = {'spring': 1, 'summer': 2, 'fall': 3, 'short': 4}
+SEASON_MONTHS = {'spring': (1, 4), 'summer': (5, 8), 'fall': (9, 12)}
+LABEL_RE = re.compile(r'^\s*(spring|summer|fall|short)\s+(\d{4})\b', re.IGNORECASE)
+
+
+def parse_label(label):
+    # frozen copy of students.semesters.parse_label
+    m = LABEL_RE.match(label or '')
+    if not m:
+        return None
+    season, year = m.group(1).lower(), int(m.group(2))
+    fields = {'season': season, 'year': year, 'code': (year % 100) * 10 + SEASON_INDEX[season]}
+    if season in SEASON_MONTHS:
+        first, last = SEASON_MONTHS[season]
+        fields['start_date'] = date(year, first, 1)
+        fields['end_date'] = date(year, last, calendar.monthrange(year, last)[1])
+    return fields
+
+
+def strings_to_semesters(apps, schema_editor):
+    Semester = apps.get_model('students', 'Semester')
+    Student = apps.get_model('students', 'Student')
+    Enrollment = apps.get_model('students', 'Enrollment')
+    SemesterResult = apps.get_model('students', 'SemesterResult')
+
+    labels = set(Enrollment.objects.values_list('semester', flat=True).distinct())
+    labels |= set(SemesterResult.objects.values_list('semester', flat=True).distinct())
+    labels |= set(Student.objects.exclude(current_semester='').values_list('current_semester', flat=True).distinct())
+    # the admin panel used to offer last year .. next year
+    this_year = date.today().year
+    labels |= {f'{season} {year}' for year in range(this_year - 1, this_year + 2)
+               for season in ('Spring', 'Summer', 'Fall', 'Short')}
+
+    for label in sorted(labels):
+        parsed = parse_label(label)
+        if parsed and Semester.objects.filter(code=parsed['code']).exists():
+            # "Spring 2025" and "spring 2025 " are the same term; keep both labels resolvable
+            continue
+        Semester.objects.create(label=label, **(parsed or {}))
+
+    def semester_id_for(column):
+        return Subquery(Semester.objects.filter(label=OuterRef(column)).values('id')[:1])
+
+    Enrollment.objects.update(term=semester_id_for('semester'))
+    SemesterResult.objects.update(term=semester_id_for('semester'))
+    Student.objects.exclude(current_semester='').update(current_term=semester_id_for('current_semester'))
+    # labels that were merged into an existing code above
+    for model, column, target in ((Enrollment, 'semester', 'term'), (SemesterResult, 'semester', 'term'),
+                                  (Student, 'current_semester', 'current_term')):
+        for label in model.objects.filter(**{f'{target}__isnull': True}).exclude(**{column: ''})\
+                .values_list(column, flat=True).distinct():
+            parsed = parse_label(label)
+            if parsed:
+                model.objects.filter(**{column: label}).update(
+                    **{target: Semester.objects.get(code=parsed['code'])})
+
+    # the term most students are in becomes current
+    common = Counter(Student.objects.exclude(current_term=None).values_list('current_term', flat=True))
+    if common:
+        Semester.objects.filter(pk=common.most_common(1)[0][0]).update(is_current=True)
+
+
+def semesters_to_strings(apps, schema_editor):
+    Student = apps.get_model('students', 'Student')
+    Enrollment = apps.get_model('students', 'Enrollment')
+    SemesterResult = apps.get_model('students', 'SemesterResult')
+    Semester = apps.get_model('students', 'Semester')
+
+    def label_for(column):
+        return Subquery(Semester.objects.filter(pk=OuterRef(column)).values('label')[:1])
+
+    Enrollment.objects.update(semester=label_for('term'))
+    SemesterResult.objects.update(semester=label_for('term'))
+    Student.objects.exclude(current_term=None).update(current_semester=label_for('current_term'))
+
+
+class Migration(migrations.Migration):
+    # separate from the schema changes: Postgres refuses ALTER TABLE on a table
+    # with pending deferred FK checks in the same transaction
+
+    dependencies = [
+        ('students', '0007_semester'),
+    ]
+
+    operations = [
+        migrations.RunPython(strings_to_semesters, semesters_to_strings),
+    ]
@@ -0,0 +1,94 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0008_semester_data'),
+    ]
+
+    operations = [
+        # drop the string columns and everything built on them
+        migrations.AlterUniqueTogether(
+            name='enrollment',
+            unique_together=set(),
+        ),
+        migrations.RemoveIndex(
+            model_name='enrollment',
+            name='enroll_student_sem_status',
+        ),
+        migrations.RemoveIndex(
+            model_name='enrollment',
+            name='enroll_pending_sem_student',
+        ),
+        migrations.RemoveIndex(
+            model_name='semesterresult',
+            name='result_student_semester',
+        ),
+        # a default lets the string columns be re-added when migrating backwards
+        migrations.AlterField(
+            model_name='enrollment',
+            name='semester',
+            field=models.CharField(default='', max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='semesterresult',
+            name='semester',
+            field=models.CharField(default='', max_length=64),
+        ),
+        migrations.RemoveField(
+            model_name='enrollment',
+            name='semester',
+        ),
+        migrations.RemoveField(
+            model_name='semesterresult',
+            name='semester',
+        ),
+        migrations.RemoveField(
+            model_name='student',
+            name='current_semester',
+        ),
+        # the FKs take over the old names
+        migrations.RenameField(
+            model_name='enrollment',
+            old_name='term',
+            new_name='semester',
+        ),
+        migrations.RenameField(
+            model_name='semesterresult',
+            old_name='term',
+            new_name='semester',
+        ),
+        migrations.RenameField(
+            model_name='student',
+            old_name='current_term',
+            new_name='current_semester',
+        ),
+        migrations.AlterField(
+            model_name='enrollment',
+            name='semester',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='enrollments', to='students.semester'),
+        ),
+        migrations.AlterField(
+            model_name='semesterresult',
+            name='semester',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='results', to='students.semester'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='enrollment',
+            unique_together={('student', 'course', 'semester')},
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['student', 'semester', 'status'], name='enroll_student_sem_status'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['semester', 'student'], name='enroll_pending_sem_student'),
+        ),
+        migrations.AddIndex(
+            model_name='semesterresult',
+            index=models.Index(fields=['student', 'semester'], name='result_student_semester'),
+        ),
+    ]
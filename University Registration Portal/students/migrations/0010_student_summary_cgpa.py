@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0009_semester_foreign_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentsummary',
+            name='cgpa',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=3),
+        ),
+    ]
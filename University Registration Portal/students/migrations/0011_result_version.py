@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:36
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0010_student_summary_cgpa'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResultVersion',
+            fields=[
+                ('student', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='result_version', serialize=False, to='students.student')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='catalogversion',
+            name='changed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
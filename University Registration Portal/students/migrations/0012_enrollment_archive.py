@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0011_result_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='semester',
+            name='archived_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='ArchivedEnrollment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('approved', 'Approved'), ('pending', 'Pending'), ('rejected', 'Rejected')], max_length=16)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_enrollments', to='students.course')),
+                ('semester', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_enrollments', to='students.semester')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_enrollments', to='students.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['student', 'semester'], name='archenroll_student_sem')],
+            },
+        ),
+    ]
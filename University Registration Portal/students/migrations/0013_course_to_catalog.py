@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0002_merge_legacy_catalog'),
+        ('students', '0012_enrollment_archive'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resultitem',
+            name='course',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='catalog.course'),
+        ),
+        migrations.AlterField(
+            model_name='archivedenrollment',
+            name='course',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_enrollments', to='catalog.course'),
+        ),
+        migrations.AlterField(
+            model_name='enrollment',
+            name='course',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollments', to='catalog.course'),
+        ),
+        migrations.DeleteModel(
+            name='Course',
+        ),
+    ]
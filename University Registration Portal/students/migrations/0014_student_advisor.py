@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0002_merge_legacy_catalog'),
+        ('students', '0013_course_to_catalog'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='advisor',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='advisees', to='catalog.faculty'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['advisor', 'student_id'], name='student_advisor_sid'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0002_merge_legacy_catalog'),
+        ('students', '0014_student_advisor'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Waitlist',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('issued', models.PositiveIntegerField(default=0)),
+                ('promoted', models.PositiveIntegerField(default=0)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlists', to='catalog.course')),
+                ('semester', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlists', to='students.semester')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WaitlistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist_entries', to='students.student')),
+                ('waitlist', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='students.waitlist')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='waitlist',
+            constraint=models.UniqueConstraint(fields=('course', 'semester'), name='waitlist_course_semester'),
+        ),
+        migrations.AddIndex(
+            model_name='waitlistentry',
+            index=models.Index(fields=['waitlist', 'position'], name='waitlist_entry_position'),
+        ),
+        migrations.AddConstraint(
+            model_name='waitlistentry',
+            constraint=models.UniqueConstraint(fields=('student', 'waitlist'), name='waitlist_entry_student'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_course_seats(apps, schema_editor):
+    """প্রতিটা (course, semester) এর pending + approved enrollments গুনে seat row।"""
+    Enrollment = apps.get_model('students', 'Enrollment')
+    CourseSeats = apps.get_model('students', 'CourseSeats')
+    counts = Enrollment.objects.filter(status__in=['pending', 'approved']).order_by()\
+        .values('course_id', 'semester_id').annotate(n=Count('pk')).values_list('course_id', 'semester_id', 'n')
+    CourseSeats.objects.bulk_create(
+        (CourseSeats(course_id=course_id, semester_id=semester_id, taken=n) for course_id, semester_id, n in counts),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0003_remove_course_seats_taken'),
+        ('students', '0015_waitlist'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseSeats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('taken', models.PositiveIntegerField(default=0)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seat_counts', to='catalog.course')),
+                ('semester', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seat_counts', to='students.semester')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('course', 'semester'), name='seats_course_semester')],
+            },
+        ),
+        migrations.RunPython(backfill_course_seats, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,35 @@
 from django.db import models
 from django.conf import settings  
+from django.utils import timezone
+
+class Semester(models.Model):
+    SEASON_CHOICES = (
+        ("spring", "Spring"),
+        ("summer", "Summer"),
+        ("fall", "Fall"),
+        ("short", "Short"),
+    )
+    # yy*10 + season, e.g. 251 = Spring 2025; null for legacy labels like "1st Semester"
+    code = models.PositiveIntegerField(unique=True, null=True, blank=True)
+    label = models.CharField(max_length=64, unique=True)  # e.g., "Spring 2025"
+    season = models.CharField(max_length=8, choices=SEASON_CHOICES, blank=True)
+    year = models.PositiveSmallIntegerField(null=True, blank=True)
+    start_date = models.DateField(null=True, blank=True)
+    end_date = models.DateField(null=True, blank=True)
+    is_current = models.BooleanField(default=False)
+    # set by `manage.py archive_semester` once its enrollments live in ArchivedEnrollment
+    archived_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-code"]
+        constraints = [
+            models.UniqueConstraint(fields=["is_current"], condition=models.Q(is_current=True),
+                                    name="one_current_semester"),
+        ]
+
+    def __str__(self):
+        return self.label
+
 
 class Student(models.Model):
     user = models.OneToOneField(
@@ -11,51 +41,199 @@ class Student(models.Model):
     full_name = models.CharField(max_length=120)
     department = models.CharField(max_length=120, blank=True)
     batch = models.CharField(max_length=32, blank=True)
-    current_semester = models.CharField(max_length=64, blank=True)  # e.g., "Spring 2025"
+    current_semester = models.ForeignKey(Semester, on_delete=models.SET_NULL, null=True, blank=True,
+                                         related_name="+")
     is_cleared_for_registration = models.BooleanField(default=False)
+    # students.advising balances these; indexed together with student_id below
+    advisor = models.ForeignKey("catalog.Faculty", on_delete=models.SET_NULL, null=True, blank=True,
+                                related_name="advisees", db_index=False)
+
+    class Meta:
+        indexes = [
+            # faculty student list / approvals / stats: advisor = X ordered by student_id
+            models.Index(fields=["advisor", "student_id"], name="student_advisor_sid"),
+        ]
 
     def __str__(self):
         return f"{self.full_name} ({self.student_id})"
 
 
-class Course(models.Model):
-    code = models.CharField(max_length=16, unique=True)
-    title = models.CharField(max_length=200)
-    credit = models.DecimalField(max_digits=3, decimal_places=1, default=3.0)
+class CatalogVersion(models.Model):
+    """
+    Single row; course catalog এ যেকোনো write হলে version বাড়ে।
+    students.catalog compares it against its in-process snapshots.
+    """
+    version = models.PositiveBigIntegerField(default=0)
+    changed_at = models.DateTimeField(default=timezone.now)  # Last-Modified of catalog pages
 
     def __str__(self):
-        return f"{self.code} - {self.title}"
+        return f"Catalog v{self.version}"
 
 
 class Enrollment(models.Model):
     STATUS_CHOICES = (
         ("approved", "Approved"),
         ("pending", "Pending"),
+        ("rejected", "Rejected"),
     )
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="enrollments")
-    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="enrollments")
-    semester = models.CharField(max_length=64)  # e.g., "Spring 2025"
+    course = models.ForeignKey("catalog.Course", on_delete=models.CASCADE, related_name="enrollments")
+    semester = models.ForeignKey(Semester, on_delete=models.PROTECT, related_name="enrollments")
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending")
 
     class Meta:
         unique_together = ("student", "course", "semester")
+        indexes = [
+            # student dashboard / my_courses / registration
+            models.Index(fields=["student", "semester", "status"], name="enroll_student_sem_status"),
+            # per-course pending/approved lists and counts
+            models.Index(fields=["course", "status"], name="enroll_course_status"),
+            # faculty approvals only ever look at pending rows
+            models.Index(fields=["semester", "student"], condition=models.Q(status="pending"),
+                         name="enroll_pending_sem_student"),
+        ]
 
     def __str__(self):
         return f"{self.student} -> {self.course} ({self.semester}) [{self.status}]"
 
 
+class CourseSeats(models.Model):
+    """
+    এক semester এ একটা course এর কয়টা seat নেওয়া (pending + approved)।
+    Capacity is per offering (Course.capacity), so every semester starts
+    from its own counter; students.enrollment creates the row on first use
+    and claims / releases seats against it.
+    """
+    course = models.ForeignKey("catalog.Course", on_delete=models.CASCADE, related_name="seat_counts")
+    semester = models.ForeignKey(Semester, on_delete=models.CASCADE, related_name="seat_counts")
+    taken = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["course", "semester"], name="seats_course_semester"),
+        ]
+
+    def __str__(self):
+        return f"{self.course} ({self.semester}): {self.taken} taken"
+
+
+class Waitlist(models.Model):
+    """
+    একটা course + semester এর queue। Live entries hold positions
+    promoted+1 .. issued with no gaps, so a student's place in line is
+    `entry.position - waitlist.promoted` (students.enrollment keeps it so).
+    """
+    course = models.ForeignKey("catalog.Course", on_delete=models.CASCADE, related_name="waitlists")
+    semester = models.ForeignKey(Semester, on_delete=models.CASCADE, related_name="waitlists")
+    issued = models.PositiveIntegerField(default=0)    # last position handed out
+    promoted = models.PositiveIntegerField(default=0)  # positions that already left the head of the line
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["course", "semester"], name="waitlist_course_semester"),
+        ]
+
+    @property
+    def length(self):
+        return self.issued - self.promoted
+
+    def __str__(self):
+        return f"Waitlist {self.course} ({self.semester}): {self.length}"
+
+
+class WaitlistEntry(models.Model):
+    waitlist = models.ForeignKey(Waitlist, on_delete=models.CASCADE, related_name="entries")
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="waitlist_entries")
+    position = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            # student এর দিক থেকেও index: registration page এ নিজের entries
+            models.UniqueConstraint(fields=["student", "waitlist"], name="waitlist_entry_student"),
+        ]
+        indexes = [
+            # promotion takes the head of the line
+            models.Index(fields=["waitlist", "position"], name="waitlist_entry_position"),
+        ]
+
+    @property
+    def place(self):
+        """1 মানে পরের seat টা এর।"""
+        return self.position - self.waitlist.promoted
+
+    def __str__(self):
+        return f"{self.student} #{self.position} in {self.waitlist_id}"
+
+
+class ArchivedEnrollment(models.Model):
+    """
+    Closed semester এর enrollment, Enrollment থেকে একই id নিয়ে এখানে সরানো।
+    `manage.py archive_semester` moves the rows; read them through students.history.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="archived_enrollments")
+    course = models.ForeignKey("catalog.Course", on_delete=models.CASCADE, related_name="archived_enrollments")
+    semester = models.ForeignKey(Semester, on_delete=models.PROTECT, related_name="archived_enrollments")
+    status = models.CharField(max_length=16, choices=Enrollment.STATUS_CHOICES)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["student", "semester"], name="archenroll_student_sem"),
+        ]
+
+    def __str__(self):
+        return f"{self.student} -> {self.course} ({self.semester}) [{self.status}, archived]"
+
+
 class SemesterResult(models.Model):
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="semester_results")
-    semester = models.CharField(max_length=64)  # e.g., "3rd Semester" (তুমিই কাস্টমাইজ করতে পারো)
+    semester = models.ForeignKey(Semester, on_delete=models.PROTECT, related_name="results")
     gpa = models.DecimalField(max_digits=3, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["student", "semester"], name="result_student_semester"),
+        ]
+
     def __str__(self):
         return f"{self.student} - {self.semester} (GPA {self.gpa})"
 
 
 class ResultItem(models.Model):
     result = models.ForeignKey(SemesterResult, on_delete=models.CASCADE, related_name="items")
-    course = models.ForeignKey(Course, on_delete=models.PROTECT)
+    course = models.ForeignKey("catalog.Course", on_delete=models.PROTECT)
     credit = models.DecimalField(max_digits=3, decimal_places=1)
     grade = models.CharField(max_length=4)        # e.g., A, B+, C
     grade_point = models.DecimalField(max_digits=3, decimal_places=2)  # e.g., 4.00, 3.50
+
+
+class StudentSummary(models.Model):
+    """
+    Dashboard এর সংখ্যাগুলো আগে থেকে হিসাব করে রাখা read model.
+    students.summary keeps it in step with Enrollment/ResultItem writes.
+    """
+    student = models.OneToOneField(Student, on_delete=models.CASCADE, primary_key=True, related_name="summary")
+    completed_credits = models.DecimalField(max_digits=6, decimal_places=1, default=0)
+    cgpa = models.DecimalField(max_digits=3, decimal_places=2, default=0)
+    # the three below cover the student's current_semester only
+    pending_count = models.PositiveIntegerField(default=0)
+    approved_count = models.PositiveIntegerField(default=0)
+    current_credit_load = models.DecimalField(max_digits=5, decimal_places=1, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Summary of {self.student_id}"
+
+
+class ResultVersion(models.Model):
+    """
+    Student প্রতি একটা row; তার কোনো SemesterResult বা ResultItem বদলালে version বাড়ে।
+    The result page's ETag / Last-Modified come from here (students.conditional).
+    """
+    student = models.OneToOneField(Student, on_delete=models.CASCADE, primary_key=True, related_name="result_version")
+    version = models.PositiveBigIntegerField(default=0)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Results of {self.student_id} v{self.version}"
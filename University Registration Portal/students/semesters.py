@@ -0,0 +1,118 @@
+"""
+Semester lookups that hot paths can call on every request.
+
+The Semester table is tiny and changes a few times a year, so each worker
+keeps it in memory for SEMESTER_CACHE_TTL seconds. Saves in this process
+clear the cache immediately; other workers pick the change up within the TTL.
+"""
+import calendar
+import re
+import threading
+import time
+from datetime import date
+
+from django.conf import settings
+
+from .models import Semester
+
+SEASONS = [("Spring", 1), ("Summer", 2), ("Fall", 3), ("Short", 4)]
+SEASON_INDEX = {name.lower(): idx for name, idx in SEASONS}
+# month the season starts in and the month it ends in
+SEASON_MONTHS = {"spring": (1, 4), "summer": (5, 8), "fall": (9, 12)}
+
+_LABEL_RE = re.compile(r"^\s*(spring|summer|fall|short)\s+(\d{4})\b", re.IGNORECASE)
+
+_lock = threading.Lock()
+_cache = {"loaded_at": None, "by_id": {}, "by_label": {}, "current": None, "options": ()}
+
+
+# ---- Parsing ----
+def semester_code(season, year):
+    """Spring 2025 -> 251, Fall 2024 -> 243 (admin panel এর পুরনো code scheme)।"""
+    return (year % 100) * 10 + SEASON_INDEX[season.lower()]
+
+
+def parse_label(label):
+    """"Spring 2025" -> dict(season=..., year=..., code=...); free text হলে None।"""
+    m = _LABEL_RE.match(label or "")
+    if not m:
+        return None
+    season, year = m.group(1).lower(), int(m.group(2))
+    fields = {"season": season, "year": year, "code": semester_code(season, year)}
+    if season in SEASON_MONTHS:
+        first, last = SEASON_MONTHS[season]
+        fields["start_date"] = date(year, first, 1)
+        fields["end_date"] = date(year, last, calendar.monthrange(year, last)[1])
+    return fields
+
+
+def get_or_create_semester(label):
+    """Label থেকে Semester; "Spring 2025, 251" আর "Spring 2025" একই row পায়।"""
+    label = (label or "").strip()
+    parsed = parse_label(label)
+    if parsed:
+        label = f"{parsed['season'].title()} {parsed['year']}"
+    semester = semester_by_label(label)
+    if semester is None:
+        if parsed:
+            semester, _ = Semester.objects.get_or_create(code=parsed["code"], defaults=dict(parsed, label=label))
+        else:
+            semester, _ = Semester.objects.get_or_create(label=label)
+        clear()
+    return semester
+
+
+# ---- Process cache ----
+def _load():
+    rows = list(Semester.objects.order_by("-code", "label"))
+    current = next((s for s in rows if s.is_current), None)
+    if current is None:
+        today = date.today()
+        current = next((s for s in rows if s.start_date and s.end_date and s.start_date <= today <= s.end_date), None)
+    _cache.update(
+        loaded_at=time.monotonic(),
+        by_id={s.pk: s for s in rows},
+        by_label={s.label: s for s in rows},
+        current=current,
+        options=tuple({"label": f"{s.label}, {s.code}" if s.code else s.label} for s in rows),
+    )
+
+
+def _fresh():
+    ttl = getattr(settings, "SEMESTER_CACHE_TTL", 60)
+    with _lock:
+        if _cache["loaded_at"] is None or time.monotonic() - _cache["loaded_at"] > ttl:
+            _load()
+        return _cache
+
+
+def clear():
+    with _lock:
+        _cache["loaded_at"] = None
+
+
+def current_term():
+    """এখনকার semester (is_current, না থাকলে আজকের তারিখ যেটার ভেতরে পড়ে), নাহলে None।"""
+    return _fresh()["current"]
+
+
+def semester_by_id(pk):
+    return _fresh()["by_id"].get(pk)
+
+
+def semester_by_label(label):
+    return _fresh()["by_label"].get(label)
+
+
+def semester_options():
+    """Admin panel এর semester datalist, newest first."""
+    return _fresh()["options"]
+
+
+def attach_semester(student):
+    """student.current_semester কে cache থেকে বসিয়ে দেয় যাতে template এ আলাদা query না হয়।"""
+    if student is not None and student.current_semester_id:
+        semester = semester_by_id(student.current_semester_id)
+        if semester is not None:
+            student.current_semester = semester
+    return student
@@ -0,0 +1,77 @@
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from catalog.models import Course
+
+from . import catalog, semesters
+from .conditional import bump_results
+from .models import Enrollment, ResultItem, Semester, SemesterResult, Student
+from .gpa import mark_result_dirty
+from .summary import mark_dirty
+
+
+def deleted_with(kwargs, *models):
+    """post_delete টা এই models এর কোনোটা মোছার cascade থেকে এসেছে কিনা।"""
+    origin = kwargs.get("origin")
+    if origin is None:
+        return False
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(model, models)
+
+
+def deleted_with_student(kwargs):
+    """Student বা User মোছার cascade; তখন তার summary/version নিয়ে কিছু করার নেই।"""
+    return deleted_with(kwargs, Student, get_user_model())
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def enrollment_changed(sender, instance, **kwargs):
+    if not deleted_with_student(kwargs):
+        mark_dirty([instance.student_id])
+
+
+@receiver(post_save, sender=ResultItem)
+@receiver(post_delete, sender=ResultItem)
+def result_item_changed(sender, instance, **kwargs):
+    # পুরো result মুছলে result_changed একবারেই সামলায়
+    if deleted_with(kwargs, SemesterResult, Student, get_user_model()):
+        return
+    if ResultItem.result.is_cached(instance):
+        student_id = instance.result.student_id
+    else:
+        student_id = SemesterResult.objects.filter(pk=instance.result_id).values_list("student_id", flat=True).first()
+    mark_result_dirty(instance.result_id)
+    mark_dirty([student_id])
+    bump_results([student_id])
+
+
+@receiver(post_save, sender=SemesterResult)
+@receiver(post_delete, sender=SemesterResult)
+def result_changed(sender, instance, **kwargs):
+    if deleted_with_student(kwargs):
+        return
+    if kwargs["signal"] is post_delete:
+        mark_dirty([instance.student_id])
+    bump_results([instance.student_id])
+
+
+@receiver(post_save, sender=Student)
+def student_saved(sender, instance, created, **kwargs):
+    # current_semester বদলালে current load ও বদলায়
+    if not created:
+        mark_dirty([instance.pk])
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def catalog_changed(sender, **kwargs):
+    catalog.bump_version()
+
+
+@receiver(post_save, sender=Semester)
+@receiver(post_delete, sender=Semester)
+def semester_changed(sender, **kwargs):
+    semesters.clear()
@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+
+from .gpa import POINTS, quantize_gpa
+from .models import Enrollment, ResultItem, Student, StudentSummary
+
+SUMMARY_FIELDS = ["completed_credits", "cgpa", "pending_count", "approved_count", "current_credit_load", "updated_at"]
+
+
+def compute_summaries(student_ids):
+    """
+    Given student ids এর জন্য StudentSummary অবজেক্ট বানায় (save করে না)।
+    Two grouped queries whatever the number of students.
+    """
+    student_ids = list(student_ids)
+    completed = {
+        sid: (credits, points)
+        for sid, credits, points in ResultItem.objects.filter(result__student_id__in=student_ids)
+        .values("result__student_id").order_by()
+        .annotate(total=Sum("credit"), points=Sum(POINTS))
+        .values_list("result__student_id", "total", "points")
+    }
+    current = {
+        row["student_id"]: row
+        for row in Enrollment.objects.filter(student_id__in=student_ids, semester=F("student__current_semester"))
+        .values("student_id").order_by()
+        .annotate(
+            pending=Count("id", filter=Q(status="pending")),
+            approved=Count("id", filter=Q(status="approved")),
+            load=Sum("course__credit", filter=Q(status__in=["pending", "approved"])),
+        )
+    }
+    summaries = []
+    for sid in student_ids:
+        row = current.get(sid, {})
+        credits, points = completed.get(sid, (None, None))
+        summaries.append(StudentSummary(
+            student_id=sid,
+            completed_credits=credits or Decimal("0"),
+            cgpa=quantize_gpa(points, credits),
+            pending_count=row.get("pending", 0),
+            approved_count=row.get("approved", 0),
+            current_credit_load=row.get("load") or Decimal("0"),
+        ))
+    return summaries
+
+
+def refresh_summaries(student_ids):
+    """Recompute and upsert the summaries of just these students (ids of deleted students are skipped)."""
+    student_ids = {sid for sid in student_ids if sid is not None}
+    if not student_ids:
+        return []
+    # on_commit এ চলে; এর মধ্যে student মুছে গেলে summary insert FK তে আটকাত
+    student_ids = set(Student.objects.filter(pk__in=student_ids).values_list("pk", flat=True))
+    if not student_ids:
+        return []
+    return StudentSummary.objects.bulk_create(
+        compute_summaries(student_ids),
+        update_conflicts=True,
+        unique_fields=["student"],
+        update_fields=SUMMARY_FIELDS,
+    )
+
+
+def mark_dirty(student_ids):
+    """
+    Schedule a summary refresh for when the current transaction commits, so a
+    rolled-back write never leaks into the read model.
+    """
+    student_ids = set(student_ids)
+    if student_ids:
+        transaction.on_commit(lambda: refresh_summaries(student_ids))
+
+
+def get_summary(student):
+    """Dashboard এর জন্য একটাই primary-key read; প্রথমবার হলে তৈরি করে নেয়।"""
+    summary = StudentSummary.objects.filter(pk=student.pk).first()
+    if summary is None:
+        summary = refresh_summaries([student.pk])[0]
+    return summary
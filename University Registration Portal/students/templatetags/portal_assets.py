@@ -0,0 +1,41 @@
+from functools import lru_cache
+
+from django import template
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.utils.html import format_html
+
+register = template.Library()
+
+STYLESHEET = "css/portal.css"
+FONTS = ("fonts/inter/inter-latin-400-normal.woff2",)
+TAILWIND_CDN = "https://cdn.tailwindcss.com"
+
+
+@lru_cache(maxsize=None)
+def _url(name):
+    # dev এ assets/static থেকে (finders), collectstatic এর পর STATIC_ROOT থেকে
+    if not (finders.find(name) or staticfiles_storage.exists(name)):
+        return None
+    try:
+        return staticfiles_storage.url(name)
+    except ValueError:  # manifest এ নেই: build এর পর collectstatic চলেনি
+        return None
+
+
+@register.simple_tag
+def portal_styles():
+    """
+    <link> to the prebuilt, hashed stylesheet (plus a preload of the body
+    font). Until `manage.py build_assets` has run it falls back to the
+    Tailwind CDN so a fresh checkout still renders.
+    """
+    css = _url(STYLESHEET)
+    if css is None:
+        return format_html('<script src="{}"></script>', TAILWIND_CDN)
+    tags = [format_html('<link rel="stylesheet" href="{}">', css)]
+    for font in FONTS:
+        url = _url(font)
+        if url:
+            tags.append(format_html('<link rel="preload" href="{}" as="font" type="font/woff2" crossorigin>', url))
+    return format_html("".join(["{}"] * len(tags)), *tags)
@@ -1,3 +1,432 @@
-from django.test import TestCase
+from decimal import Decimal
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from catalog.models import Course, Faculty
+
+from . import catalog, semesters
+from .advising import AssignmentReport, balance
+from .enrollment import (AlreadyWaitlisted, SeatsAvailable, decide_pending, drop, enroll, enroll_many, join_waitlist,
+                         leave_waitlist, promote_waitlists)
+from .gpa import recompute_results
+from .models import (CourseSeats, Enrollment, ResultItem, ResultVersion, Semester, SemesterResult, Student,
+                     StudentSummary, Waitlist, WaitlistEntry)
+from .summary import refresh_summaries
+
+
+# ---- JSON API ----
+class ApiTests(TestCase):
+    """Query counts of /api/v1/ must not grow with the number of rows."""
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        Semester.objects.update(is_current=False)
+        cls.term = Semester.objects.create(label="Spring 2091", code=911, season="spring", year=2091, is_current=True)
+        old = Semester.objects.create(label="Fall 2090", code=903, season="fall", year=2090)
+        cls.user = User.objects.create_user("s1", password="pw")
+        cls.student = Student.objects.create(user=cls.user, student_id="S-1", full_name="Student One",
+                                             current_semester=cls.term)
+        cls.courses = Course.objects.bulk_create([
+            Course(code=f"CSE{100 + i}", title=f"Course {i}", credit=Decimal("3.0")) for i in range(12)
+        ])
+        Enrollment.objects.bulk_create([
+            Enrollment(student=cls.student, course=c, semester=cls.term) for c in cls.courses[:6]
+        ])
+        for term in (old, cls.term):
+            result = SemesterResult.objects.create(student=cls.student, semester=term, gpa=Decimal("3.50"))
+            ResultItem.objects.bulk_create([
+                ResultItem(result=result, course=c, credit=c.credit, grade="A-", grade_point=Decimal("3.70"))
+                for c in cls.courses[6:10]
+            ])
+
+    def setUp(self):
+        cache.clear()
+        catalog.clear()
+        semesters.clear()
+        self.client.force_login(self.user)
+        # principal, semester আর catalog cache গরম করে রাখি
+        self.client.get("/api/v1/me")
+        self.client.get("/api/v1/courses")
+
+    def add_rows(self):
+        for c in self.courses[6:]:
+            Enrollment.objects.create(student=self.student, course=c, semester=self.term)
+        result = SemesterResult.objects.get(student=self.student, semester=self.term)
+        ResultItem.objects.bulk_create([
+            ResultItem(result=result, course=c, credit=c.credit, grade="B", grade_point=Decimal("3.00"))
+            for c in self.courses[:6]
+        ])
+
+    def test_profile_queries(self):
+        # session + (cached principal) + summary
+        with self.assertNumQueries(2):
+            data = self.client.get("/api/v1/me").json()["data"]
+        self.assertEqual(data["current_semester"], "Spring 2091")
+        with self.assertNumQueries(1):
+            data = self.client.get("/api/v1/me?fields=full_name,batch").json()["data"]
+        self.assertEqual(list(data), ["full_name", "batch"])
+
+    def test_enrollment_queries_are_constant(self):
+        with self.assertNumQueries(2):
+            self.client.get("/api/v1/enrollments")
+        self.add_rows()
+        with self.assertNumQueries(2):
+            body = self.client.get("/api/v1/enrollments?fields=course_code,status").json()
+        self.assertEqual(len(body["data"]), 12)
+        self.assertEqual(set(body["data"][0]), {"course_code", "status"})
+
+    def test_result_items_are_batched(self):
+        with self.assertNumQueries(3):
+            self.client.get("/api/v1/results")
+        self.add_rows()
+        with self.assertNumQueries(3):
+            body = self.client.get("/api/v1/results").json()
+        self.assertEqual(sum(len(r["items"]) for r in body["data"]), 14)
+        with self.assertNumQueries(2):
+            self.client.get("/api/v1/results?fields=semester,gpa")
+
+    def test_catalog_from_snapshot(self):
+        # session + catalog version check, whatever the page
+        with self.assertNumQueries(2):
+            first = self.client.get("/api/v1/courses?limit=5&fields=code,title").json()
+        with self.assertNumQueries(2):
+            second = self.client.get(f"/api/v1/courses?limit=5&fields=code&cursor={first['next']}").json()
+        codes = [c["code"] for c in first["data"] + second["data"]]
+        self.assertEqual(codes, sorted(c.code for c in self.courses)[:10])
+
+    def test_seats_left_is_live(self):
+        course = min(self.courses, key=lambda c: c.code)
+        Course.objects.filter(pk=course.pk).update(capacity=1)
+        catalog.bump_version()
+        self.assertEqual(self.client.get("/api/v1/courses?limit=1").json()["data"][0]["seats_left"], 1)
+        Enrollment.objects.filter(student=self.student, course=course).delete()
+        self.student.is_cleared_for_registration = True
+        enroll(self.student, course.pk)
+        # + one seat read for the page
+        with self.assertNumQueries(3):
+            row = self.client.get("/api/v1/courses?limit=1").json()["data"][0]
+        self.assertEqual(row["seats_left"], 0)
+
+    def test_cursor_pagination_walks_every_row(self):
+        self.add_rows()
+        seen, url = [], "/api/v1/enrollments?limit=5&fields=id"
+        while url:
+            body = self.client.get(url).json()
+            seen += [r["id"] for r in body["data"]]
+            url = body["next"] and f"/api/v1/enrollments?limit=5&fields=id&cursor={body['next']}"
+        self.assertEqual(seen, sorted(Enrollment.objects.filter(student=self.student).values_list("id", flat=True)))
+
+    def test_errors(self):
+        self.assertEqual(self.client.get("/api/v1/courses?fields=nope").status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/enrollments?cursor=%%%").status_code, 400)
+        self.assertEqual(self.client.post("/api/v1/me").status_code, 405)
+        self.assertEqual(Client().get("/api/v1/me").status_code, 401)
+        faculty_user = get_user_model().objects.create_user("f1", password="pw")
+        Faculty.objects.create(faculty_id="F-1", name="F", email="f@example.com", user=faculty_user)
+        other = Client()
+        other.force_login(faculty_user)
+        self.assertEqual(other.get("/api/v1/me").status_code, 403)
+
+
+# ---- Registration cart ----
+def taken(course_id, semester):
+    return CourseSeats.objects.filter(course_id=course_id, semester=semester).values_list("taken", flat=True).first() or 0
+
+
+def set_taken(course_id, semester, n):
+    CourseSeats.objects.update_or_create(course_id=course_id, semester=semester, defaults={"taken": n})
+
+
+
+class RegistrationCartTests(TestCase):
+    """পুরো cart একটা POST, এক transaction: সব course নয়তো একটাও না।"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Semester.objects.update(is_current=False)
+        cls.term = Semester.objects.create(label="Summer 2091", code=912, season="summer", year=2091, is_current=True)
+        cls.user = get_user_model().objects.create_user("cart1", password="pw")
+        cls.student = Student.objects.create(user=cls.user, student_id="S-C1", full_name="Cart Student",
+                                             current_semester=cls.term, is_cleared_for_registration=True)
+        cls.courses = Course.objects.bulk_create([
+            Course(code=f"EEE{200 + i}", title=f"Course {i}", credit=Decimal("3.0"), capacity=2) for i in range(8)
+        ])
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def submit(self, courses):
+        return self.client.post(reverse("register-course"), {"course_id": [c.pk for c in courses]})
+
+    def test_page_form_reaches_register_course(self):
+        # page এর form টাই endpoint এ পৌঁছায়: action আর course_id input দুটোই আছে
+        page = self.client.get(reverse("registration"))
+        self.assertContains(page, f'action="{reverse("register-course")}"')
+        self.assertContains(page, f'name="course_id" value="{self.courses[0].pk}"')
+        self.client.post(reverse("register-course"), {"course_id": self.courses[0].pk})
+        self.assertTrue(Enrollment.objects.filter(student=self.student, course=self.courses[0]).exists())
+
+    def test_queries_do_not_grow_with_cart_size(self):
+        self.submit(self.courses[:1])
+        with CaptureQueriesContext(connection) as two:
+            self.submit(self.courses[1:3])
+        with CaptureQueriesContext(connection) as five:
+            self.submit(self.courses[3:8])
+        self.assertEqual(len(two), len(five))
+        self.assertEqual(Enrollment.objects.filter(student=self.student, status="pending").count(), 8)
+        self.assertEqual({taken(c.pk, self.term) for c in self.courses}, {1})
+
+    def test_full_course_rejects_whole_cart(self):
+        set_taken(self.courses[2].pk, self.term, 2)
+        response = self.submit(self.courses[:4])
+        self.assertRedirects(response, reverse("registration"), fetch_redirect_response=False)
+        self.assertFalse(Enrollment.objects.filter(student=self.student).exists())
+        self.assertEqual(taken(self.courses[0].pk, self.term), 0)
+        # refused selection টা page এ checked থাকে
+        page = self.client.get(reverse("registration"))
+        self.assertContains(page, "No seats left in EEE202")
+        self.assertRegex(page.content.decode(), rf'value="{self.courses[0].pk}"[^>]*\bchecked\b')
+        self.assertNotRegex(page.content.decode(), rf'value="{self.courses[4].pk}"[^>]*\bchecked\b')
+
+    def test_each_semester_has_its_own_seats(self):
+        # আগের semester এ full course নতুন semester এ আবার খালি
+        old = Semester.objects.create(label="Spring 2091x", code=910, season="spring", year=2091)
+        set_taken(self.courses[0].pk, old, 2)
+        self.submit(self.courses[:1])
+        self.assertTrue(Enrollment.objects.filter(student=self.student, semester=self.term).exists())
+        self.assertEqual((taken(self.courses[0].pk, old), taken(self.courses[0].pk, self.term)), (2, 1))
+
+    def test_duplicate_course_rejects_whole_cart(self):
+        self.submit(self.courses[:1])
+        self.submit(self.courses[:3])
+        self.assertEqual(Enrollment.objects.filter(student=self.student).count(), 1)
+        self.assertEqual(taken(self.courses[1].pk, self.term), 0)
+
+
+# ---- Waitlist ----
+class WaitlistTests(TestCase):
+    """Gap-free positions, আর seat খালি হলে head থেকে batch এ promotion।"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Semester.objects.update(is_current=False)
+        cls.term = Semester.objects.create(label="Fall 2091", code=913, season="fall", year=2091, is_current=True)
+        cls.course = Course.objects.create(code="MAT301", title="Algebra", credit=Decimal("3.0"), capacity=3)
+        User = get_user_model()
+        cls.students = [
+            Student.objects.create(user=User.objects.create_user(f"w{i}", password="pw"), student_id=f"S-W{i}",
+                                   full_name=f"Waiting {i}", current_semester=cls.term, is_cleared_for_registration=True)
+            for i in range(8)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.seated = enroll_many(self.students[0], [self.course.pk]) + enroll_many(self.students[1], [self.course.pk]) \
+            + enroll_many(self.students[2], [self.course.pk])
+
+    def places(self):
+        return {e.student_id: e.place for e in WaitlistEntry.objects.select_related("waitlist")}
+
+    def test_positions_stay_gap_free(self):
+        set_taken(self.course.pk, self.term, 2)
+        with self.assertRaises(SeatsAvailable):
+            join_waitlist(self.students[3], self.course.pk)
+        set_taken(self.course.pk, self.term, 3)
+        for s in self.students[3:7]:
+            join_waitlist(s, self.course.pk)
+        with self.assertRaises(AlreadyWaitlisted):
+            join_waitlist(self.students[3], self.course.pk)
+        leave_waitlist(self.students[4], self.course.pk)
+        ids = [s.pk for s in self.students]
+        self.assertEqual(self.places(), {ids[3]: 1, ids[5]: 2, ids[6]: 3})
+
+    def test_reject_and_drop_promote_in_one_batch(self):
+        for s in self.students[3:7]:
+            join_waitlist(s, self.course.pk)
+        # head এ থাকা student এর আগে থেকেই enrollment: seat না নিয়ে জায়গা ছাড়ে
+        Enrollment.objects.create(student=self.students[3], course=self.course, semester=self.term, status="rejected")
+
+        decide_pending(Enrollment.objects.filter(pk__in=[e.pk for e in self.seated[:2]]), "reject")
+        ids = [s.pk for s in self.students]
+        promoted = set(Enrollment.objects.filter(status="pending").values_list("student_id", flat=True))
+        self.assertEqual(promoted, {ids[2], ids[4], ids[5]})
+        self.assertEqual(taken(self.course.pk, self.term), 3)
+        self.assertEqual(self.places(), {ids[6]: 1})
+
+        drop(self.students[2], [self.seated[2].pk])
+        self.assertTrue(Enrollment.objects.filter(student=self.students[6], status="pending").exists())
+        self.assertEqual(taken(self.course.pk, self.term), 3)
+        self.assertEqual(Waitlist.objects.get().length, 0)
+
+    def test_promotion_queries_do_not_grow_with_batch(self):
+        for s in self.students[3:8]:
+            join_waitlist(s, self.course.pk)
+        set_taken(self.course.pk, self.term, 2)
+        with CaptureQueriesContext(connection) as one:
+            promote_waitlists([self.course.pk], self.term.pk)
+        set_taken(self.course.pk, self.term, 0)
+        with CaptureQueriesContext(connection) as three:
+            promote_waitlists([self.course.pk], self.term.pk)
+        self.assertEqual(len(one), len(three))
+        self.assertEqual(Waitlist.objects.get().promoted, 4)
+
+    def test_registration_page_shows_place(self):
+        join_waitlist(self.students[3], self.course.pk)
+        client = Client()
+        client.force_login(self.students[3].user)
+        page = client.get(reverse("registration"))
+        self.assertContains(page, "#1</span> of 1")
+        etag = page["ETag"]
+        join_waitlist(self.students[4], self.course.pk)
+        leave_waitlist(self.students[3], self.course.pk)
+        join_waitlist(self.students[3], self.course.pk)
+        self.assertEqual(client.get(reverse("registration"), HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+# ---- Deleting a student ----
+class DeleteStudentTests(TestCase):
+    """Signals fired by the delete cascade must not write rows for the student being deleted."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Semester.objects.update(is_current=False)
+        cls.term = Semester.objects.create(label="Spring 2094", code=941, season="spring", year=2094, is_current=True)
+        cls.course = Course.objects.create(code="CSE941", title="Course", credit=Decimal("3.0"), capacity=5)
+
+    def make_student(self, username):
+        user = get_user_model().objects.create_user(username, password="pw")
+        student = Student.objects.create(user=user, student_id=username.upper(), full_name=username,
+                                         current_semester=self.term, is_cleared_for_registration=True)
+        return user, student
+
+    def test_delete_user_with_enrollments(self):
+        user, student = self.make_student("del1")
+        with self.captureOnCommitCallbacks(execute=True):
+            enroll(student, self.course.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+        self.assertFalse(Student.objects.filter(pk=student.pk).exists())
+        self.assertFalse(StudentSummary.objects.filter(student_id=student.pk).exists())
+
+    def test_delete_user_with_results(self):
+        user, student = self.make_student("del2")
+        result = SemesterResult.objects.create(student=student, semester=self.term, gpa=Decimal("3.00"))
+        ResultItem.objects.create(result=result, course=self.course, credit=Decimal("3.0"), grade="B",
+                                  grade_point=Decimal("3.00"))
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+        self.assertFalse(Student.objects.filter(pk=student.pk).exists())
+        self.assertFalse(ResultVersion.objects.filter(student_id=student.pk).exists())
+
+    def test_item_signal_uses_loaded_result(self):
+        user, student = self.make_student("del3")
+        result = SemesterResult.objects.create(student=student, semester=self.term, gpa=Decimal("3.00"))
+        item = ResultItem.objects.create(result=result, course=self.course, credit=Decimal("3.0"), grade="B",
+                                         grade_point=Decimal("3.00"))
+        item = ResultItem.objects.select_related("result").get(pk=item.pk)
+        with CaptureQueriesContext(connection) as queries:
+            item.save()
+        # save + version update
+        self.assertEqual(len(queries), 2)
+
+
+# ---- GPA ----
+class GpaTests(TestCase):
+    """Semester GPA and CGPA from a known transcript; every value is an exact half, rounded up."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Semester.objects.update(is_current=False)
+        terms = [Semester.objects.create(label="Spring 2096", code=961, season="spring", year=2096),
+                 Semester.objects.create(label="Fall 2096", code=963, season="fall", year=2096, is_current=True)]
+        user = get_user_model().objects.create_user("gpa1", password="pw")
+        cls.student = Student.objects.create(user=user, student_id="GPA-1", full_name="GPA", current_semester=terms[1])
+        courses = Course.objects.bulk_create([
+            Course(code=f"CSE96{i}", title=f"Course {i}", credit=Decimal("2.0")) for i in range(4)
+        ])
+        # (3.33*2 + 3.00*2) / 4 = 3.165, (3.00*2 + 2.33*2) / 4 = 2.665, 23.32 / 8 = 2.915
+        transcript = [(terms[0], [("B+", "3.33"), ("B", "3.00")]), (terms[1], [("B", "3.00"), ("C+", "2.33")])]
+        cls.results = []
+        for term, grades in transcript:
+            # hand-entered GPA; items এর থেকে নতুন করে হিসাব হওয়ার কথা
+            result = SemesterResult.objects.create(student=cls.student, semester=term, gpa=Decimal("0.00"))
+            for (grade, point), course in zip(grades, courses):
+                ResultItem.objects.create(result=result, course=course, credit=Decimal("2.0"), grade=grade,
+                                          grade_point=Decimal(point))
+            cls.results.append(result)
+
+    def assertTranscript(self):
+        gpas = [SemesterResult.objects.get(pk=r.pk).gpa for r in self.results]
+        self.assertEqual(gpas, [Decimal("3.17"), Decimal("2.67")])
+        summary = StudentSummary.objects.get(student=self.student)
+        self.assertEqual(summary.cgpa, Decimal("2.92"))
+        self.assertEqual(summary.completed_credits, Decimal("8.0"))
+
+    def test_recompute_results(self):
+        self.assertEqual(recompute_results(SemesterResult.objects.filter(student=self.student)), 2)
+        self.assertEqual(recompute_results(SemesterResult.objects.filter(student=self.student)), 0)
+        refresh_summaries([self.student.pk])
+        self.assertTranscript()
+
+    def test_recompute_gpa_command(self):
+        SemesterResult.objects.filter(student=self.student).update(gpa=Decimal("1.00"))
+        StudentSummary.objects.filter(student=self.student).update(cgpa=Decimal("1.00"))
+        call_command("recompute_gpa", workers=1, stdout=StringIO())
+        self.assertTranscript()
+
+    def test_item_writes_recompute_on_commit(self):
+        item = ResultItem.objects.filter(result=self.results[1], grade="C+").get()
+        with self.captureOnCommitCallbacks(execute=True):
+            item.grade, item.grade_point = "B", Decimal("3.00")
+            item.save()
+        self.assertEqual(SemesterResult.objects.get(pk=self.results[1].pk).gpa, Decimal("3.00"))
+        # (12.66 + 12.00) / 8 = 3.0825
+        self.assertEqual(StudentSummary.objects.get(student=self.student).cgpa, Decimal("3.08"))
+
+
+# ---- Advisor assignment ----
+class BalanceTests(SimpleTestCase):
+    """balance() is pure: (students, faculty, lookup) in, changed assignments out."""
+
+    lookup = {"cse": 1, "eee": 2}
+    # CSE: faculty 10, 11; EEE: faculty 20
+    faculty = [(10, 1), (11, 1), (20, 2)]
+
+    def test_new_students_go_to_least_loaded(self):
+        students = [(1, 1, "CSE", 10), (2, 2, "CSE", 10), (3, 3, "cse", None), (4, 4, "EEE", None)]
+        self.assertEqual(balance(students, self.faculty, self.lookup), {3: 11, 4: 20})
+
+    def test_existing_advisors_are_kept(self):
+        # 3 এর advisor অন্য department এর; rebalance ছাড়া তাকেও ছোঁয়া হয় না
+        students = [(1, 1, "CSE", 10), (2, 2, "CSE", 10), (3, 3, "CSE", 20), (4, 4, "Unknown", 11)]
+        self.assertEqual(balance(students, self.faculty, self.lookup), {})
+
+    def test_rebalance_moves_newest_and_other_departments(self):
+        students = [(1, 1, "CSE", 10), (2, 2, "CSE", 10), (3, 3, "CSE", 10), (4, 4, "CSE", 20)]
+        self.assertEqual(balance(students, self.faculty, self.lookup, rebalance=True), {3: 11, 4: 11})
+
+    def test_department_without_faculty_is_unmatched(self):
+        students = [(1, 1, "BBA", None), (2, 2, "", None)]
+        report = AssignmentReport()
+        self.assertEqual(balance(students, self.faculty, dict(self.lookup, bba=3), report=report), {})
+        self.assertEqual(report.unmatched, 2)
+
+
+class AdvisorsPageTests(TestCase):
+    def test_students_cannot_reassign(self):
+        User = get_user_model()
+        user = User.objects.create_user("adv-s", password="pw")
+        Student.objects.create(user=user, student_id="ADV-S", full_name="Student")
+        self.client.force_login(user)
+        self.assertEqual(self.client.post(reverse("advisors"), {"rebalance": "1"}).status_code, 403)
+        self.client.force_login(User.objects.create_user("adv-staff", password="pw", is_staff=True))
+        self.assertEqual(self.client.get(reverse("advisors")).status_code, 200)
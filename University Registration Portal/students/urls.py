@@ -5,6 +5,10 @@ urlpatterns = [
     path('dashboard/', views.dashboard, name='student-dashboard'),
     path('my-courses/', views.my_courses, name='my_courses'),
     path('registration/', views.registration, name='registration'),
+    path('registration/submit/', views.register_course, name='register-course'),
+    path('registration/drop/', views.drop_course, name='drop-course'),
+    path('registration/waitlist/', views.waitlist_join, name='waitlist-join'),
+    path('registration/waitlist/leave/', views.waitlist_leave, name='waitlist-leave'),
     path('result/', views.result, name='result'),
     path('signup/', views.signup, name='signup'),
     path('login/', views.login_view, name='login'),
@@ -1,8 +1,17 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from django.db.models import Sum
+from django.views.decorators.http import require_POST
 from django.utils.timezone import now
-from .models import Student, Course, Enrollment, SemesterResult, ResultItem
+from catalog.models import Course
+from .models import Student, Enrollment, SemesterResult, ResultItem
+from .enrollment import (EnrollmentError, drop, enroll_many, full_course_ids, join_waitlist, leave_waitlist,
+                         waitlist_places)
+from .summary import get_summary
+from .catalog import course_catalog
+from .conditional import conditional_page, registration_state, result_state
+from .semesters import attach_semester, current_term
+from asgiref.sync import sync_to_async
+from registration_portal.aio import gather
 #signup
 from django.contrib.auth import get_user_model
 from django.contrib import messages
@@ -21,7 +30,7 @@ def _ensure_student_for_user(user) -> Student:
         return None
     # already linked?
     if hasattr(user, "student_profile"):
-        return user.student_profile
+        return attach_semester(user.student_profile)
 
     # না থাকলে create (সেন্সিবল ডিফল্টসহ)
     full_name = getattr(user, "get_full_name", None)
@@ -30,14 +39,13 @@ def _ensure_student_for_user(user) -> Student:
         # username কে fallback হিসেবে নিলাম
         full_name = getattr(user, "username", "Student")
 
-    current_year = now().year
     student = Student.objects.create(
         user=user,
         student_id=f"S-{user.pk:06d}",
         full_name=full_name,
         department="Software Engineering",
         batch="39th",
-        current_semester=f"Spring {current_year}",
+        current_semester=current_term(),
         is_cleared_for_registration=False,
     )
     return student
@@ -57,44 +65,74 @@ def dashboard(request):
             "pending_regs": [],
         })
 
-    all_courses = Course.objects.all().order_by("code")
+    catalog = course_catalog()
+
+    # সংখ্যাগুলো denormalized summary থেকে, একটাই primary-key read
+    summary = get_summary(student)
 
     completed_items = ResultItem.objects.select_related("course", "result")\
         .filter(result__student=student)
 
-    completed_credits = completed_items.aggregate(total=Sum("credit"))["total"] or 0
-    total_credits = all_courses.aggregate(total=Sum("credit"))["total"] or 0
-
-    current_sem = student.current_semester or ""
     pending_regs = Enrollment.objects.select_related("course")\
-        .filter(student=student, semester=current_sem, status="pending")
+        .filter(student=student, semester_id=student.current_semester_id, status="pending")
 
     context = {
         "student": student,
-        "total_credits": total_credits,
-        "completed_credits": completed_credits,
-        "pending_count": pending_regs.count(),
-        "all_courses": all_courses,
+        "total_credits": catalog.total_credits,
+        "completed_credits": summary.completed_credits,
+        "pending_count": summary.pending_count,
+        "summary": summary,
+        "all_courses": catalog.courses,
         "completed_items": completed_items,
         "pending_regs": pending_regs,
     }
     return render(request, "students/student_dashboard.html", context)
 
+# ASGI profile (registration_portal.urls_async) এর dashboard: একই context,
+# কিন্তু চারটা read আলাদা thread এ একসাথে চলে
+@login_required
+async def dashboard_async(request):
+    student = await sync_to_async(_ensure_student_for_user)(request.user)
+
+    catalog, summary, completed_items, pending_regs = await gather(
+        course_catalog,
+        lambda: get_summary(student),
+        lambda: list(ResultItem.objects.select_related("course", "result").filter(result__student=student)),
+        lambda: list(Enrollment.objects.select_related("course")
+                     .filter(student=student, semester_id=student.current_semester_id, status="pending")),
+    )
+
+    context = {
+        "student": student,
+        "total_credits": catalog.total_credits,
+        "completed_credits": summary.completed_credits,
+        "pending_count": summary.pending_count,
+        "summary": summary,
+        "all_courses": catalog.courses,
+        "completed_items": completed_items,
+        "pending_regs": pending_regs,
+    }
+    return await sync_to_async(render)(request, "students/student_dashboard.html", context)
+
 @login_required
 def my_courses(request):
     student = _ensure_student_for_user(request.user)
     if student is None:
         return render(request, "students/my_courses.html", {"student": None, "enrollments": []})
 
-    current_sem = student.current_semester or ""
     enrollments = Enrollment.objects.select_related("course")\
-        .filter(student=student, semester=current_sem)\
+        .filter(student=student, semester_id=student.current_semester_id)\
         .order_by("course__code")
 
     context = {"student": student, "enrollments": enrollments}
     return render(request, "students/my_courses.html", context)
 
+# refused cart submit এর course ids (students.enrollment.enroll_many)
+CART_SESSION_KEY = "registration_cart"
+
+
 @login_required
+@conditional_page(registration_state)
 def registration(request):
     student = _ensure_student_for_user(request.user)
     if student is None:
@@ -103,24 +141,93 @@ def registration(request):
             "is_cleared": False,
             "available_courses": [],
             "current_enrollments": [],
+            "waitlist": [],
         })
 
-    current_sem = student.current_semester or ""
     current_enrollments = Enrollment.objects.select_related("course")\
-        .filter(student=student, semester=current_sem)
+        .filter(student=student, semester_id=student.current_semester_id)
 
-    already_course_ids = current_enrollments.values_list("course_id", flat=True)
-    available_courses = Course.objects.exclude(id__in=already_course_ids).order_by("code")
+    # catalog আসে in-process snapshot থেকে, শুধু নিজের enrollments DB থেকে
+    already_course_ids = {e.course_id for e in current_enrollments}
+    available_courses = [c for c in course_catalog().courses if c.id not in already_course_ids]
+    # full হলে refresh না করে waitlist এ দাঁড়ায়, নিজের জায়গা এখানেই দেখে
+    waitlist = waitlist_places(student, student.current_semester_id)
 
     context = {
         "student": student,
         "is_cleared": bool(student.is_cleared_for_registration),
         "available_courses": available_courses,
         "current_enrollments": current_enrollments,
+        "cart": set(request.session.get(CART_SESSION_KEY, [])),
+        "full_ids": full_course_ids(student.current_semester_id),
+        "waitlist": waitlist,
+        "waitlisted_ids": {entry.waitlist.course_id for entry in waitlist},
     }
     return render(request, "students/student_registration.html", context)
 
 @login_required
+@require_POST
+def register_course(request):
+    """Registration cart submit: checked course গুলো একসাথে, এক transaction এ।"""
+    student = _ensure_student_for_user(request.user)
+    course_ids = [int(cid) for cid in request.POST.getlist("course_id") if cid.isdigit()]
+    if student is None:
+        return redirect("registration")
+
+    try:
+        enrollments = enroll_many(student, course_ids)
+    except Course.DoesNotExist:
+        messages.error(request, "Course not found.")
+    except EnrollmentError as e:
+        messages.error(request, str(e))
+    else:
+        request.session.pop(CART_SESSION_KEY, None)
+        codes = ", ".join(e.course.code for e in enrollments)
+        messages.success(request, f"Registration submitted for {codes}.")
+        return redirect("registration")
+    # refused হলে selection টা রেখে দিই, page এ আবার checked দেখাবে
+    request.session[CART_SESSION_KEY] = course_ids
+    return redirect("registration")
+
+@login_required
+@require_POST
+def waitlist_join(request):
+    student = _ensure_student_for_user(request.user)
+    course_id = request.POST.get("waitlist_course") or ""
+    if student is None or not course_id.isdigit():
+        return redirect("registration")
+
+    try:
+        entry = join_waitlist(student, int(course_id))
+    except Course.DoesNotExist:
+        messages.error(request, "Course not found.")
+    except EnrollmentError as e:
+        messages.error(request, str(e))
+    else:
+        messages.success(request, f"You are #{entry.place} on the waitlist. A seat will be registered for you "
+                                  f"automatically when one frees up.")
+    return redirect("registration")
+
+@login_required
+@require_POST
+def waitlist_leave(request):
+    student = _ensure_student_for_user(request.user)
+    course_id = request.POST.get("course_id") or ""
+    if student is not None and course_id.isdigit() and leave_waitlist(student, int(course_id)):
+        messages.success(request, "You left the waitlist.")
+    return redirect("registration")
+
+@login_required
+@require_POST
+def drop_course(request):
+    student = _ensure_student_for_user(request.user)
+    enrollment_id = request.POST.get("enrollment_id") or ""
+    if student is not None and enrollment_id.isdigit() and drop(student, [int(enrollment_id)]):
+        messages.success(request, "Course dropped.")
+    return redirect("registration")
+
+@login_required
+@conditional_page(result_state)
 def result(request):
     student = _ensure_student_for_user(request.user)
     if student is None:
@@ -129,13 +236,14 @@ def result(request):
             "selected_result": None, "items": []
         })
 
-    semesters = list(student.semester_results.values_list("semester", flat=True).order_by("semester"))
+    semesters = list(student.semester_results.values_list("semester__label", flat=True)
+                     .order_by("semester__code", "semester__label"))
     selected_sem = request.GET.get("sem") or (semesters[0] if semesters else None)
 
     selected_result = None
     items = []
     if selected_sem:
-        selected_result = get_object_or_404(SemesterResult, student=student, semester=selected_sem)
+        selected_result = get_object_or_404(SemesterResult, student=student, semester__label=selected_sem)
         items = ResultItem.objects.select_related("course").filter(result=selected_result)
 
     context = {
@@ -186,7 +294,7 @@ def signup(request):
             student_id=student_id,  # Varsity ID as student ID
             department=department,  # Save department
             batch=batch,  # Save batch
-            current_semester="Summer 2025",  # Default semester
+            current_semester=current_term(),  # Default semester
         )
 
         messages.success(request, f"Account created for {user.username}!")
@@ -198,28 +306,13 @@ def signup(request):
 #login view
 def login_view(request):
     if request.method == 'POST':
-        login_id = request.POST.get('login_id')  # This will be either student_id or email
+        login_id = request.POST.get('login_id')  # email, student ID বা username
         password = request.POST.get('password')
 
-        # Check if the input is email or student_id
-        if "@" in login_id:  # If it contains '@', it's an email
-            try:
-                user = User.objects.get(email=login_id)
-            except User.DoesNotExist:
-                messages.error(request, "Invalid credentials. Please try again.")
-                return redirect('login')
-        else:  # Else, it's treated as student_id
-            try:
-                student = Student.objects.get(student_id=login_id)
-                user = student.user  # Get associated user
-            except Student.DoesNotExist:
-                messages.error(request, "Invalid credentials. Please try again.")
-                return redirect('login')
-
-        # Authenticate the user with the found user object
-        user = authenticate(request, username=user.username, password=password)
-        
-        if user is not None:
+        # accounts.backends একটাই query তে user আর student profile খুঁজে আনে
+        user = authenticate(request, username=login_id, password=password)
+
+        if user is not None and getattr(user, 'student_profile', None) is not None:
             login(request, user)  # Successful login
             return redirect('student-dashboard')  # Redirect to student dashboard
         else:
@@ -0,0 +1,12 @@
+// Tailwind v3 config for the prebuilt stylesheet (see `manage.py build_assets`).
+// Only classes that appear in these templates end up in the bundle.
+module.exports = {
+  content: [
+    "./*/templates/**/*.html",
+    "./templates/**/*.html",
+  ],
+  theme: {
+    extend: {},
+  },
+  plugins: [],
+};